@@ -73,6 +73,25 @@ def get_trending_topics(limit: int = Query(20), hours: int = Query(24)):
     return result
 
 
+@router.get("/emerging-topics")
+def get_emerging_topics(
+    limit: int = Query(20),
+    hours: int = Query(6, description="Growth window in hours"),
+    min_count: int = Query(3, description="Minimum items in the window"),
+):
+    """Get topic clusters growing fastest vs the previous window"""
+    cache_key = f"emerging_{limit}_{hours}_{min_count}"
+    cached = cache.get(cache_key)
+    if cached:
+        return cached
+
+    clusters = db.get_emerging_clusters(limit=limit, hours=hours, min_count=min_count)
+
+    result = {"clusters": clusters, "hours": hours}
+    cache.set(cache_key, result, ttl=60)
+    return result
+
+
 @router.get("/sources")
 def get_source_breakdown(hours: int = Query(24)):
     """Get data count by source"""
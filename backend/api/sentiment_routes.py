@@ -1,12 +1,15 @@
 # backend/api/sentiment_routes.py
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from typing import Optional
 
+from compute import compute, InferenceBusy
+
 router = APIRouter(prefix="/api/sentiment", tags=["Sentiment"])
 
 # Will be set from main.py
 analyzer = None
+batcher = None
 
 
 class TextInput(BaseModel):
@@ -18,25 +21,45 @@ class BatchInput(BaseModel):
     texts: list[str]
 
 
+def _busy(e):
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
+
+# Inference endpoints are async: they wait on the inference executor instead
+# of holding a FastAPI threadpool thread that dashboard endpoints need.
+
 @router.post("/analyze")
-def analyze_single(input_data: TextInput):
+async def analyze_single(input_data: TextInput):
     """Analyze sentiment of a single text"""
     if analyzer is None:
         return {"error": "Analyzer not initialized"}
 
-    result = analyzer.analyze(input_data.text, input_data.translate_first)
+    try:
+        with compute.admit():
+            # Concurrent single-text requests are coalesced into one model call
+            if batcher is not None:
+                result = await batcher.analyze_async(input_data.text, input_data.translate_first)
+            else:
+                result = await compute.run_async(analyzer.analyze, input_data.text, input_data.translate_first)
+    except InferenceBusy as e:
+        raise _busy(e)
+
     result["input_text"] = input_data.text
 
     return result
 
 
 @router.post("/analyze-batch")
-def analyze_batch(input_data: BatchInput):
+async def analyze_batch(input_data: BatchInput):
     """Analyze sentiment of multiple texts"""
     if analyzer is None:
         return {"error": "Analyzer not initialized"}
 
-    results = analyzer.analyze_batch(input_data.texts)
+    try:
+        with compute.admit():
+            results = await compute.run_async(analyzer.analyze_batch, input_data.texts)
+    except InferenceBusy as e:
+        raise _busy(e)
 
     summary = {"positive": 0, "negative": 0, "neutral": 0}
     for r in results:
@@ -50,7 +73,7 @@ def analyze_batch(input_data: BatchInput):
 
 
 @router.get("/test")
-def test_sentiment():
+async def test_sentiment():
     """Quick test with sample texts"""
     if analyzer is None:
         return {"error": "Analyzer not initialized"}
@@ -63,10 +86,18 @@ def test_sentiment():
         "सरकार बेकार है"
     ]
 
-    results = []
-    for text in test_texts:
-        r = analyzer.analyze(text)
-        r["input_text"] = text
-        results.append(r)
+    def _run():
+        results = []
+        for text in test_texts:
+            r = analyzer.analyze(text)
+            r["input_text"] = text
+            results.append(r)
+        return results
+
+    try:
+        with compute.admit():
+            results = await compute.run_async(_run)
+    except InferenceBusy as e:
+        raise _busy(e)
 
     return {"results": results}
\ No newline at end of file
@@ -1,6 +1,15 @@
 # backend/cache.py
-"""Simple in-memory TTL cache for dashboard endpoints."""
+"""
+In-memory caches.
+TTLCache backs the dashboard endpoints; LRUCache and PersistentCache back
+model result caches that should survive restarts.
+"""
+import json
+import os
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
 
 
 class TTLCache:
@@ -27,4 +36,183 @@ class TTLCache:
                 del self._cache[k]
 
 
+class LRUCache:
+    """Bounded, thread-safe least-recently-used map"""
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class PersistentCache:
+    """
+    LRU memory tier in front of a SQLite table.
+    Values must be JSON-serializable. If the database cannot be opened the
+    cache keeps working in memory only.
+
+    ttl (seconds) expires entries in both tiers; max_rows caps the table,
+    dropping the oldest rows first. Both are enforced on write.
+    """
+
+    def __init__(self, name, path=None, memory_size=10000, ttl=None, max_rows=None):
+        self.name = name
+        self.ttl = ttl
+        self.max_rows = max_rows
+        # Memory entries are (value, created_at)
+        self.memory = LRUCache(memory_size)
+        self._lock = threading.Lock()
+        self._conn = None
+        self._writes_since_prune = 0
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+        if path:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                self._conn = sqlite3.connect(path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {name} "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                if ttl or max_rows:
+                    self._conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS {name}_created_at ON {name} (created_at)"
+                    )
+                self._conn.commit()
+                self._prune()
+            except Exception as e:
+                print(f"  Cache store '{name}' unavailable, using memory only: {e}")
+                self._conn = None
+
+    def _fresh(self, created_at, now):
+        return not self.ttl or now - created_at < self.ttl
+
+    def get(self, key):
+        return self.get_many([key]).get(key)
+
+    def set(self, key, value):
+        self.set_many({key: value})
+
+    def get_many(self, keys):
+        """
+        Look up keys in memory, then on disk. Returns {key: value} for hits only.
+        Repeated keys are looked up and counted in the stats once.
+        """
+        now = time.time()
+        found = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            entry = self.memory.get(key)
+            if entry is not None and self._fresh(entry[1], now):
+                found[key] = entry[0]
+            else:
+                missing.append(key)
+        memory_hits = len(found)
+        self.memory_hits += memory_hits
+
+        if missing and self._conn is not None:
+            cutoff = now - self.ttl if self.ttl else 0
+            with self._lock:
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i:i + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT key, value, created_at FROM {self.name} "
+                        f"WHERE key IN ({placeholders}) AND created_at >= ?", chunk + [cutoff]
+                    ).fetchall()
+                    for key, raw, created_at in rows:
+                        value = json.loads(raw)
+                        self.memory.set(key, (value, created_at))
+                        found[key] = value
+            disk_hits = len(found) - memory_hits
+            self.disk_hits += disk_hits
+            self.misses += len(missing) - disk_hits
+        else:
+            self.misses += len(missing)
+
+        return found
+
+    def set_many(self, items):
+        now = time.time()
+        for key, value in items.items():
+            self.memory.set(key, (value, now))
+
+        if items and self._conn is not None:
+            rows = [(key, json.dumps(value), now) for key, value in items.items()]
+            with self._lock:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {self.name} (key, value, created_at) VALUES (?, ?, ?)",
+                    rows
+                )
+                self._conn.commit()
+
+            # Prune in batches rather than on every write
+            self._writes_since_prune += len(rows)
+            if self._writes_since_prune >= max(100, (self.max_rows or 0) // 20):
+                self._prune()
+
+    def _prune(self):
+        """Delete expired rows, then the oldest rows beyond max_rows"""
+        if self._conn is None or not (self.ttl or self.max_rows):
+            return
+
+        with self._lock:
+            self._writes_since_prune = 0
+            deleted = 0
+            if self.ttl:
+                deleted += self._conn.execute(
+                    f"DELETE FROM {self.name} WHERE created_at < ?", (time.time() - self.ttl,)
+                ).rowcount
+            if self.max_rows:
+                count = self._conn.execute(f"SELECT COUNT(*) FROM {self.name}").fetchone()[0]
+                if count > self.max_rows:
+                    deleted += self._conn.execute(
+                        f"DELETE FROM {self.name} WHERE key IN "
+                        f"(SELECT key FROM {self.name} ORDER BY created_at LIMIT ?)",
+                        (count - self.max_rows,)
+                    ).rowcount
+            self._conn.commit()
+            self.evicted += deleted
+
+    def stats(self):
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self.memory),
+            "evicted": self.evicted,
+            "persistent": self._conn is not None,
+        }
+
+
 cache = TTLCache()
@@ -0,0 +1,107 @@
+# backend/compute.py
+"""
+Compute budget shared by the API and the models.
+Model calls from SentimentAnalyzer, TopicExtractor and EntityExtractor run on
+one bounded executor with pinned torch / OpenMP thread counts, and inference
+endpoints are admitted against a fixed limit. Dashboard endpoints keep the
+FastAPI threadpool to themselves and never queue behind inference.
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from config import TORCH_NUM_THREADS, INFERENCE_WORKERS, INFERENCE_MAX_PENDING, API_THREADPOOL_SIZE
+
+
+class InferenceBusy(Exception):
+    """Raised when the inference admission limit is reached"""
+
+
+class ComputeBudget:
+    def __init__(self):
+        self.workers = max(1, INFERENCE_WORKERS)
+        self.torch_threads = TORCH_NUM_THREADS or max(1, ((os.cpu_count() or 1) - 1) // self.workers)
+        self.max_pending = INFERENCE_MAX_PENDING
+        self.api_threads = API_THREADPOOL_SIZE
+
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="inference")
+        self._admission = threading.BoundedSemaphore(self.max_pending)
+        self._local = threading.local()
+
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.model_calls = 0
+
+    def configure(self):
+        """Pin math-library thread counts; call before the models are loaded"""
+        for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+            os.environ.setdefault(var, str(self.torch_threads))
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+        try:
+            import torch
+            torch.set_num_threads(self.torch_threads)
+        except Exception:
+            pass
+
+        try:
+            import anyio.to_thread
+            anyio.to_thread.current_default_thread_limiter().total_tokens = self.api_threads
+        except Exception:
+            pass
+
+        print(f"  Compute budget: {self.workers} inference workers x {self.torch_threads} threads, "
+              f"{self.api_threads} API threads")
+
+    def _call(self, fn, args, kwargs):
+        self._local.inside = True
+        self.model_calls += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._local.inside = False
+
+    def run(self, fn, *args, **kwargs):
+        """Run a model call on the inference executor and wait for the result"""
+        # Already on an inference thread (e.g. analyze_batch -> classifier): run inline
+        if getattr(self._local, "inside", False):
+            return fn(*args, **kwargs)
+        return self.executor.submit(self._call, fn, args, kwargs).result()
+
+    async def run_async(self, fn, *args, **kwargs):
+        """Await a model call from an async endpoint without holding an API thread"""
+        return await asyncio.wrap_future(self.executor.submit(self._call, fn, args, kwargs))
+
+    @contextmanager
+    def admit(self):
+        """Admission control for inference endpoints; raises InferenceBusy when full"""
+        if not self._admission.acquire(blocking=False):
+            self.rejected += 1
+            raise InferenceBusy(f"More than {self.max_pending} inference requests in flight")
+
+        self.admitted += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._admission.release()
+
+    def stats(self):
+        return {
+            "inference_workers": self.workers,
+            "torch_threads": self.torch_threads,
+            "api_threads": self.api_threads,
+            "in_flight": self.in_flight,
+            "max_pending": self.max_pending,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "model_calls": self.model_calls,
+            "queued_model_calls": self.executor._work_queue.qsize(),
+        }
+
+
+compute = ComputeBudget()
@@ -22,6 +22,103 @@ MONGODB_URI = os.getenv("MONGODB_URI")
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
+# ── Inference ──
+CACHE_DIR = os.getenv("CACHE_DIR", str(Path(__file__).resolve().parent.parent / ".cache"))
+MODEL_CACHE_DIR = os.getenv("MODEL_CACHE_DIR", os.path.join(CACHE_DIR, "models"))
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", os.path.join(CACHE_DIR, "cache.sqlite3"))
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "torch")  # "torch" | "onnx"
+SENTIMENT_ONNX_QUANTIZE = os.getenv("SENTIMENT_ONNX_QUANTIZE", "true").lower() == "true"
+SENTIMENT_MODEL = os.getenv("SENTIMENT_MODEL", "cardiffnlp/twitter-xlm-roberta-base-sentiment")
+SENTIMENT_MAX_CHARS = int(os.getenv("SENTIMENT_MAX_CHARS", "500"))
+# Group batch texts by token length so short comments are not padded to long posts (opt-in)
+SENTIMENT_BUCKETING = os.getenv("SENTIMENT_BUCKETING", "false").lower() == "true"
+SENTIMENT_MAX_BATCH_TOKENS = int(os.getenv("SENTIMENT_MAX_BATCH_TOKENS", "8192"))
+SENTIMENT_BUCKET_BOUNDARIES = [32, 64, 128, 256, 512]
+# Translate non-English texts to English (batched) before scoring them
+SENTIMENT_TRANSLATE_FIRST = os.getenv("SENTIMENT_TRANSLATE_FIRST", "false").lower() == "true"
+# Result cache keyed by (normalized text hash, model id, truncation length); opt-in
+SENTIMENT_CACHE = os.getenv("SENTIMENT_CACHE", "false").lower() == "true"
+SENTIMENT_CACHE_SIZE = int(os.getenv("SENTIMENT_CACHE_SIZE", "50000"))
+# On-disk rows kept, oldest dropped first (0 = unbounded)
+SENTIMENT_CACHE_MAX_ROWS = int(os.getenv("SENTIMENT_CACHE_MAX_ROWS", "1000000"))
+# Confidence-gated cascade: a lexicon scorer claims clear-cut texts and only
+# texts below the margin reach XLM-R. A small sample is also sent to the model
+# to track agreement.
+SENTIMENT_CASCADE = os.getenv("SENTIMENT_CASCADE", "false").lower() == "true"
+SENTIMENT_CASCADE_MARGIN = float(os.getenv("SENTIMENT_CASCADE_MARGIN", "0.6"))
+SENTIMENT_CASCADE_AUDIT_RATE = float(os.getenv("SENTIMENT_CASCADE_AUDIT_RATE", "0.05"))
+# Translation cache keyed by (text hash, source, target); GoogleTranslator is a
+# network round trip per text, so translations are kept across restarts
+TRANSLATION_CACHE = os.getenv("TRANSLATION_CACHE", "true").lower() == "true"
+TRANSLATION_CACHE_SIZE = int(os.getenv("TRANSLATION_CACHE_SIZE", "20000"))
+TRANSLATION_CACHE_TTL_DAYS = float(os.getenv("TRANSLATION_CACHE_TTL_DAYS", "30"))
+TRANSLATION_CACHE_MAX_ROWS = int(os.getenv("TRANSLATION_CACHE_MAX_ROWS", "500000"))
+# Translation provider guard: concurrent calls, per-call deadline (seconds), and a
+# circuit breaker that opens after N consecutive failures for RESET seconds
+TRANSLATION_MAX_CONCURRENCY = int(os.getenv("TRANSLATION_MAX_CONCURRENCY", "4"))
+TRANSLATION_TIMEOUT = float(os.getenv("TRANSLATION_TIMEOUT", "10"))
+TRANSLATION_BREAKER_FAILURES = int(os.getenv("TRANSLATION_BREAKER_FAILURES", "5"))
+TRANSLATION_BREAKER_RESET = float(os.getenv("TRANSLATION_BREAKER_RESET", "30"))
+# Topic extraction: "translate" (English KeyBERT on translated text),
+# "multilingual" (multilingual embeddings, no translation, topics normalized
+# to the canonical English vocabulary) or "guided" (documents matched
+# against the embedded vocabulary, no candidate n-grams)
+TOPIC_MODE = os.getenv("TOPIC_MODE", "translate")
+TOPIC_MULTILINGUAL_MODEL = os.getenv("TOPIC_MULTILINGUAL_MODEL", "paraphrase-multilingual-MiniLM-L12-v2")
+TOPIC_NORMALIZE_THRESHOLD = float(os.getenv("TOPIC_NORMALIZE_THRESHOLD", "0.6"))
+# Extra canonical topics / aliases (JSON) and the guided-mode similarity cut-off
+TOPIC_VOCAB_FILE = os.getenv("TOPIC_VOCAB_FILE", "")
+TOPIC_GUIDED_THRESHOLD = float(os.getenv("TOPIC_GUIDED_THRESHOLD", "0.35"))
+# Documents per KeyBERT call in extract_topics_batch
+TOPIC_BATCH_SIZE = int(os.getenv("TOPIC_BATCH_SIZE", "64"))
+# Shared sentence-embedding service (topics in multilingual / guided mode,
+# near-duplicate detection). EMBEDDING_STORE keeps a float16 vector on each
+# saved sentiment document.
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", TOPIC_MULTILINGUAL_MODEL)
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "50000"))
+# KeyBERT candidate phrases get their own smaller LRU so they don't evict document vectors
+EMBEDDING_PHRASE_CACHE_SIZE = int(os.getenv("EMBEDDING_PHRASE_CACHE_SIZE", "10000"))
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+EMBEDDING_STORE = os.getenv("EMBEDDING_STORE", "false").lower() == "true"
+# Online topic clustering for emerging-issue detection: items join the nearest
+# cluster at TOPIC_CLUSTER_THRESHOLD cosine similarity or open a new one.
+# MAX_WEIGHT caps a centroid's running-mean weight so long-lived clusters can
+# still drift; HISTORY_HOURS bounds the hourly counts kept per cluster.
+TOPIC_CLUSTERING = os.getenv("TOPIC_CLUSTERING", "false").lower() == "true"
+TOPIC_CLUSTER_THRESHOLD = float(os.getenv("TOPIC_CLUSTER_THRESHOLD", "0.7"))
+TOPIC_CLUSTER_MAX_WEIGHT = int(os.getenv("TOPIC_CLUSTER_MAX_WEIGHT", "500"))
+TOPIC_CLUSTER_MAX_CLUSTERS = int(os.getenv("TOPIC_CLUSTER_MAX_CLUSTERS", "5000"))
+TOPIC_CLUSTER_HISTORY_HOURS = int(os.getenv("TOPIC_CLUSTER_HISTORY_HOURS", "168"))
+# Entity extraction in the pipeline (opt-in) and the nlp.pipe batch size. It runs
+# in-process on the inference executor; only the NER components run. ENTITY_MODE
+# "gazetteer" resolves known politicians / parties / schemes / places from
+# ENTITY_GAZETTEER_FILE and runs spaCy only when asked (use_ner=True).
+ENTITY_EXTRACTION = os.getenv("ENTITY_EXTRACTION", "false").lower() == "true"
+ENTITY_MODE = os.getenv("ENTITY_MODE", "spacy")
+ENTITY_GAZETTEER_FILE = os.getenv(
+    "ENTITY_GAZETTEER_FILE", str(Path(__file__).resolve().parent.parent / "data" / "gazetteer.json")
+)
+ENTITY_CACHE_SIZE = int(os.getenv("ENTITY_CACHE_SIZE", "20000"))
+ENTITY_BATCH_SIZE = int(os.getenv("ENTITY_BATCH_SIZE", "64"))
+# Texts per chunk yielded by SentimentAnalyzer.analyze_stream
+SENTIMENT_STREAM_CHUNK = int(os.getenv("SENTIMENT_STREAM_CHUNK", "256"))
+# Multi-process sharded inference; 1 keeps inference in the server process
+INFERENCE_POOL_SIZE = int(os.getenv("INFERENCE_POOL_SIZE", "1"))
+INFERENCE_POOL_THREADS = int(os.getenv("INFERENCE_POOL_THREADS", "0"))  # 0 = cores / pool size
+INFERENCE_POOL_MIN_BATCH = int(os.getenv("INFERENCE_POOL_MIN_BATCH", "64"))
+# Compute budget: model calls run on INFERENCE_WORKERS threads, each with
+# TORCH_NUM_THREADS intra-op threads (0 = (cores - 1) / workers). API_THREADPOOL_SIZE
+# bounds FastAPI's threadpool for sync endpoints; INFERENCE_MAX_PENDING caps
+# in-flight inference requests before the API answers 503.
+TORCH_NUM_THREADS = int(os.getenv("TORCH_NUM_THREADS", "0"))
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "2"))
+INFERENCE_MAX_PENDING = int(os.getenv("INFERENCE_MAX_PENDING", "64"))
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", "40"))
+# Coalesce concurrent /api/sentiment/analyze requests into one classifier call (opt-in)
+MICROBATCH_ENABLED = os.getenv("MICROBATCH_ENABLED", "false").lower() == "true"
+MICROBATCH_WINDOW_MS = float(os.getenv("MICROBATCH_WINDOW_MS", "10"))
+MICROBATCH_MAX_SIZE = int(os.getenv("MICROBATCH_MAX_SIZE", "32"))
+
 # ── Constants ──
 SUPPORTED_LANGUAGES = [
     "hi",   # Hindi
@@ -59,6 +156,15 @@ POLITICAL_KEYWORDS = [
     "सरकार", "विकास", "भ्रष्टाचार", "चुनाव",
 ]
 
+# Constituency dataset (see geo/constituency_index.py); SAMPLE_CONSTITUENCIES
+# is the fallback when it is missing or empty
+CONSTITUENCY_DATA_FILE = os.getenv(
+    "CONSTITUENCY_DATA_FILE", str(Path(__file__).resolve().parent.parent / "data" / "constituencies.json")
+)
+CONSTITUENCY_GRID_DEGREES = float(os.getenv("CONSTITUENCY_GRID_DEGREES", "1.0"))
+# Booth CSV (id,constituency,name,area[,lat,lng]); demo booths when missing
+BOOTH_DATA_FILE = os.getenv("BOOTH_DATA_FILE", str(Path(__file__).resolve().parent.parent / "data" / "booths.csv"))
+
 SAMPLE_CONSTITUENCIES = [
     {"name": "Varanasi", "state": "Uttar Pradesh", "lat": 25.3176, "lng": 82.9739},
     {"name": "New Delhi", "state": "Delhi", "lat": 28.6139, "lng": 77.2090},
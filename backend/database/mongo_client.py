@@ -1,5 +1,5 @@
 # backend/database/mongo_client.py
-from pymongo import MongoClient, ASCENDING, DESCENDING
+from pymongo import MongoClient, ASCENDING, DESCENDING, UpdateOne
 from datetime import datetime, timedelta
 import certifi
 import ssl
@@ -42,6 +42,7 @@ class Database:
             self.topics = self.db["topics"]
             self.alerts = self.db["alerts"]
             self.constituencies = self.db["constituencies"]
+            self.topic_clusters = self.db["topic_clusters"]
 
             # Create indexes for query performance (idempotent)
             self.sentiments.create_index([("analyzed_at", DESCENDING)])
@@ -51,6 +52,7 @@ class Database:
             self.sentiments.create_index([("language", ASCENDING)])
             self.raw_data.create_index([("processed", ASCENDING)])
             self.alerts.create_index([("triggered_at", DESCENDING)])
+            self.topic_clusters.create_index([("updated_at", DESCENDING)])
 
             # Test connection
             self.client.admin.command("ping")
@@ -74,6 +76,7 @@ class Database:
                 "author": item.get("author", ""),
                 "url": item.get("url", ""),
                 "location": item.get("location", ""),
+                "coordinates": item.get("coordinates"),
                 "language": item.get("language", "unknown"),
                 "metadata": item.get("metadata", {}),
                 "scraped_at": datetime.utcnow(),
@@ -117,6 +120,23 @@ class Database:
         alert_data["acknowledged"] = False
         return self.alerts.insert_one(alert_data)
 
+    def save_topic_clusters(self, clusters):
+        """Upsert changed topic clusters (centroid, counts, label, hourly counts)"""
+        if not clusters:
+            return 0
+        now = datetime.utcnow()
+        ops = []
+        for cluster in clusters:
+            fields = {k: v for k, v in cluster.items() if k not in ("_id", "created_at")}
+            fields["updated_at"] = now
+            ops.append(UpdateOne(
+                {"_id": cluster["_id"]},
+                {"$set": fields, "$setOnInsert": {"created_at": cluster.get("created_at") or now}},
+                upsert=True,
+            ))
+        self.topic_clusters.bulk_write(ops, ordered=False)
+        return len(ops)
+
     # ── READ OPERATIONS ──
 
     def get_unprocessed_data(self, limit=100):
@@ -297,6 +317,20 @@ class Database:
             .limit(limit)
         )
 
+    def load_topic_clusters(self, limit=5000):
+        """Most recently updated topic clusters, with centroids"""
+        return list(self.topic_clusters.find().sort("updated_at", DESCENDING).limit(limit))
+
+    def get_emerging_clusters(self, limit=20, hours=6, min_count=3):
+        """Topic clusters ranked by growth over the last `hours` vs the window before"""
+        from nlp.topic_clusters import growth_rates
+
+        docs = self.topic_clusters.find(
+            {"updated_at": {"$gte": datetime.utcnow() - timedelta(hours=hours)}},
+            {"centroid": 0},
+        )
+        return growth_rates(docs, hours=hours, min_count=min_count)[:limit]
+
     # ── UTILITY ──
 
     def ping(self):
@@ -1,61 +1,71 @@
 # backend/geo/booth_mapper.py
 """
 Maps data to booth-level granularity.
-For hackathon demo: uses simulated booth data.
+Booths come from BOOTH_DATA_FILE (CSV) when present; otherwise the
+simulated demo booths below are used.
 """
-import random
+import os
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import BOOTH_DATA_FILE
+from geo.booth_store import BoothStore
+
+# Sample booths for demo
+DEMO_BOOTHS = {
+    "Varanasi": [
+        {"id": "VNS-001", "name": "Dashashwamedh Ward", "area": "Dashashwamedh Ghat"},
+        {"id": "VNS-002", "name": "Assi Ward", "area": "Assi Ghat"},
+        {"id": "VNS-003", "name": "Sigra Ward", "area": "Sigra"},
+        {"id": "VNS-004", "name": "Lanka Ward", "area": "Lanka BHU"},
+        {"id": "VNS-005", "name": "Cantt Ward", "area": "Cantonment"},
+    ],
+    "New Delhi": [
+        {"id": "DLH-001", "name": "Connaught Place", "area": "CP"},
+        {"id": "DLH-002", "name": "Karol Bagh", "area": "Karol Bagh"},
+        {"id": "DLH-003", "name": "Chandni Chowk", "area": "Old Delhi"},
+        {"id": "DLH-004", "name": "Sarojini Nagar", "area": "South Delhi"},
+        {"id": "DLH-005", "name": "Lajpat Nagar", "area": "South East"},
+    ],
+    "Mumbai North": [
+        {"id": "MUM-001", "name": "Borivali", "area": "Borivali West"},
+        {"id": "MUM-002", "name": "Kandivali", "area": "Kandivali East"},
+        {"id": "MUM-003", "name": "Malad", "area": "Malad West"},
+        {"id": "MUM-004", "name": "Goregaon", "area": "Goregaon East"},
+        {"id": "MUM-005", "name": "Dahisar", "area": "Dahisar"},
+    ],
+}
 
-class BoothMapper:
-    def __init__(self):
-        # Sample booths for demo
-        self.booths = {
-            "Varanasi": [
-                {"id": "VNS-001", "name": "Dashashwamedh Ward", "area": "Dashashwamedh Ghat"},
-                {"id": "VNS-002", "name": "Assi Ward", "area": "Assi Ghat"},
-                {"id": "VNS-003", "name": "Sigra Ward", "area": "Sigra"},
-                {"id": "VNS-004", "name": "Lanka Ward", "area": "Lanka BHU"},
-                {"id": "VNS-005", "name": "Cantt Ward", "area": "Cantonment"},
-            ],
-            "New Delhi": [
-                {"id": "DLH-001", "name": "Connaught Place", "area": "CP"},
-                {"id": "DLH-002", "name": "Karol Bagh", "area": "Karol Bagh"},
-                {"id": "DLH-003", "name": "Chandni Chowk", "area": "Old Delhi"},
-                {"id": "DLH-004", "name": "Sarojini Nagar", "area": "South Delhi"},
-                {"id": "DLH-005", "name": "Lajpat Nagar", "area": "South East"},
-            ],
-            "Mumbai North": [
-                {"id": "MUM-001", "name": "Borivali", "area": "Borivali West"},
-                {"id": "MUM-002", "name": "Kandivali", "area": "Kandivali East"},
-                {"id": "MUM-003", "name": "Malad", "area": "Malad West"},
-                {"id": "MUM-004", "name": "Goregaon", "area": "Goregaon East"},
-                {"id": "MUM-005", "name": "Dahisar", "area": "Dahisar"},
-            ],
-        }
-        print("✅ Booth mapper initialized")
 
-    def assign_booth(self, constituency, text=""):
-        """Assign a booth to data within a constituency"""
-        if constituency in self.booths:
-            # For demo: random booth assignment
-            # In production: use address/location parsing
-            booth = random.choice(self.booths[constituency])
-            return booth["id"]
+class BoothMapper:
+    def __init__(self, path=None):
+        path = path or BOOTH_DATA_FILE
+        self.store = None
+        if path and os.path.exists(path):
+            try:
+                self.store = BoothStore.from_csv(path)
+                print(f"✅ Booth mapper initialized ({len(self.store)} booths from {path})")
+            except Exception as e:
+                print(f"⚠️ Booth data not loaded ({path}): {e}")
+        if self.store is None:
+            self.store = BoothStore.from_records(DEMO_BOOTHS)
+            print("✅ Booth mapper initialized (demo booths)")
 
-        return "unknown"
+    def assign_booth(self, constituency, text="", coordinates=None):
+        """
+        Assign a booth to data within a constituency: nearest booth for
+        geotagged items, else a stable hash of the text, so the same post
+        always lands on the same booth
+        """
+        return self.store.assign(constituency, text, coordinates) or "unknown"
 
     def get_booths(self, constituency):
         """Get all booths for a constituency"""
-        return self.booths.get(constituency, [])
+        return self.store.booths(constituency)
 
     def get_booth_info(self, booth_id):
         """Get booth details by ID"""
-        for constituency, booths in self.booths.items():
-            for booth in booths:
-                if booth["id"] == booth_id:
-                    booth["constituency"] = constituency
-                    return booth
-        return None
+        return self.store.get(booth_id)
 
 
 # Quick test
@@ -69,6 +79,8 @@ if __name__ == "__main__":
     for b in booths:
         print(f"    {b['id']} — {b['name']} ({b['area']})")
 
-    print(f"\n  Random assignment: {mapper.assign_booth('Varanasi')}")
-    print(f"  Random assignment: {mapper.assign_booth('New Delhi')}")
+    print(f"\n  Assignment: {mapper.assign_booth('Varanasi', 'Ghats need cleaning')}")
+    print(f"  Same text:  {mapper.assign_booth('Varanasi', 'Ghats need cleaning')}")
+    print(f"  Assignment: {mapper.assign_booth('New Delhi', 'Traffic near CP')}")
+    print(f"  Booth info: {mapper.get_booth_info('DLH-003')}")
     print(f"  Unknown: {mapper.assign_booth('RandomPlace')}")
\ No newline at end of file
@@ -0,0 +1,202 @@
+# backend/geo/booth_store.py
+"""
+Column-array booth store.
+Booths live in flat numpy columns with no per-booth Python objects: ids and
+names as fixed-width UTF-8 byte strings, areas and constituencies as int
+codes into small category lists, coordinates as float64. Ids are looked up
+in constant time through an open-addressing hash table of int32 rows keyed
+on a 64-bit blake2b digest, and a row permutation grouped by constituency
+makes each constituency's booths one contiguous slice.
+Assignment is deterministic: the nearest booth when the item has
+coordinates, else a stable hash of the text picks a booth within the
+constituency.
+"""
+import csv
+import hashlib
+import math
+
+import numpy as np
+
+
+def _encode(values):
+    return [(v or "").encode("utf-8") for v in values]
+
+
+def _hash64(key):
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def _hash_index(keys):
+    """
+    (digests, table): a uint64 digest per key and a linear-probing table of
+    rows (-1 = empty) at most half full. Rows are placed in rounds, each free
+    slot going to the lowest row that wants it, so the first row wins when
+    ids repeat.
+    """
+    n = len(keys)
+    digests = np.frombuffer(
+        b"".join(hashlib.blake2b(key, digest_size=8).digest() for key in keys), dtype="<u8"
+    ).astype(np.uint64)
+    size = 1 << max(3, (2 * n - 1).bit_length())
+    mask = np.uint64(size - 1)
+    table = np.full(size, -1, dtype=np.int32)
+
+    slots = (digests & mask).astype(np.int64)
+    pending = np.arange(n)
+    while pending.size:
+        wanted, first = np.unique(slots[pending], return_index=True)
+        free = table[wanted] == -1
+        table[wanted[free]] = pending[first[free]]
+        placed = np.zeros(pending.size, dtype=bool)
+        placed[first[free]] = True
+        pending = pending[~placed]
+        slots[pending] = (slots[pending] + 1) & (size - 1)
+    return digests, table
+
+
+def _categorical(values):
+    """(sorted distinct values, int32 code per value)"""
+    categories = sorted(set(values))
+    code_of = {value: code for code, value in enumerate(categories)}
+    return categories, np.array([code_of[v] for v in values], dtype=np.int32)
+
+
+class BoothStore:
+    def __init__(self, ids, constituencies, names, areas, lat=None, lng=None):
+        encoded_ids = _encode(ids)
+        self.ids = np.array(encoded_ids, dtype=bytes)
+        n = len(self.ids)
+        self.names = np.array(_encode(names), dtype=bytes)
+        self.area_names, self.area_codes = _categorical([a or "" for a in areas])
+        self.lat = np.full(n, np.nan) if lat is None else np.asarray(lat, dtype=np.float64)
+        self.lng = np.full(n, np.nan) if lng is None else np.asarray(lng, dtype=np.float64)
+
+        # Constituencies as int codes; one stable argsort groups each one's rows
+        self.constituency_names, self.codes = _categorical(list(constituencies))
+        self.by_constituency = np.argsort(self.codes, kind="stable")
+
+        # id -> row hash index
+        self.id_digests, self.id_table = _hash_index(encoded_ids)
+
+        bounds = np.searchsorted(self.codes[self.by_constituency], np.arange(len(self.constituency_names) + 1))
+        self.ranges = {
+            name: (int(bounds[code]), int(bounds[code + 1]))
+            for code, name in enumerate(self.constituency_names)
+        }
+
+    @classmethod
+    def from_records(cls, booths_by_constituency):
+        """Build from {constituency: [{"id", "name", "area", "lat"?, "lng"?}, ...]}"""
+        rows = [(c, b) for c, booths in booths_by_constituency.items() for b in booths]
+        return cls(
+            [b["id"] for _, b in rows],
+            [c for c, _ in rows],
+            [b.get("name", "") for _, b in rows],
+            [b.get("area", "") for _, b in rows],
+            [b.get("lat", np.nan) for _, b in rows],
+            [b.get("lng", np.nan) for _, b in rows],
+        )
+
+    @classmethod
+    def from_csv(cls, path):
+        """Load a booth CSV (header: id,constituency,name,area[,lat,lng])"""
+        try:
+            import pandas as pd
+            frame = pd.read_csv(path, dtype={"id": str, "constituency": str, "name": str, "area": str})
+            frame[["name", "area"]] = frame.reindex(columns=["name", "area"]).fillna("")
+            lat = frame["lat"].to_numpy(dtype=np.float64) if "lat" in frame else None
+            lng = frame["lng"].to_numpy(dtype=np.float64) if "lng" in frame else None
+            return cls(
+                frame["id"].fillna("").tolist(), frame["constituency"].fillna("").tolist(),
+                frame["name"].tolist(), frame["area"].tolist(), lat, lng,
+            )
+        except ImportError:
+            pass
+
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            rows = list(reader)
+        position = {name: i for i, name in enumerate(header)}
+
+        def column(name):
+            i = position.get(name)
+            return [row[i] for row in rows] if i is not None else [""] * len(rows)
+
+        def floats(name):
+            return np.array([v or "nan" for v in column(name)], dtype=np.float64)
+
+        return cls(
+            column("id"), column("constituency"), column("name"), column("area"),
+            floats("lat"), floats("lng"),
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _id(self, row):
+        return self.ids[row].decode("utf-8")
+
+    def record(self, row):
+        booth = {
+            "id": self._id(row),
+            "name": self.names[row].decode("utf-8"),
+            "area": self.area_names[self.area_codes[row]],
+            "constituency": self.constituency_names[self.codes[row]],
+        }
+        lat, lng = float(self.lat[row]), float(self.lng[row])
+        if not (math.isnan(lat) or math.isnan(lng)):
+            booth["lat"] = lat
+            booth["lng"] = lng
+        return booth
+
+    def row_of(self, booth_id):
+        """Row for a booth id, or None"""
+        if not booth_id:
+            return None
+        key = booth_id.encode("utf-8")
+        digest = _hash64(key)
+        mask = len(self.id_table) - 1
+        slot = digest & mask
+        while True:
+            row = int(self.id_table[slot])
+            if row < 0:
+                return None
+            if int(self.id_digests[row]) == digest and self.ids[row] == key:
+                return row
+            slot = (slot + 1) & mask
+
+    def get(self, booth_id):
+        """Booth by id as a new dict, or None"""
+        row = self.row_of(booth_id)
+        return None if row is None else self.record(row)
+
+    def booths(self, constituency):
+        start, end = self.ranges.get(constituency, (0, 0))
+        return [self.record(int(row)) for row in self.by_constituency[start:end]]
+
+    def count(self, constituency):
+        start, end = self.ranges.get(constituency, (0, 0))
+        return end - start
+
+    def assign(self, constituency, key="", coordinates=None):
+        """
+        Booth id for an item in a constituency, or None if it has no booths.
+        Nearest booth to (lat, lng) when given and the booths have locations;
+        otherwise the same key always lands on the same booth.
+        """
+        start, end = self.ranges.get(constituency, (0, 0))
+        if start == end:
+            return None
+
+        if coordinates:
+            lat, lng = coordinates[0], coordinates[1]
+            rows = self.by_constituency[start:end]
+            # Equirectangular distance is plenty inside one constituency
+            dx = (self.lng[rows] - lng) * math.cos(math.radians(lat))
+            distances = dx * dx + (self.lat[rows] - lat) ** 2
+            if not np.isnan(distances).all():
+                return self._id(rows[int(np.nanargmin(distances))])
+
+        digest = hashlib.blake2b((key or "").encode("utf-8"), digest_size=8).digest()
+        return self._id(self.by_constituency[start + int.from_bytes(digest, "big") % (end - start)])
@@ -0,0 +1,202 @@
+# backend/geo/constituency_index.py
+"""
+Constituency dataset loader and lookup index.
+Reads data/constituencies.json (id, name, state, centroid, aliases and an
+optional polygon per constituency) into column arrays with an alias -> row
+hash index and a uniform lat/lng grid over centroids, so name lookups are
+a dict hit and nearest-constituency queries only look at nearby cells.
+Falls back to SAMPLE_CONSTITUENCIES when the file is missing or empty.
+"""
+import json
+import math
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import SAMPLE_CONSTITUENCIES, CONSTITUENCY_DATA_FILE, CONSTITUENCY_GRID_DEGREES
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def _slug(name):
+    return "-".join(name.lower().split())
+
+
+def _point_in_ring(lat, lng, ring):
+    """Ray casting over a [[lng, lat], ...] ring"""
+    xs, ys = ring[:, 0], ring[:, 1]
+    xs_next, ys_next = np.roll(xs, -1), np.roll(ys, -1)
+    crosses = (ys > lat) != (ys_next > lat)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_at = xs + (lat - ys) * (xs_next - xs) / (ys_next - ys)
+    return bool(np.count_nonzero(crosses & (lng < x_at)) % 2)
+
+
+class ConstituencyIndex:
+    def __init__(self, path=None, grid_degrees=None):
+        self.path = path or CONSTITUENCY_DATA_FILE
+        self.grid_degrees = grid_degrees or CONSTITUENCY_GRID_DEGREES
+        self.version = None
+
+        records = self._read(self.path)
+        if not records:
+            self.version = "sample"
+            records = [dict(c, id=_slug(c["name"])) for c in SAMPLE_CONSTITUENCIES]
+
+        # Columns, one row per constituency
+        self.ids = [r["id"] for r in records]
+        self.names = [r["name"] for r in records]
+        self.states = [r.get("state", "") for r in records]
+        self.lat = np.array([r["lat"] for r in records], dtype=np.float64)
+        self.lng = np.array([r["lng"] for r in records], dtype=np.float64)
+        self.aliases = [r.get("aliases", []) for r in records]
+        self.polygons = {
+            row: np.asarray(r["polygon"], dtype=np.float64)
+            for row, r in enumerate(records) if r.get("polygon")
+        }
+
+        self.id_to_row = {cid: row for row, cid in enumerate(self.ids)}
+        self.alias_to_row = {}
+        for row in range(len(records)):
+            for alias in [self.names[row], self.ids[row]] + self.aliases[row]:
+                self.alias_to_row.setdefault(alias.lower().strip(), row)
+
+        self._build_grid()
+        print(f"  Constituency index: {len(self)} constituencies "
+              f"(v{self.version}, {len(self.polygons)} polygons, {len(self._grid)} grid cells)")
+
+    def _read(self, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"  Constituency data not loaded ({path}): {e}; using sample constituencies")
+            return []
+
+        if isinstance(data, list):
+            data = {"constituencies": data}
+        self.version = data.get("version")
+        records = []
+        for entry in data.get("constituencies", []):
+            if entry.get("name") is None or entry.get("lat") is None or entry.get("lng") is None:
+                continue
+            if not entry.get("id"):
+                entry["id"] = _slug(entry["name"])
+            records.append(entry)
+        return records
+
+    def __len__(self):
+        return len(self.ids)
+
+    # ── Grid ──
+
+    def _cell(self, lat, lng):
+        return int(math.floor(lat / self.grid_degrees)), int(math.floor(lng / self.grid_degrees))
+
+    def _build_grid(self):
+        cells = {}
+        rows_lat = np.floor(self.lat / self.grid_degrees).astype(int)
+        rows_lng = np.floor(self.lng / self.grid_degrees).astype(int)
+        for row, cell in enumerate(zip(rows_lat.tolist(), rows_lng.tolist())):
+            cells.setdefault(cell, []).append(row)
+        self._grid = {cell: np.array(rows) for cell, rows in cells.items()}
+        if cells:
+            lat_cells = [c[0] for c in cells]
+            lng_cells = [c[1] for c in cells]
+            self._max_ring = max(max(lat_cells) - min(lat_cells), max(lng_cells) - min(lng_cells)) + 1
+        else:
+            self._max_ring = 0
+
+    def _distances_km(self, lat, lng, rows):
+        """Haversine distance from (lat, lng) to the given rows' centroids"""
+        lat1, lng1 = math.radians(lat), math.radians(lng)
+        lat2, lng2 = np.radians(self.lat[rows]), np.radians(self.lng[rows])
+        a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+    def _candidates(self, lat, lng, k=1):
+        """Rows in growing rings of grid cells until the k nearest are certain"""
+        center_lat, center_lng = self._cell(lat, lng)
+        # Lower bound on a cell's width (longitude degrees shrink away from the equator)
+        widest_lat = min(abs(lat) + self.grid_degrees, 89.0)
+        cell_km = self.grid_degrees * 111.32 * max(math.cos(math.radians(widest_lat)), 0.01)
+        rows = []
+        for ring in range(self._max_ring + 1):
+            for dlat in range(-ring, ring + 1):
+                for dlng in range(-ring, ring + 1):
+                    if max(abs(dlat), abs(dlng)) != ring:
+                        continue
+                    cell_rows = self._grid.get((center_lat + dlat, center_lng + dlng))
+                    if cell_rows is not None:
+                        rows.append(cell_rows)
+            if rows and sum(len(r) for r in rows) >= k:
+                found = np.concatenate(rows)
+                distances = self._distances_km(lat, lng, found)
+                # Anything outside the searched rings is at least ring * cell_km away
+                if np.sort(distances)[min(k, len(found)) - 1] <= ring * cell_km:
+                    return found, distances
+        if not rows:
+            return np.array([], dtype=int), np.array([])
+        found = np.concatenate(rows)
+        return found, self._distances_km(lat, lng, found)
+
+    # ── Lookups ──
+
+    def get(self, name_or_alias):
+        """Row record for a constituency name, id or alias, or None"""
+        row = self.alias_to_row.get((name_or_alias or "").lower().strip())
+        return None if row is None else self.record(row)
+
+    def record(self, row):
+        return {
+            "id": self.ids[row],
+            "name": self.names[row],
+            "state": self.states[row],
+            "lat": float(self.lat[row]),
+            "lng": float(self.lng[row]),
+        }
+
+    def records(self):
+        return [self.record(row) for row in range(len(self))]
+
+    def nearest(self, lat, lng, k=1):
+        """The k nearest constituencies by centroid as (record, distance_km)"""
+        if not len(self):
+            return []
+        rows, distances = self._candidates(lat, lng, k)
+        order = np.argsort(distances)[:k]
+        return [(self.record(int(rows[i])), round(float(distances[i]), 2)) for i in order]
+
+    def locate(self, lat, lng, max_km=None):
+        """
+        Constituency for a coordinate: the polygon containing it among the
+        nearest candidates when polygons are loaded, else the nearest
+        centroid (within max_km, if given). Returns a record or None.
+        """
+        if not len(self):
+            return None
+        if self.polygons:
+            rows, distances = self._candidates(lat, lng, k=8)
+            for i in np.argsort(distances)[:8]:
+                row = int(rows[i])
+                if row in self.polygons and _point_in_ring(lat, lng, self.polygons[row]):
+                    return self.record(row)
+
+        match = self.nearest(lat, lng)
+        if not match or (max_km is not None and match[0][1] > max_km):
+            return None
+        return match[0][0]
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    index = ConstituencyIndex()
+    print(f"  Loaded in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    print(f"\n  get('banaras') -> {index.get('banaras')}")
+    for lat, lng in [(25.32, 83.01), (28.5, 77.3), (12.97, 77.59), (22.57, 88.36)]:
+        print(f"  nearest({lat}, {lng}) -> {index.nearest(lat, lng, k=2)}")
@@ -1,14 +1,20 @@
 # backend/geo/constituency_mapper.py
+import re
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import SAMPLE_CONSTITUENCIES
+from geo.constituency_index import ConstituencyIndex
+from nlp.keyword_matcher import KeywordMatcher
+
+# Match tiers: a specific place beats a state, which beats national politics
+PLACE, STATE, NATIONAL, GENERAL = 3, 2, 1, 0
 
 
 class ConstituencyMapper:
-    def __init__(self):
-        self.constituencies = SAMPLE_CONSTITUENCIES
+    def __init__(self, index=None):
+        self.index = index or ConstituencyIndex()
+        self.constituencies = self.index.records()
 
         # Expanded keyword mapping — more words = better matching
         self.keyword_map = {
@@ -57,7 +63,7 @@ class ConstituencyMapper:
             "telangana": "Hyderabad", "तेलंगाना": "Hyderabad",
 
             # General political keywords → map to Delhi (national politics)
-            "modi": "New Delhi", "pm modi": "New Delhi",
+            "modi": "New Delhi", "pm modi": "New Delhi", "मोदी": "New Delhi",
             "prime minister": "New Delhi", "प्रधानमंत्री": "New Delhi",
             "bjp headquarters": "New Delhi", "congress headquarters": "New Delhi",
 
@@ -69,43 +75,159 @@ class ConstituencyMapper:
             "punjab": "New Delhi", "haryana": "New Delhi",
         }
 
+        # Keys that map a whole state or national politics rather than a place
+        self.state_keywords = {
+            "tamil nadu", "तमिलनाडु", "bengal", "बंगाल", "bihar", "बिहार",
+            "gujarat", "गुजरात", "karnataka", "telangana", "तेलंगाना",
+            "uttar pradesh", "up", "उत्तर प्रदेश", "maharashtra", "महाराष्ट्र",
+            "rajasthan", "madhya pradesh", "punjab", "haryana",
+        }
+        self.national_keywords = {
+            "parliament", "lok sabha", "rajya sabha", "संसद",
+            "modi", "pm modi", "मोदी", "prime minister", "प्रधानमंत्री",
+            "bjp headquarters", "congress headquarters",
+        }
+        # If text mentions "india" or "government" in general, map to Delhi
+        self.general_national = ["india", "bharat", "भारत", "national", "country",
+                                 "desh", "देश", "sarkar", "सरकार", "government"]
+        # Short keys that are also common words; they only count as written ("UP", not "fed up")
+        self.case_sensitive = {"up": "UP"}
+
+        # Every dataset constituency is matchable by its name and aliases
+        for row, name in enumerate(self.index.names):
+            for alias in [name] + self.index.aliases[row]:
+                self.keyword_map.setdefault(alias.lower().strip(), name)
+
+        self._compile()
         print("✅ Constituency mapper initialized")
 
+    def _compile(self):
+        """
+        Build the word-boundary matcher over every keyword; call again after
+        editing the maps. The matcher fixes substring hits ("up" in "supply",
+        "bengal" in "Bengaluru"); at the built-in ~93 keywords it is slower
+        than the old substring loop (~0.3x) and only wins at a few hundred
+        (scripts/bench_constituency_map.py).
+        """
+        self._targets = {}
+        for word in self.general_national:
+            self._targets[word] = ("New Delhi", GENERAL)
+        for keyword, constituency in self.keyword_map.items():
+            if keyword in self.national_keywords:
+                tier = NATIONAL
+            elif keyword in self.state_keywords:
+                tier = STATE
+            else:
+                tier = PLACE
+            self._targets[keyword] = (constituency, tier)
+        self.matcher = KeywordMatcher(list(self._targets))
+        self._exact = {
+            keyword: re.compile(rf"(?<!\w){re.escape(written)}(?!\w)")
+            for keyword, written in self.case_sensitive.items()
+        }
+        self._exact_tokens = {
+            keyword: KeywordMatcher.written_tokens(written)
+            for keyword, written in self.case_sensitive.items()
+        }
+
+    def _hits(self, text, location, offsets):
+        """(constituency, tier, from_location, start, end, keyword) per non-overlapping hit"""
+        hits = []
+        for from_location, part in ((False, text), (True, location)):
+            if not part:
+                continue
+            found = self.matcher.find_all(part) if offsets else self.matcher.find_tokens(part)
+            if len(found) > 1:
+                found = KeywordMatcher.longest(found)
+            written = None
+            for start, end, keyword in found:
+                # Case-sensitive keys must be written exactly at this hit, not just somewhere in the text
+                if keyword in self._exact:
+                    if offsets:
+                        if not self._exact[keyword].fullmatch(part, start, end):
+                            continue
+                    else:
+                        if written is None:
+                            written = KeywordMatcher.written_tokens(part)
+                        if written[start:end] != self._exact_tokens[keyword]:
+                            continue
+                constituency, tier = self._targets[keyword]
+                hits.append((constituency, tier, from_location, start, end, keyword))
+        return hits
+
+    def find_hits(self, text, location=""):
+        """All keyword hits with constituency, tier, source and character offsets"""
+        return [
+            {
+                "keyword": keyword,
+                "constituency": constituency,
+                "tier": tier,
+                "source": "location" if from_location else "text",
+                "start": start,
+                "end": end,
+            }
+            for constituency, tier, from_location, start, end, keyword in self._hits(text, location, offsets=True)
+        ]
+
+    @staticmethod
+    def _score(hits):
+        """
+        The most specific tier wins; then a match in the user's location over
+        one in the text, then more hits at that tier, then the earliest mention
+        """
+        best = {}
+        for constituency, tier, from_location, start, _, _ in hits:
+            score = best.get(constituency)
+            if score is None or tier > score[0]:
+                best[constituency] = [tier, from_location, 1, -start]
+            elif tier == score[0]:
+                score[1] = score[1] or from_location
+                score[2] += 1
+        return max(best, key=best.get) if best else "unknown"
+
     def map_text_to_constituency(self, text, location=""):
-        """Map text to constituency — improved matching"""
+        """Map text to constituency — word-boundary keyword hits, most specific wins"""
         if not text and not location:
             return "unknown"
+        return self._score(self._hits(text or "", location or "", offsets=False))
 
-        combined = f"{text} {location}".lower()
-
-        # Check for exact keyword matches
-        for keyword, constituency in self.keyword_map.items():
-            if keyword in combined:
-                return constituency
-
-        # Check for partial state/city matches
-        # If text mentions "india" or "government" in general, map to Delhi
-        general_national = ["india", "bharat", "भारत", "national", "country",
-                           "desh", "देश", "sarkar", "सरकार", "government"]
-        for word in general_national:
-            if word in combined:
-                return "New Delhi"
+    def map_location(self, lat, lng, max_km=None):
+        """Constituency for a geotag (polygon, else nearest centroid)"""
+        record = self.index.locate(lat, lng, max_km=max_km)
+        return record["name"] if record else "unknown"
 
-        return "unknown"
+    def map_texts(self, texts, locations=None, coordinates=None):
+        """
+        Constituency per text; a (lat, lng) geotag wins over text matching.
+        Repeated (text, location) pairs are scored once.
+        """
+        locations = locations or [""] * len(texts)
+        coordinates = coordinates or [None] * len(texts)
+        results = {}
+        mapped = []
+        for text, location, coords in zip(texts, locations, coordinates):
+            if coords:
+                mapped.append(self.map_location(coords[0], coords[1]))
+                continue
+            key = (text, location)
+            if key not in results:
+                results[key] = self.map_text_to_constituency(text, location)
+            mapped.append(results[key])
+        return mapped
 
     def map_batch(self, items):
         """Map multiple items to constituencies"""
-        for item in items:
-            text = item.get("text", "")
-            location = item.get("location", "")
-            item["constituency"] = self.map_text_to_constituency(text, location)
+        mapped = self.map_texts(
+            [item.get("text", "") for item in items],
+            [item.get("location", "") for item in items],
+            [item.get("coordinates") for item in items],
+        )
+        for item, constituency in zip(items, mapped):
+            item["constituency"] = constituency
         return items
 
     def get_constituency_info(self, name):
-        for c in self.constituencies:
-            if c["name"].lower() == name.lower():
-                return c
-        return None
+        return self.index.get(name)
 
     def get_all_constituencies(self):
         return self.constituencies
@@ -129,6 +251,8 @@ if __name__ == "__main__":
         "सरकार बिल्कुल बेकार है",
         "Gujarat development model is working",
         "Random comment about nothing specific",
+        "Fed up with the water supply, Modi should visit Patna",
+        "UP elections: Lucknow rally today",
     ]
 
     print("\n📍 Constituency Mapping Tests:\n")
@@ -6,13 +6,14 @@ India Innovates 2026
 import os
 import re
 from fastapi import FastAPI, BackgroundTasks
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from config import validate_config
+from config import validate_config, EMBEDDING_STORE, TOPIC_CLUSTERING, ENTITY_EXTRACTION
 
 
 def _strip_html(text: str) -> str:
@@ -51,19 +52,25 @@ async def lifespan(app: FastAPI):
 
     validate_config()
 
-    print("\n  Loading all services (one-time)...")
+    # Pin torch / OpenMP threads and size the API threadpool before models load
+    from compute import compute
+    compute.configure()
+
+    print("\n  Loading services (one-time, in parallel)...")
     from services import Services
     Services.initialize()
 
     # Share analyzer with sentiment_routes for backward compatibility
     from api import sentiment_routes
     sentiment_routes.analyzer = Services.analyzer
+    sentiment_routes.batcher = Services.batcher
 
     print("\n  Server ready! Open http://localhost:8000\n")
 
     yield
 
     print("\n  Shutting down...")
+    Services.shutdown()
     _alert_executor.shutdown(wait=False)
 
 
@@ -120,14 +127,131 @@ def health():
     }
 
 
+@app.get("/ready")
+def ready():
+    """Readiness probe — 200 once the sentiment path can serve traffic"""
+    from services import Services
+    readiness = Services.readiness()
+    return JSONResponse(readiness, status_code=200 if readiness["ready"] else 503)
+
+
+@app.get("/metrics")
+def metrics():
+    """Inference and cache counters for the shared services"""
+    from services import Services
+    return Services.metrics()
+
+
 # -- PIPELINE ENDPOINTS (using shared Services) --
 
+def _analyze_and_store(raw_items, source=None, assign_booths=True):
+    """
+    Stream scraped items through sentiment analysis. Each chunk is enriched
+    (topics, constituency, booth) and saved while the next chunk is still on
+    the model. Returns (analyzed, saved, constituency_counts).
+    """
+    from services import Services
+    from database.mongo_client import db
+
+    items = [item for item in raw_items if item.get("text")]
+    texts = [_strip_html(item["text"]) for item in items]
+
+    languages = Services.translator.detect_languages(texts)
+
+    analyzed_count = 0
+    saved_count = 0
+    constituency_counts = {}
+
+    for results in Services.analyzer.analyze_stream(texts, languages=languages):
+        batch_docs = []
+
+        # One batched translation round trip per chunk for topic extraction
+        chunk_topics = Services.topic_extractor.extract_topics_batch(
+            [r["text"] for r in results], top_n=3, languages=[r["language"] for r in results]
+        )
+
+        # One nlp.pipe pass per chunk, NER components only
+        chunk_entities = [[] for _ in results]
+        if ENTITY_EXTRACTION:
+            try:
+                chunk_entities = Services.entity_extractor.extract_entities_batch([r["text"] for r in results])
+            except Exception as e:
+                print(f"  Entity extraction skipped: {e}")
+
+        # Reuses the vectors topic extraction already computed in embedding-based modes
+        vectors = None
+        if EMBEDDING_STORE:
+            try:
+                vectors = Services.embeddings.encode([r["text"] for r in results])
+            except Exception as e:
+                print(f"  Embeddings skipped: {e}")
+
+        # Same cached vectors again; centroids take one mini-batch update per chunk
+        cluster_ids = None
+        if TOPIC_CLUSTERING:
+            try:
+                cluster_ids = Services.topic_clusters.assign_batch(
+                    [r["text"] for r in results], topics=chunk_topics
+                )
+            except Exception as e:
+                print(f"  Topic clustering skipped: {e}")
+
+        chunk_constituencies = Services.mapper.map_texts(
+            [r["text"] for r in results],
+            [items[r["index"]].get("location", "") for r in results],
+            [items[r["index"]].get("coordinates") for r in results],
+        )
+
+        for result, topics, entities, constituency in zip(
+            results, chunk_topics, chunk_entities, chunk_constituencies
+        ):
+            raw_item = items[result["index"]]
+            language = result["language"]
+
+            if assign_booths and constituency != "unknown":
+                booth = Services.booth_mapper.assign_booth(
+                    constituency, result["text"], raw_item.get("coordinates")
+                )
+            else:
+                booth = "unknown"
+
+            constituency_counts[constituency] = constituency_counts.get(constituency, 0) + 1
+
+            batch_docs.append({
+                "text": result["text"],
+                "source": source or raw_item.get("source", "unknown"),
+                "sentiment": result["sentiment"],
+                "confidence": result["confidence"],
+                "scores": result.get("scores", {}),
+                "language": language,
+                "topics": topics,
+                "entities": entities,
+                "constituency": constituency,
+                "booth": booth,
+                "analyzed_at": datetime.utcnow()
+            })
+            if vectors is not None:
+                batch_docs[-1]["embedding"] = Services.embeddings.to_bytes(vectors[len(batch_docs) - 1])
+            if cluster_ids is not None:
+                batch_docs[-1]["topic_cluster"] = cluster_ids[len(batch_docs) - 1]
+
+        # One batch insert per chunk instead of N individual inserts
+        db.save_sentiments_batch(batch_docs)
+        if cluster_ids is not None:
+            db.save_topic_clusters(Services.topic_clusters.dirty_documents())
+        analyzed_count += len(results)
+        saved_count += len(batch_docs)
+
+    return analyzed_count, saved_count, constituency_counts
+
+
 def _run_pipeline_sync(keyword_list):
     """Run the full pipeline using shared service instances."""
     from services import Services
     from database.mongo_client import db
     from cache import cache
 
+    Services.wait_for("scraper_manager", "topic_extractor", "mapper", "booth_mapper")
     raw_data, scrape_stats = Services.scraper_manager.scrape_all(keywords=keyword_list)
 
     if not raw_data:
@@ -135,46 +259,7 @@ def _run_pipeline_sync(keyword_list):
 
     db.save_raw_data("mixed", raw_data)
 
-    texts = [_strip_html(item["text"]) for item in raw_data if item.get("text")]
-
-    # Pre-detect languages once for all texts
-    languages = [Services.translator.detect_language(t) for t in texts]
-
-    sentiment_results = Services.analyzer.analyze_batch(texts, languages=languages)
-
-    # Batch build documents
-    batch_docs = []
-    constituency_counts = {}
-
-    for i, result in enumerate(sentiment_results):
-        raw_item = raw_data[i] if i < len(raw_data) else {}
-        language = result.get("language", languages[i] if i < len(languages) else "unknown")
-
-        topics = Services.topic_extractor.extract_topics(result["text"], top_n=3, language=language)
-        constituency = Services.mapper.map_text_to_constituency(
-            result["text"], raw_item.get("location", "")
-        )
-        booth = Services.booth_mapper.assign_booth(constituency) if constituency != "unknown" else "unknown"
-
-        constituency_counts[constituency] = constituency_counts.get(constituency, 0) + 1
-
-        batch_docs.append({
-            "text": result["text"],
-            "source": raw_item.get("source", "unknown"),
-            "sentiment": result["sentiment"],
-            "confidence": result["confidence"],
-            "scores": result.get("scores", {}),
-            "language": language,
-            "topics": topics,
-            "entities": [],
-            "constituency": constituency,
-            "booth": booth,
-            "analyzed_at": datetime.utcnow()
-        })
-
-    # Single batch insert instead of N individual inserts
-    db.save_sentiments_batch(batch_docs)
-    saved_count = len(batch_docs)
+    analyzed_count, saved_count, constituency_counts = _analyze_and_store(raw_data)
 
     # Invalidate dashboard cache after new data
     cache.invalidate()
@@ -236,7 +321,7 @@ def _run_pipeline_sync(keyword_list):
     return {
         "success": True,
         "scraped": len(raw_data),
-        "analyzed": len(sentiment_results),
+        "analyzed": analyzed_count,
         "saved": saved_count,
         "mapped_to_constituency": mapped_count,
         "mapping_percentage": round(mapping_pct, 1),
@@ -264,6 +349,7 @@ def scrape_single_source(source: str = "reddit", keywords: str = "Modi governmen
 
     keyword_list = [k.strip() for k in keywords.split(",")]
 
+    Services.wait_for("scraper_manager", "topic_extractor", "mapper")
     data = Services.scraper_manager.scrape_single_source(source, keywords=keyword_list)
 
     if not data:
@@ -271,34 +357,7 @@ def scrape_single_source(source: str = "reddit", keywords: str = "Modi governmen
 
     db.save_raw_data(source, data)
 
-    texts = [_strip_html(item["text"]) for item in data if item.get("text")]
-    languages = [Services.translator.detect_language(t) for t in texts]
-    results = Services.analyzer.analyze_batch(texts, languages=languages)
-
-    batch_docs = []
-    for i, result in enumerate(results):
-        raw_item = data[i] if i < len(data) else {}
-        language = result.get("language", languages[i] if i < len(languages) else "unknown")
-        topics = Services.topic_extractor.extract_topics(result["text"], top_n=3, language=language)
-        constituency = Services.mapper.map_text_to_constituency(
-            result["text"], raw_item.get("location", "")
-        )
-
-        batch_docs.append({
-            "text": result["text"],
-            "source": source,
-            "sentiment": result["sentiment"],
-            "confidence": result["confidence"],
-            "scores": result.get("scores", {}),
-            "language": language,
-            "topics": topics,
-            "entities": [],
-            "constituency": constituency,
-            "booth": "unknown",
-            "analyzed_at": datetime.utcnow()
-        })
-
-    db.save_sentiments_batch(batch_docs)
+    analyzed_count, saved_count, _ = _analyze_and_store(data, source=source, assign_booths=False)
     cache.invalidate()
 
     summary = db.get_sentiment_summary(hours=1)
@@ -307,8 +366,8 @@ def scrape_single_source(source: str = "reddit", keywords: str = "Modi governmen
         "success": True,
         "source": source,
         "scraped": len(data),
-        "analyzed": len(results),
-        "saved": len(batch_docs),
+        "analyzed": analyzed_count,
+        "saved": saved_count,
         "sentiment_summary": summary
     }
 
@@ -0,0 +1,144 @@
+# backend/nlp/embeddings.py
+"""
+Shared sentence-embedding service.
+One encoder for topic extraction, near-duplicate detection and similarity
+features. Embeddings are computed in batches and kept in an LRU keyed by
+text hash, so each text is encoded once however many features use it.
+Short phrases encoded for KeyBERT (candidate n-grams, vocabulary terms) go
+to a separate, smaller LRU so they can't push document vectors out.
+Vectors can be stored compactly on documents as float16 bytes.
+"""
+import hashlib
+import unicodedata
+
+import numpy as np
+
+from cache import LRUCache
+from compute import compute
+from config import EMBEDDING_MODEL, EMBEDDING_CACHE_SIZE, EMBEDDING_PHRASE_CACHE_SIZE, EMBEDDING_BATCH_SIZE
+
+
+class EmbeddingService:
+    def __init__(self, model_name=None, cache_size=None, batch_size=None, phrase_cache_size=None):
+        self.model_name = model_name or EMBEDDING_MODEL
+        self.batch_size = batch_size or EMBEDDING_BATCH_SIZE
+        self.cache = LRUCache(cache_size or EMBEDDING_CACHE_SIZE)
+        self.phrase_cache = LRUCache(phrase_cache_size or EMBEDDING_PHRASE_CACHE_SIZE)
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            from sentence_transformers import SentenceTransformer
+            self.model = SentenceTransformer(self.model_name)
+            self.dimension = self.model.get_sentence_embedding_dimension()
+            self.working = True
+            print(f"  Embedding service initialized ({self.model_name}, {self.dimension}d)")
+        except Exception as e:
+            print(f"  Embedding model not available: {e}")
+            self.model = None
+            self.dimension = 0
+            self.working = False
+
+    def _key(self, text):
+        normalized = unicodedata.normalize("NFC", " ".join(text.split()))
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def encode(self, texts):
+        """
+        Unit-normalized float32 embeddings, one row per text. Cached texts
+        and repeats inside the list are encoded only once.
+        """
+        return self._encode(texts, self.cache)
+
+    def _encode(self, texts, store):
+        """Look texts up in the document cache, then `store`; new vectors go to `store`"""
+        if not self.working:
+            raise RuntimeError("Embedding model not available")
+
+        keys = [self._key(text) for text in texts]
+        vectors = {}
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key in vectors or key in missing:
+                continue
+            vector = self.cache.get(key)
+            if vector is None and store is not self.cache:
+                vector = store.get(key)
+            if vector is not None:
+                vectors[key] = vector
+            else:
+                missing[key] = text
+        self.hits += len(vectors)
+        self.misses += len(missing)
+
+        if missing:
+            encoded = compute.run(
+                self.model.encode,
+                list(missing.values()),
+                batch_size=self.batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+            for key, vector in zip(missing, np.asarray(encoded, dtype=np.float32)):
+                store.set(key, vector)
+                vectors[key] = vector
+
+        if not keys:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.stack([vectors[key] for key in keys])
+
+    def embed(self, documents, verbose=False):
+        """
+        KeyBERT backend interface. KeyBERT embeds its documents and then every
+        candidate phrase through here; documents already encoded with encode()
+        hit the main cache, everything new is kept in the phrase cache.
+        """
+        return self._encode(list(documents), self.phrase_cache)
+
+    @staticmethod
+    def to_bytes(vector):
+        """Compact float16 encoding for storing a vector on a document"""
+        return np.asarray(vector, dtype=np.float16).tobytes()
+
+    @staticmethod
+    def from_bytes(data):
+        return np.frombuffer(data, dtype=np.float16).astype(np.float32)
+
+    def prime(self, texts, blobs):
+        """Seed the cache with vectors already stored on documents"""
+        for text, blob in zip(texts, blobs):
+            if text and blob:
+                self.cache.set(self._key(text), self.from_bytes(blob))
+
+    def near_duplicates(self, texts, threshold=0.95, block_size=1024):
+        """
+        For each text, the index of an earlier text with cosine similarity of
+        at least `threshold`, or None. Compares in row blocks so memory stays
+        bounded for large lists.
+        """
+        vectors = self.encode(texts)
+        duplicate_of = [None] * len(texts)
+        for start in range(0, len(texts), block_size):
+            block = vectors[start:start + block_size]
+            # Only earlier texts can be the original
+            similarities = block @ vectors[:start + len(block)].T
+            for row in range(len(block)):
+                i = start + row
+                earlier = np.nonzero(similarities[row, :i] >= threshold)[0]
+                if len(earlier):
+                    duplicate_of[i] = int(earlier[0])
+        return duplicate_of
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "model": self.model_name,
+            "working": self.working,
+            "dimension": self.dimension,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "cache_entries": len(self.cache),
+            "phrase_cache_entries": len(self.phrase_cache),
+        }
@@ -2,59 +2,149 @@
 """
 Named Entity Recognition using spaCy.
 Extracts person names, organizations, locations.
+Batches go through nlp.pipe with only the components NER needs enabled.
+
+In "gazetteer" mode, politicians, parties, schemes and places are resolved
+to canonical ids by dictionary lookup first, and spaCy only runs when the
+caller asks for it (use_ner=True). Results are cached per text hash.
 """
+import hashlib
+import threading
 
+from cache import LRUCache
+from compute import compute
+from config import ENTITY_MODE, ENTITY_BATCH_SIZE, ENTITY_CACHE_SIZE
 
-class EntityExtractor:
-    def __init__(self):
-        try:
-            import spacy
-            self.nlp = spacy.load("en_core_web_sm")
-            self.working = True
-            print("✅ Entity extractor initialized (spaCy)")
-        except Exception as e:
-            print(f"⚠️ spaCy not available: {e}")
-            print("   Run: python -m spacy download en_core_web_sm")
-            self.working = False
+ENTITY_TYPES = ("PERSON", "ORG", "GPE", "LOC", "NORP")
+# Not needed for NER; skipping them is most of the per-text cost
+DISABLED_PIPES = ("tagger", "parser", "attribute_ruler", "lemmatizer")
+MAX_CHARS = 1000
 
-    def extract_entities(self, text):
-        """Extract named entities from text"""
-        if not self.working or not text or len(text.strip()) < 5:
-            return []
 
+class EntityExtractor:
+    def __init__(self, mode=None, batch_size=None, gazetteer_path=None):
+        self.mode = mode or ENTITY_MODE
+        self.batch_size = batch_size or ENTITY_BATCH_SIZE
+        self.cache = LRUCache(ENTITY_CACHE_SIZE)
+        self.nlp = None
+        self.gazetteer = None
+        self._spacy_lock = threading.Lock()
+
+        if self.mode == "gazetteer":
+            try:
+                from nlp.gazetteer import Gazetteer
+                self.gazetteer = Gazetteer(gazetteer_path)
+                print(f"✅ Entity extractor initialized (gazetteer v{self.gazetteer.version}, spaCy on request)")
+            except Exception as e:
+                print(f"⚠️ Gazetteer not available: {e}")
+            self.working = self.gazetteer is not None
+        else:
+            self.working = self._load_spacy()
+
+    def _load_spacy(self):
+        """Load spaCy once; in gazetteer mode this happens on the first NER request"""
+        with self._spacy_lock:
+            if self.nlp is not None:
+                return True
+            try:
+                import spacy
+                nlp = spacy.load("en_core_web_sm")
+                nlp.select_pipes(disable=[p for p in DISABLED_PIPES if p in nlp.pipe_names])
+                self.nlp = nlp
+                print(f"✅ Entity extractor initialized (spaCy: {', '.join(nlp.pipe_names)})")
+                return True
+            except Exception as e:
+                print(f"⚠️ spaCy not available: {e}")
+                print("   Run: python -m spacy download en_core_web_sm")
+                return False
+
+    @staticmethod
+    def _entities(doc):
+        """Unique entities of the types we keep, in text order"""
+        # PERSON=person, ORG=organization,
+        # GPE=location, LOC=location, NORP=group
+        seen = set()
+        unique = []
+        for ent in doc.ents:
+            key = (ent.text, ent.label_)
+            if ent.label_ in ENTITY_TYPES and key not in seen:
+                seen.add(key)
+                unique.append({"text": ent.text, "type": ent.label_})
+        return unique
+
+    def _use_ner(self, use_ner):
+        return self.mode != "gazetteer" if use_ner is None else use_ner
+
+    @staticmethod
+    def _key(text, use_ner):
+        return hashlib.sha1(text.encode("utf-8")).hexdigest() + (":ner" if use_ner else "")
+
+    def _ner_batch(self, texts):
+        """spaCy entities for each text, one nlp.pipe pass"""
+        if self.nlp is None and not self._load_spacy():
+            return [[] for _ in texts]
+
+        def _pipe():
+            docs = self.nlp.pipe((text[:MAX_CHARS] for text in texts), batch_size=self.batch_size)
+            return [self._entities(doc) for doc in docs]
+
+        return compute.run(_pipe)
+
+    def _merge(self, gazetteer_entities, ner_entities):
+        """Gazetteer entities first; NER adds only what the gazetteer doesn't know"""
+        merged = list(gazetteer_entities)
+        matched = [e["text"].lower() for e in merged]
+        known = set(matched)
+        for entity in ner_entities:
+            surface = entity["text"].lower()
+            # Skip spans the gazetteer already resolved, or parts of them ("Gandhi" in "Rahul Gandhi")
+            if surface in known or surface in self.gazetteer.alias_to_id or any(surface in m for m in matched):
+                continue
+            known.add(surface)
+            merged.append(entity)
+        return merged
+
+    def extract_entities(self, text, use_ner=None):
+        """Extract named entities from text"""
+        return self.extract_entities_batch([text], use_ner=use_ner)[0]
+
+    def extract_entities_batch(self, texts, use_ner=None):
+        """Extract entities from multiple texts; cached texts are skipped, NER runs as one nlp.pipe pass"""
+        all_entities = [[] for _ in texts]
+        if not self.working:
+            return all_entities
+        use_ner = self._use_ner(use_ner)
+
+        pending = {}  # cache key -> indices of texts still to extract
+        for i, text in enumerate(texts):
+            if not text or len(text.strip()) < 5:
+                continue
+            key = self._key(text, use_ner)
+            cached = self.cache.get(key)
+            if cached is not None:
+                all_entities[i] = list(cached)
+            else:
+                pending.setdefault(key, []).append(i)
+        if not pending:
+            return all_entities
+
+        firsts = [indices[0] for indices in pending.values()]
         try:
-            doc = self.nlp(text[:1000])  # Limit text length
-
-            entities = []
-            for ent in doc.ents:
-                if ent.label_ in ["PERSON", "ORG", "GPE", "LOC", "NORP"]:
-                    entities.append({
-                        "text": ent.text,
-                        "type": ent.label_,
-                        # PERSON=person, ORG=organization, 
-                        # GPE=location, LOC=location, NORP=group
-                    })
-
-            # Remove duplicates
-            seen = set()
-            unique = []
-            for e in entities:
-                key = f"{e['text']}_{e['type']}"
-                if key not in seen:
-                    seen.add(key)
-                    unique.append(e)
-
-            return unique
-
+            if self.gazetteer is not None:
+                results = [self.gazetteer.extract(texts[i]) for i in firsts]
+                if use_ner:
+                    ner = self._ner_batch([texts[i] for i in firsts])
+                    results = [self._merge(g, n) for g, n in zip(results, ner)]
+            else:
+                results = self._ner_batch([texts[i] for i in firsts])
         except Exception as e:
-            return []
-
-    def extract_entities_batch(self, texts):
-        """Extract entities from multiple texts"""
-        all_entities = []
-        for text in texts:
-            entities = self.extract_entities(text)
-            all_entities.append(entities)
+            print(f"⚠️ Batch entity extraction failed: {e}")
+            return all_entities
+
+        for (key, indices), entities in zip(pending.items(), results):
+            self.cache.set(key, entities)
+            for i in indices:
+                all_entities[i] = list(entities)
         return all_entities
 
     def get_entity_names(self, text):
@@ -0,0 +1,104 @@
+# backend/nlp/gazetteer.py
+"""
+Indian political gazetteer: politicians, parties, schemes and places with
+Roman and Devanagari aliases, resolved to canonical ids. All aliases are
+compiled into one KeywordMatcher, so lookup costs a single pass over the
+text however large the gazetteer grows.
+"""
+import json
+
+from config import ENTITY_GAZETTEER_FILE
+from nlp.keyword_matcher import KeywordMatcher
+
+
+class Gazetteer:
+    def __init__(self, path=None):
+        self.path = path or ENTITY_GAZETTEER_FILE
+        self.version = None
+        self.entities = {}        # id -> {"id", "name", "category", "type"}
+        self.alias_to_id = {}     # lowercased alias -> id
+        self.case_sensitive = {}  # alias as written -> id
+
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.version = data.get("version")
+
+        duplicates = 0
+        for entry in data.get("entities", []):
+            entity_id = entry["id"]
+            self.entities[entity_id] = {
+                "id": entity_id,
+                "name": entry["name"],
+                "category": entry.get("category"),
+                "type": entry.get("type", "MISC"),
+            }
+            for alias in [entry["name"]] + entry.get("aliases", []):
+                alias = alias.lower().strip()
+                if self.alias_to_id.setdefault(alias, entity_id) != entity_id:
+                    duplicates += 1
+            for alias in entry.get("case_sensitive", []):
+                self.case_sensitive.setdefault(alias, entity_id)
+
+        self.matcher = KeywordMatcher(list(self.alias_to_id) + list(self.case_sensitive))
+        print(f"  Gazetteer v{self.version}: {len(self.entities)} entities, "
+              f"{len(self.matcher)} aliases" + (f" ({duplicates} duplicate aliases ignored)" if duplicates else ""))
+
+    def __len__(self):
+        return len(self.entities)
+
+    def find(self, text):
+        """
+        Gazetteer entities in text as (start, end, entity id), leftmost first;
+        overlapping matches keep the longest ("Rahul Gandhi", not "Gandhi").
+        """
+        candidates = []
+        for start, end, alias in self.matcher.find_all(text):
+            entity_id = self.alias_to_id.get(alias)
+            # Acronyms like "AAP" only count when written exactly
+            exact = self.case_sensitive.get(text[start:end])
+            if exact:
+                entity_id = exact
+            if entity_id:
+                candidates.append((start, -(end - start), end, entity_id))
+
+        hits = []
+        last_end = -1
+        for start, _, end, entity_id in sorted(candidates):
+            if start >= last_end:
+                hits.append((start, end, entity_id))
+                last_end = end
+        return hits
+
+    def extract(self, text):
+        """Unique gazetteer entities in text order, in EntityExtractor's format"""
+        entities = []
+        seen = set()
+        for start, end, entity_id in self.find(text):
+            if entity_id in seen:
+                continue
+            seen.add(entity_id)
+            entity = self.entities[entity_id]
+            entities.append({
+                "text": text[start:end],
+                "type": entity["type"],
+                "id": entity_id,
+                "name": entity["name"],
+                "category": entity["category"],
+            })
+        return entities
+
+
+if __name__ == "__main__":
+    gazetteer = Gazetteer()
+
+    tests = [
+        "Rahul Gandhi and the Congress slammed Modi over Agnipath",
+        "मोदी जी ने वाराणसी में आयुष्मान भारत कार्ड बांटे",
+        "AAP vs BJP in Delhi; aap kaise ho?",
+        "Trinamool Congress wins big in West Bengal",
+    ]
+
+    print("\n  Gazetteer Tests:\n")
+    for text in tests:
+        print(f"  {text}")
+        print(f"  -> {[(e['id'], e['text']) for e in gazetteer.extract(text)]}")
@@ -0,0 +1,120 @@
+# backend/nlp/inference_pool.py
+"""
+Multi-process sharded inference for large sentiment batches.
+Each worker process loads the model once with a pinned thread count; a batch
+is split into length-balanced shards, classified in parallel and merged back
+in input order.
+"""
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config import INFERENCE_POOL_THREADS, INFERENCE_POOL_MIN_BATCH
+
+# Per-process analyzer, set by _init_worker
+_worker_analyzer = None
+
+
+def _init_worker(num_threads, backend):
+    global _worker_analyzer
+
+    # Must be set before torch / onnxruntime create their thread pools
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = str(num_threads)
+
+    try:
+        import torch
+        torch.set_num_threads(num_threads)
+        torch.set_num_interop_threads(1)
+    except Exception:
+        pass
+
+    from nlp.sentiment import SentimentAnalyzer
+    # The parent process owns the result cache
+    _worker_analyzer = SentimentAnalyzer(backend=backend, use_cache=False, num_threads=num_threads)
+
+
+def _ping():
+    return os.getpid()
+
+
+def _run_shard(texts, batch_size, bucket_by_length):
+    return _worker_analyzer._run_model(texts, batch_size, bucket_by_length)
+
+
+class InferencePool:
+    def __init__(self, size, backend=None, threads_per_worker=None, min_batch=None):
+        self.size = size
+        self.backend = backend
+        self.threads = threads_per_worker or INFERENCE_POOL_THREADS or max(1, (os.cpu_count() or 1) // size)
+        self.min_batch = min_batch or INFERENCE_POOL_MIN_BATCH
+        self.executor = None
+
+        self.batches = 0
+        self.texts = 0
+        self.busy_seconds = 0.0
+
+    def start(self):
+        """Spawn the workers and wait until every one has loaded the model"""
+        # spawn, not fork: the parent already holds torch / OpenMP thread state
+        context = multiprocessing.get_context("spawn")
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.size,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.threads, self.backend),
+        )
+
+        print(f"  Starting inference pool ({self.size} workers x {self.threads} threads)...")
+        for future in [self.executor.submit(_ping) for _ in range(self.size)]:
+            future.result()
+        print("  Inference pool ready!")
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+            print("  Inference pool stopped")
+
+    def _shards(self, texts):
+        """Greedy length-balanced split; returns lists of input indices"""
+        shards = [[] for _ in range(min(self.size, len(texts)))]
+        loads = [0] * len(shards)
+        for idx in sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True):
+            target = loads.index(min(loads))
+            shards[target].append(idx)
+            loads[target] += len(texts[idx])
+        return [sorted(shard) for shard in shards if shard]
+
+    def run(self, texts, batch_size=32, bucket_by_length=None):
+        """Raw classifier outputs for texts, in input order"""
+        if self.executor is None:
+            raise RuntimeError("Inference pool not started")
+
+        start = time.perf_counter()
+        shards = self._shards(texts)
+        futures = [
+            self.executor.submit(_run_shard, [texts[i] for i in shard], batch_size, bucket_by_length)
+            for shard in shards
+        ]
+
+        outputs = [None] * len(texts)
+        for shard, future in zip(shards, futures):
+            for i, output in zip(shard, future.result()):
+                outputs[i] = output
+
+        self.batches += 1
+        self.texts += len(texts)
+        self.busy_seconds += time.perf_counter() - start
+        return outputs
+
+    def stats(self):
+        return {
+            "workers": self.size,
+            "threads_per_worker": self.threads,
+            "min_batch": self.min_batch,
+            "batches": self.batches,
+            "texts": self.texts,
+            "texts_per_sec": round(self.texts / self.busy_seconds, 1) if self.busy_seconds else 0.0,
+        }
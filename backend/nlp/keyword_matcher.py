@@ -0,0 +1,204 @@
+# backend/nlp/keyword_matcher.py
+"""
+Multi-keyword matcher with word-boundary semantics.
+Keywords only match whole words: "gas" never matches inside "Vegas", "up"
+never inside "supply". Word tokens include Indic vowel signs, viramas and
+joiners, so Devanagari keywords match whole words too.
+Keywords are compiled once into an Aho-Corasick automaton over word tokens.
+That is for correctness, not speed: at today's vocabularies (~70-100
+keywords) tokenizing in Python costs about as much as a substring loop
+saves, so it runs at 0.3-1.2x a plain `keyword in text` loop. The
+automaton's cost doesn't grow with the vocabulary, so it pulls ahead only at
+a few hundred keywords (see scripts/bench_keyword_match.py).
+"""
+import re
+from collections import deque
+
+# A word (letters, digits, combining marks such as Latin diacritics, Indic
+# matras / viramas and Arabic harakat, and zero-width joiners), or a single
+# punctuation character. Punctuation comes back as an empty token, which
+# never matches and so breaks multi-word keywords; spaces and hyphens don't.
+_TOKEN = re.compile(
+    r"([\w\u0300-\u036F\u0610-\u061A\u064B-\u065F\u0900-\u0DFF\u200C\u200D]+)|[^\s\w\-]"
+)
+
+
+def _tokens(text):
+    return [token for token in _TOKEN.findall(text.lower()) if token]
+
+
+class KeywordMatcher:
+    def __init__(self, keywords):
+        self.keywords = []
+        self._tokens = []
+        self._lengths = []
+
+        # Trie over word tokens: goto[state] = {token: next_state}
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+
+        for keyword in dict.fromkeys(k.lower().strip() for k in keywords if k and k.strip()):
+            tokens = _tokens(keyword)
+            if not tokens:
+                continue
+            state = 0
+            for token in tokens:
+                nxt = self._goto[state].get(token)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[state][token] = nxt
+                state = nxt
+            self._out[state].append(len(self.keywords))
+            self.keywords.append(keyword)
+            self._tokens.append(tokens)
+            self._lengths.append(len(tokens))
+
+        self._build_failure_links()
+
+        # First tokens of all keywords, of multi-word keywords, and single-word keyword ids
+        self._starts = set(self._goto[0])
+        self._multi_starts = {
+            self._tokens[i][0] for i in range(len(self.keywords)) if self._lengths[i] > 1
+        }
+        self._single = {
+            self._tokens[i][0]: i for i in range(len(self.keywords)) if self._lengths[i] == 1
+        }
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # Keywords ending at the fallback state also end here
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def _scan(self, tokens):
+        """Run the automaton over a token list; yields (end token index, keyword indices)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        root = goto[0]
+        state = 0
+        for i, token in enumerate(tokens):
+            if state:
+                while state and token not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(token, 0)
+            else:
+                # Most tokens start no keyword at all
+                state = root.get(token, 0)
+                if not state:
+                    continue
+            if out[state]:
+                yield i, out[state]
+
+    def find_all(self, text):
+        """All keyword occurrences as (start, end, keyword), ordered by end position"""
+        if not text:
+            return []
+
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lowercasing changed offsets (e.g. "İ"); lower per token instead
+            matches = list(_TOKEN.finditer(text))
+            tokens = [m.group(1).lower() if m.group(1) else "" for m in matches]
+        else:
+            matches = list(_TOKEN.finditer(lowered))
+            tokens = [m.group(1) or "" for m in matches]
+
+        hits = []
+        for end, indices in self._scan(tokens):
+            for idx in indices:
+                start = matches[end - self._lengths[idx] + 1].start()
+                hits.append((start, matches[end].end(), self.keywords[idx]))
+        return hits
+
+    def find_tokens(self, text):
+        """
+        Like find_all, but positions are token indices (end exclusive). Skips
+        character offsets, so it is the cheaper call when only order matters.
+        """
+        if not text:
+            return []
+        tokens = _TOKEN.findall(text.lower())
+        if self._starts.isdisjoint(tokens):
+            return []
+        lengths = self._lengths
+        return [
+            (end - lengths[idx] + 1, end + 1, self.keywords[idx])
+            for end, indices in self._scan(tokens)
+            for idx in indices
+        ]
+
+    @staticmethod
+    def written_tokens(text):
+        """Tokens of text in their original case, at the positions find_tokens reports"""
+        return _TOKEN.findall(text) if text else []
+
+    @staticmethod
+    def longest(hits):
+        """Non-overlapping hits from find_all / find_tokens, leftmost first, longest at each start"""
+        kept = []
+        last_end = None
+        for start, end, keyword in sorted(hits, key=lambda h: (h[0], h[0] - h[1])):
+            if last_end is None or start >= last_end:
+                kept.append((start, end, keyword))
+                last_end = end
+        return kept
+
+    def match(self, text, top_n=None):
+        """Distinct keywords found in text, in order of first occurrence"""
+        if not text:
+            return []
+
+        tokens = _TOKEN.findall(text.lower())
+        present = self._starts.intersection(tokens)
+        if not present:
+            return []
+        if present.isdisjoint(self._multi_starts):
+            # Only single-word keywords can match: set lookups, no automaton pass
+            found = [self.keywords[self._single[t]] for t in sorted(present, key=tokens.index)]
+            return found[:top_n] if top_n else found
+
+        lengths = self._lengths
+        starts = []
+        for end, indices in self._scan(tokens):
+            for idx in indices:
+                starts.append((end - lengths[idx] + 1, idx))
+
+        found = []
+        for _, idx in sorted(starts):
+            keyword = self.keywords[idx]
+            if keyword not in found:
+                found.append(keyword)
+        return found[:top_n] if top_n else found
+
+    def match_batch(self, texts, top_n=None):
+        return [self.match(text, top_n) for text in texts]
+
+
+if __name__ == "__main__":
+    matcher = KeywordMatcher(["gas", "water", "water supply", "power", "war", "विकास", "price rise"])
+
+    tests = [
+        "Las Vegas trip while the water supply failed",
+        "Power cuts and the price-rise hurt everyone",
+        "विकास नहीं विकासशील",
+        "No warfare here, just a war of words",
+    ]
+
+    print("\n  Keyword Matcher Tests:\n")
+    for text in tests:
+        print(f"  {text}")
+        print(f"  -> {matcher.find_all(text)}")
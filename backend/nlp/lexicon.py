@@ -0,0 +1,88 @@
+# backend/nlp/lexicon.py
+"""
+Cheap first-stage sentiment scorer for the model cascade.
+Counts polar words from small English / Hinglish / Hindi lexicons and only
+claims texts whose polarity is unambiguous; everything else is left for
+XLM-R.
+"""
+import re
+
+_TOKEN = re.compile(r"[\w\u0900-\u0DFF]+")
+
+POSITIVE_WORDS = {
+    # English
+    "good", "great", "excellent", "amazing", "awesome", "fantastic", "wonderful",
+    "best", "brilliant", "outstanding", "superb", "love", "loved", "proud",
+    "progress", "success", "successful", "happy", "thank", "thanks", "salute",
+    "impressive", "helpful", "improved", "beautiful", "congratulations", "congrats",
+    # Hinglish
+    "accha", "acha", "achha", "badhiya", "shandaar", "zabardast", "mast",
+    "behtareen", "shukriya", "dhanyavaad", "jai", "vikas",
+    # Hindi
+    "अच्छा", "अच्छी", "बढ़िया", "शानदार", "ज़बरदस्त", "जबरदस्त", "बेहतरीन",
+    "धन्यवाद", "शुक्रिया", "सफल", "सफलता", "गर्व", "खुश", "विकास",
+}
+
+NEGATIVE_WORDS = {
+    # English
+    "bad", "terrible", "horrible", "awful", "worst", "useless", "corrupt",
+    "corruption", "pathetic", "disgusting", "hate", "failed", "failure", "fraud",
+    "scam", "shame", "shameful", "disaster", "incompetent", "liar", "liars",
+    "looting", "loot", "worse", "poor", "angry", "sad", "waste", "crisis",
+    # Hinglish
+    "bekar", "bekaar", "bura", "buri", "ganda", "gandi", "bakwas", "bakwaas",
+    "chor", "jhootha", "jhoota", "ghotala", "barbaad", "nikamma", "nakami",
+    # Hindi
+    "बेकार", "बुरा", "बुरी", "गंदा", "बकवास", "चोर", "झूठा", "झूठे", "घोटाला",
+    "भ्रष्ट", "भ्रष्टाचार", "बर्बाद", "निकम्मा", "नाकाम", "शर्म",
+}
+
+# Any negator makes polarity ambiguous ("not good", "acha nahi") — escalate
+NEGATORS = {
+    "not", "no", "never", "nor", "don", "dont", "doesn", "didn", "isn", "wasn",
+    "aren", "won", "cannot", "without",
+    "nahi", "nahin", "nai", "na", "mat",
+    "नहीं", "नही", "ना", "न", "मत",
+}
+
+
+class LexiconScorer:
+    def __init__(self, max_tokens=60):
+        # Long posts mix opinions too often to trust word counts
+        self.max_tokens = max_tokens
+
+    def score(self, text):
+        """
+        Returns (scores, margin). scores mirrors the model's {label: prob}
+        shape; margin in [0, 1) measures how one-sided the polar words are.
+        Returns (None, 0.0) when the lexicon has nothing to say.
+        """
+        tokens = _TOKEN.findall(text.lower())
+        if not tokens or len(tokens) > self.max_tokens:
+            return None, 0.0
+
+        positive = negative = 0
+        for token in tokens:
+            if token in NEGATORS:
+                return None, 0.0
+            if token in POSITIVE_WORDS:
+                positive += 1
+            elif token in NEGATIVE_WORDS:
+                negative += 1
+
+        polar = positive + negative
+        if polar == 0:
+            return None, 0.0
+
+        margin = abs(positive - negative) / (polar + 1)
+        top = "positive" if positive > negative else "negative"
+        other = "negative" if top == "positive" else "positive"
+
+        top_score = round(0.5 + margin / 2, 4)
+        rest = 1.0 - top_score
+        scores = {
+            top: top_score,
+            "neutral": round(rest * 0.6, 4),
+            other: round(rest * 0.4, 4),
+        }
+        return scores, margin
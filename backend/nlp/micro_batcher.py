@@ -0,0 +1,164 @@
+# backend/nlp/micro_batcher.py
+"""
+Request-coalescing micro-batcher in front of the shared SentimentAnalyzer.
+Single-text API calls that arrive within a short window are merged into one
+classifier call; each caller blocks only on its own result.
+"""
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from compute import compute
+from config import MICROBATCH_WINDOW_MS, MICROBATCH_MAX_SIZE
+
+_STOP = object()
+
+
+class MicroBatcher:
+    def __init__(self, analyzer, window_ms=None, max_batch_size=None):
+        self.analyzer = analyzer
+        self.window = (window_ms if window_ms is not None else MICROBATCH_WINDOW_MS) / 1000
+        self.max_batch_size = max_batch_size or MICROBATCH_MAX_SIZE
+
+        self.queue = queue.Queue()
+        self._thread = None
+
+        # Metrics
+        self.requests = 0
+        self.batches = 0
+        self.batched_items = 0
+        self.max_batch_seen = 0
+        self.size_histogram = {"1": 0, "2-4": 0, "5-8": 0, "9-16": 0, "17-32": 0, "33+": 0}
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="sentiment-microbatcher", daemon=True)
+            self._thread.start()
+            print(f"  Micro-batcher started (window {self.window * 1000:.0f}ms, max batch {self.max_batch_size})")
+
+    def stop(self, timeout=5):
+        if self._thread is not None:
+            self.queue.put(_STOP)
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+        # Fail anything still queued so callers don't hang
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                item[1].set_exception(RuntimeError("Micro-batcher stopped"))
+
+    def submit(self, analysis_text):
+        """Queue a prepared text; the Future resolves to its {label: score} dict"""
+        future = Future()
+        self.queue.put((analysis_text, future))
+        self.requests += 1
+        return future
+
+    def analyze(self, text, translate_first=False, language=None):
+        """Same contract as SentimentAnalyzer.analyze"""
+        analysis_text, language = self.analyzer.prepare(text, translate_first, language)
+        if analysis_text is None:
+            return self.analyzer.result_from_scores({}, language)
+
+        if self._thread is None:
+            scores = self.analyzer.classify([analysis_text])[0]
+        else:
+            scores = self.submit(analysis_text).result()
+        return self.analyzer.result_from_scores(scores, language)
+
+    async def analyze_async(self, text, translate_first=False, language=None):
+        """analyze() for async endpoints — waits without holding a thread"""
+        if translate_first:
+            # Translation is a network call; keep it off the event loop
+            analysis_text, language = await asyncio.to_thread(
+                self.analyzer.prepare, text, translate_first, language
+            )
+        else:
+            analysis_text, language = self.analyzer.prepare(text, False, language)
+
+        if analysis_text is None:
+            return self.analyzer.result_from_scores({}, language)
+
+        if self._thread is None:
+            scores = (await compute.run_async(self.analyzer.classify, [analysis_text]))[0]
+        else:
+            scores = await asyncio.wrap_future(self.submit(analysis_text))
+        return self.analyzer.result_from_scores(scores, language)
+
+    def _collect(self, first):
+        """Gather more requests until the window closes or the batch is full"""
+        batch = [first]
+        deadline = time.monotonic() + self.window
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self.queue.put(_STOP)
+                break
+            batch.append(item)
+
+        return batch
+
+    def _loop(self):
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                break
+
+            batch = self._collect(item)
+            self._record(len(batch))
+
+            texts = [text for text, _ in batch]
+            try:
+                # One forward pass for the whole batch; length bucketing would split it again
+                scores = self.analyzer.classify(texts, batch_size=len(texts), bucket_by_length=False)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, scores):
+                future.set_result(result)
+
+    def _record(self, size):
+        self.batches += 1
+        self.batched_items += size
+        self.max_batch_seen = max(self.max_batch_seen, size)
+        if size == 1:
+            bucket = "1"
+        elif size <= 4:
+            bucket = "2-4"
+        elif size <= 8:
+            bucket = "5-8"
+        elif size <= 16:
+            bucket = "9-16"
+        elif size <= 32:
+            bucket = "17-32"
+        else:
+            bucket = "33+"
+        self.size_histogram[bucket] += 1
+
+    def stats(self):
+        return {
+            "running": self._thread is not None,
+            "queue_depth": self.queue.qsize(),
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": round(self.batched_items / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size_seen": self.max_batch_seen,
+            "batch_size_histogram": dict(self.size_histogram),
+            "window_ms": round(self.window * 1000, 1),
+            "max_batch_size": self.max_batch_size,
+        }
@@ -0,0 +1,177 @@
+# backend/nlp/onnx_backend.py
+"""
+ONNX Runtime backend for the sentiment classifier.
+Exports the HuggingFace model to ONNX once, optionally quantizes it to int8,
+and caches the artifact on disk. OnnxSentimentClassifier is a drop-in for the
+parts of the transformers pipeline that SentimentAnalyzer uses.
+"""
+import os
+from pathlib import Path
+
+import numpy as np
+
+
+def _softmax(logits):
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def export_onnx(model_name, cache_dir, quantize=True):
+    """Export model to ONNX (and int8) under cache_dir; returns the artifact path"""
+    model_dir = Path(cache_dir) / model_name.replace("/", "--")
+    fp32_path = model_dir / "model.onnx"
+    int8_path = model_dir / "model.int8.onnx"
+    target = int8_path if quantize else fp32_path
+
+    if target.exists():
+        return target
+
+    model_dir.mkdir(parents=True, exist_ok=True)
+
+    if not fp32_path.exists():
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        print(f"  Exporting {model_name} to ONNX (one-time)...")
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        model.eval()
+
+        sample = tokenizer(["ONNX export sample text"], return_tensors="pt")
+        partial = fp32_path.with_name("model.onnx.partial")
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                (sample["input_ids"], sample["attention_mask"]),
+                str(partial),
+                input_names=["input_ids", "attention_mask"],
+                output_names=["logits"],
+                dynamic_axes={
+                    "input_ids": {0: "batch", 1: "sequence"},
+                    "attention_mask": {0: "batch", 1: "sequence"},
+                    "logits": {0: "batch"},
+                },
+                opset_version=17,
+                dynamo=False,
+            )
+        os.replace(partial, fp32_path)
+
+    if quantize:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+
+        print("  Quantizing ONNX model to int8 (one-time)...")
+        partial = int8_path.with_name("model.int8.onnx.partial")
+        quantize_dynamic(str(fp32_path), str(partial), weight_type=QuantType.QInt8)
+        os.replace(partial, int8_path)
+
+    return target
+
+
+class OnnxSentimentClassifier:
+    def __init__(self, model_name, cache_dir, quantize=True, num_threads=None):
+        import onnxruntime as ort
+        from transformers import AutoConfig, AutoTokenizer
+
+        self.model_name = model_name
+        self.quantize = quantize
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+        config = AutoConfig.from_pretrained(model_name)
+        self.id2label = {int(k): v for k, v in config.id2label.items()}
+
+        self.model_path = export_onnx(model_name, cache_dir, quantize=quantize)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        self.session = ort.InferenceSession(
+            str(self.model_path), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        print(f"  ONNX Runtime session ready ({self.model_path.name})")
+
+    def __call__(self, texts, batch_size=None, truncation=True, max_length=512):
+        """Same output shape as pipeline(..., top_k=None): labels sorted by score"""
+        single = isinstance(texts, str)
+        if single:
+            texts = [texts]
+
+        batch_size = batch_size or len(texts) or 1
+        outputs = []
+
+        for i in range(0, len(texts), batch_size):
+            chunk = texts[i:i + batch_size]
+            encoded = self.tokenizer(
+                chunk, padding=True, truncation=truncation,
+                max_length=max_length, return_tensors="np"
+            )
+            feed = {k: v.astype(np.int64) for k, v in encoded.items() if k in self.input_names}
+            probs = _softmax(self.session.run(None, feed)[0])
+
+            for row in probs:
+                ranked = sorted(enumerate(row), key=lambda x: x[1], reverse=True)
+                outputs.append([
+                    {"label": self.id2label[j], "score": float(p)} for j, p in ranked
+                ])
+
+        return outputs[0] if single else outputs
+
+
+def check_parity(candidate, reference, texts, label_map=None):
+    """
+    Compare two classifiers on the same texts.
+    Returns label agreement and the largest / mean absolute score difference.
+    """
+    label_map = label_map or {}
+
+    def _to_scores(result):
+        if result and isinstance(result[0], list):
+            result = result[0]
+        return {label_map.get(r["label"], r["label"]): r["score"] for r in result}
+
+    cand = [_to_scores(r) for r in candidate(texts, batch_size=len(texts), truncation=True)]
+    ref = [_to_scores(r) for r in reference(texts, batch_size=len(texts), truncation=True)]
+
+    agree = 0
+    diffs = []
+    for c, r in zip(cand, ref):
+        if max(c, key=c.get) == max(r, key=r.get):
+            agree += 1
+        diffs.extend(abs(c[label] - r.get(label, 0.0)) for label in c)
+
+    return {
+        "texts": len(texts),
+        "label_agreement": round(agree / max(len(texts), 1), 4),
+        "max_abs_diff": round(max(diffs), 4) if diffs else 0.0,
+        "mean_abs_diff": round(sum(diffs) / len(diffs), 4) if diffs else 0.0,
+    }
+
+
+# Parity check against the torch pipeline
+if __name__ == "__main__":
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from transformers import pipeline
+    from config import SENTIMENT_MODEL, MODEL_CACHE_DIR, SENTIMENT_ONNX_QUANTIZE
+
+    texts = [
+        "Modi ji has done amazing work for India",
+        "This government is completely useless and corrupt",
+        "The new road construction was inaugurated today",
+        "मोदी जी ने बहुत अच्छा काम किया है",
+        "सरकार बिल्कुल बेकार है",
+        "Sarkar bahut buri hai desh ka kuch nahi ho raha",
+    ]
+
+    onnx_clf = OnnxSentimentClassifier(SENTIMENT_MODEL, MODEL_CACHE_DIR, quantize=SENTIMENT_ONNX_QUANTIZE)
+    torch_clf = pipeline("sentiment-analysis", model=SENTIMENT_MODEL, top_k=None)
+
+    report = check_parity(onnx_clf, torch_clf, texts)
+    print(f"\n  ONNX vs torch parity ({'int8' if SENTIMENT_ONNX_QUANTIZE else 'fp32'}):")
+    for key, value in report.items():
+        print(f"    {key:>16}: {value}")
@@ -4,24 +4,83 @@ Multi-language sentiment analysis using HuggingFace transformers.
 Model: cardiffnlp/twitter-xlm-roberta-base-sentiment
 Supports 100+ languages including Hindi, Tamil, Telugu, Bengali etc.
 """
+import hashlib
+import queue
+import threading
+import time
+import unicodedata
+from itertools import islice
+
 from transformers import pipeline
 
+from cache import PersistentCache
+from compute import compute
+from nlp.lexicon import LexiconScorer
+from config import (
+    CACHE_DB_PATH,
+    MODEL_CACHE_DIR,
+    SENTIMENT_BACKEND,
+    SENTIMENT_ONNX_QUANTIZE,
+    SENTIMENT_MODEL,
+    SENTIMENT_MAX_CHARS,
+    SENTIMENT_BUCKETING,
+    SENTIMENT_MAX_BATCH_TOKENS,
+    SENTIMENT_BUCKET_BOUNDARIES,
+    SENTIMENT_TRANSLATE_FIRST,
+    SENTIMENT_CACHE,
+    SENTIMENT_CACHE_SIZE,
+    SENTIMENT_CACHE_MAX_ROWS,
+    SENTIMENT_STREAM_CHUNK,
+    SENTIMENT_CASCADE,
+    SENTIMENT_CASCADE_MARGIN,
+    SENTIMENT_CASCADE_AUDIT_RATE,
+)
+
 
 class SentimentAnalyzer:
-    def __init__(self, translator=None):
+    def __init__(self, translator=None, bucket_by_length=None, backend=None, use_cache=None,
+                 num_threads=None, cascade=None, translate_first=None):
         print("  Loading sentiment model (first time takes 2-3 min)...")
 
-        self.classifier = pipeline(
-            "sentiment-analysis",
-            model="cardiffnlp/twitter-xlm-roberta-base-sentiment",
-            top_k=None
+        self.model_name = SENTIMENT_MODEL
+        self.max_chars = SENTIMENT_MAX_CHARS
+        self.backend = backend or SENTIMENT_BACKEND
+        self.num_threads = num_threads
+        self.classifier = self._build_classifier()
+
+        # Created on first use so pool workers never build one
+        self._translator = translator
+        self.translate_first = SENTIMENT_TRANSLATE_FIRST if translate_first is None else translate_first
+
+        # Optional multi-process InferencePool, attached by Services
+        self.pool = None
+
+        # Confidence-gated cascade: cheap lexicon first, XLM-R for ambiguous texts
+        use_cascade = SENTIMENT_CASCADE if cascade is None else cascade
+        self.lexicon = LexiconScorer() if use_cascade else None
+        self.cascade_margin = SENTIMENT_CASCADE_MARGIN
+        self.cascade_audit_rate = SENTIMENT_CASCADE_AUDIT_RATE
+        self.cascade_stats = {"lexicon": 0, "escalated": 0, "audited": 0, "agreed": 0}
+
+        # Length-bucketed batching
+        self.bucket_by_length = SENTIMENT_BUCKETING if bucket_by_length is None else bucket_by_length
+        self.max_batch_tokens = SENTIMENT_MAX_BATCH_TOKENS
+        self.bucket_boundaries = sorted(SENTIMENT_BUCKET_BOUNDARIES)
+
+        # Result cache — quantized ONNX scores differ slightly, so the backend is part of the model id
+        self.model_id = f"{self.model_name}:{self.backend}"
+        if self.backend == "onnx" and SENTIMENT_ONNX_QUANTIZE:
+            self.model_id += "-int8"
+        use_cache = SENTIMENT_CACHE if use_cache is None else use_cache
+        self.cache = (
+            PersistentCache(
+                "sentiment", CACHE_DB_PATH,
+                memory_size=SENTIMENT_CACHE_SIZE,
+                max_rows=SENTIMENT_CACHE_MAX_ROWS or None,
+            )
+            if use_cache else None
         )
 
-        if translator is None:
-            from nlp.translator import TranslatorService
-            translator = TranslatorService()
-        self.translator = translator
-
         # Label mapping
         self.label_map = {
             "positive": "positive",
@@ -32,51 +91,81 @@ class SentimentAnalyzer:
             "LABEL_2": "positive"
         }
 
-        print("  Sentiment analyzer ready!")
+        print(f"  Sentiment analyzer ready! (backend: {self.backend})")
 
-    def analyze(self, text, translate_first=False, language=None):
-        """Analyze sentiment of a single text"""
+    @property
+    def translator(self):
+        if self._translator is None:
+            from nlp.translator import TranslatorService
+            self._translator = TranslatorService()
+        return self._translator
+
+    def _build_torch_classifier(self):
+        return pipeline(
+            "sentiment-analysis",
+            model=self.model_name,
+            top_k=None
+        )
+
+    def _build_classifier(self):
+        """Build the configured backend, falling back to torch if ONNX is unavailable"""
+        if self.backend == "onnx":
+            try:
+                from nlp.onnx_backend import OnnxSentimentClassifier
+                return OnnxSentimentClassifier(
+                    self.model_name, MODEL_CACHE_DIR, quantize=SENTIMENT_ONNX_QUANTIZE,
+                    num_threads=self.num_threads
+                )
+            except Exception as e:
+                print(f"  ONNX backend not available: {e}")
+                print("   Falling back to torch pipeline")
+                self.backend = "torch"
+
+        return self._build_torch_classifier()
+
+    def warmup(self):
+        """One single-text and one batched forward pass, bypassing the cache"""
+        start = time.perf_counter()
+        self._run_model(["Warm-up pass for the sentiment model"])
+        self._run_model(["Warm-up pass", "सरकार ने नई योजना शुरू की"], batch_size=2, bucket_by_length=False)
+        print(f"  Sentiment model warmed up ({time.perf_counter() - start:.2f}s)")
+
+    def check_backend_parity(self, texts):
+        """Compare the active backend against the torch pipeline on the given texts"""
+        from nlp.onnx_backend import check_parity
+        return check_parity(self.classifier, self._build_torch_classifier(), texts, self.label_map)
+
+    def _scores(self, result):
+        """Map raw classifier output for one text to {label: score}"""
+        if result and isinstance(result[0], list):
+            result = result[0]
+
+        scores = {}
+        for r in result:
+            label = self.label_map.get(r["label"], r["label"])
+            scores[label] = round(r["score"], 4)
+        return scores
+
+    def prepare(self, text, translate_first=False, language=None):
+        """Detect language, truncate and optionally translate. Returns (analysis_text, language)"""
         if not text or len(text.strip()) < 3:
-            return {
-                "sentiment": "neutral",
-                "confidence": 0.0,
-                "scores": {},
-                "language": "unknown"
-            }
+            return None, "unknown"
 
         # Detect language only if not provided
         if language is None:
             language = self.translator.detect_language(text)
 
         # Truncate for model
-        analysis_text = text[:500]
+        analysis_text = text[:self.max_chars]
 
         # Optionally translate first
         if translate_first and language != "en":
             analysis_text = self.translator.translate_to_english(analysis_text)
 
-        try:
-            results = self.classifier(analysis_text)
-
-            if isinstance(results[0], list):
-                results = results[0]
-
-            scores = {}
-            for r in results:
-                label = self.label_map.get(r["label"], r["label"])
-                scores[label] = round(r["score"], 4)
-
-            top = max(scores, key=scores.get)
+        return analysis_text, language
 
-            return {
-                "sentiment": top,
-                "confidence": scores[top],
-                "scores": scores,
-                "language": language
-            }
-
-        except Exception as e:
-            print(f"  Sentiment error: {e}")
+    def result_from_scores(self, scores, language):
+        if not scores:
             return {
                 "sentiment": "neutral",
                 "confidence": 0.0,
@@ -84,52 +173,133 @@ class SentimentAnalyzer:
                 "language": language
             }
 
-    def analyze_batch(self, texts, batch_size=32, languages=None):
-        """Analyze sentiment of multiple texts efficiently"""
-        results = []
+        top = max(scores, key=scores.get)
+        return {
+            "sentiment": top,
+            "confidence": scores[top],
+            "scores": scores,
+            "language": language
+        }
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-
-            # Clean batch
-            clean_batch = []
-            original_texts = []
-            batch_indices = []
-            for j, t in enumerate(batch):
-                if t and len(t.strip()) > 3:
-                    clean_batch.append(t[:500])
-                    original_texts.append(t)
-                    batch_indices.append(i + j)
-
-            if not clean_batch:
+    def analyze(self, text, translate_first=None, language=None):
+        """Analyze sentiment of a single text"""
+        if translate_first is None:
+            translate_first = self.translate_first
+        analysis_text, language = self.prepare(text, translate_first, language)
+        if analysis_text is None:
+            return self.result_from_scores({}, language)
+
+        return self.result_from_scores(self.classify([analysis_text])[0], language)
+
+    def _cache_key(self, text):
+        """(normalized text hash, model id, truncation length)"""
+        normalized = unicodedata.normalize("NFC", " ".join(text.split()))
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+        return f"{digest}:{self.model_id}:{self.max_chars}"
+
+    def classify(self, texts, batch_size=32, bucket_by_length=None):
+        """
+        Score already-truncated texts. Returns one {label: score} dict per
+        input (None if the model failed on it). Cache hits and repeated texts
+        inside the batch never reach the classifier.
+        """
+        scores = [None] * len(texts)
+        if not texts:
+            return scores
+
+        keys = [self._cache_key(t) for t in texts]
+        if self.cache is not None:
+            cached = self.cache.get_many(keys)
+            for i, key in enumerate(keys):
+                scores[i] = cached.get(key)
+
+        # One model input per distinct key
+        pending = {}
+        for i, key in enumerate(keys):
+            if scores[i] is None:
+                pending.setdefault(key, []).append(i)
+        if not pending:
+            return scores
+
+        # Cascade: the lexicon claims unambiguous texts, the rest escalate to the model
+        audited = {}
+        if self.lexicon is not None:
+            for key in list(pending):
+                lexicon_scores, margin = self.lexicon.score(texts[pending[key][0]])
+                if lexicon_scores is None or margin < self.cascade_margin:
+                    self.cascade_stats["escalated"] += 1
+                    continue
+
+                self.cascade_stats["lexicon"] += 1
+                if int(key[:8], 16) % 10000 < self.cascade_audit_rate * 10000:
+                    # Also run the model so we can track agreement
+                    audited[key] = max(lexicon_scores, key=lexicon_scores.get)
+                    continue
+                for i in pending.pop(key):
+                    scores[i] = lexicon_scores
+
+            if not pending:
+                return scores
+
+        run_keys = list(pending)
+        run_texts = [texts[pending[key][0]] for key in run_keys]
+
+        outputs = None
+        if self.pool is not None and len(run_texts) >= self.pool.min_batch:
+            try:
+                outputs = self.pool.run(run_texts, batch_size, bucket_by_length)
+            except Exception as e:
+                print(f"  Inference pool error, running in-process: {e}")
+        if outputs is None:
+            outputs = self._run_model(run_texts, batch_size, bucket_by_length)
+
+        fresh = {}
+        for key, output in zip(run_keys, outputs):
+            if not isinstance(output, list):
                 continue
+            fresh[key] = self._scores(output)
+            for i in pending[key]:
+                scores[i] = fresh[key]
+
+        if self.cache is not None and fresh:
+            self.cache.set_many(fresh)
+
+        for key, lexicon_label in audited.items():
+            if key in fresh:
+                self.cascade_stats["audited"] += 1
+                if max(fresh[key], key=fresh[key].get) == lexicon_label:
+                    self.cascade_stats["agreed"] += 1
+
+        return scores
 
+    def _run_model(self, texts, batch_size=32, bucket_by_length=None):
+        """Raw classifier outputs for texts, in input order (on the inference executor)"""
+        return compute.run(self._run_model_inline, texts, batch_size, bucket_by_length)
+
+    def _run_model_inline(self, texts, batch_size=32, bucket_by_length=None):
+        if bucket_by_length is None:
+            bucket_by_length = self.bucket_by_length
+
+        if len(texts) == 1:
             try:
-                batch_results = self.classifier(clean_batch)
-
-                for idx, (text, result) in enumerate(zip(original_texts, batch_results)):
-                    if isinstance(result, list):
-                        scores = {}
-                        for r in result:
-                            label = self.label_map.get(r["label"], r["label"])
-                            scores[label] = round(r["score"], 4)
-
-                        top = max(scores, key=scores.get)
-
-                        # Use pre-detected language if available
-                        if languages and batch_indices[idx] < len(languages):
-                            language = languages[batch_indices[idx]]
-                        else:
-                            language = self.translator.detect_language(text)
-
-                        results.append({
-                            "text": text,
-                            "sentiment": top,
-                            "confidence": scores[top],
-                            "scores": scores,
-                            "language": language
-                        })
+                return [self.classifier(texts[0])]
+            except Exception as e:
+                print(f"  Sentiment error: {e}")
+                return [None]
+
+        if bucket_by_length:
+            return self._classify_bucketed(texts)
+        return self._classify_fixed(texts, batch_size)
 
+    def _classify_fixed(self, texts, batch_size):
+        """Run the classifier over fixed-size chunks in arrival order"""
+        outputs = [None] * len(texts)
+
+        for i in range(0, len(texts), batch_size):
+            chunk = texts[i:i + batch_size]
+            try:
+                for j, result in enumerate(self.classifier(chunk, batch_size=len(chunk), truncation=True)):
+                    outputs[i + j] = result
             except Exception as e:
                 print(f"  Batch error: {e}")
                 continue
@@ -137,8 +307,185 @@ class SentimentAnalyzer:
             processed = min(i + batch_size, len(texts))
             print(f"  Processed {processed}/{len(texts)} texts")
 
+        return outputs
+
+    def _classify_bucketed(self, texts):
+        """
+        Run the classifier over batches grouped by token length.
+
+        Texts are tokenized once up front and placed in the smallest bucket
+        boundary that fits them. Each bucket gets as many rows per forward
+        pass as fit in max_batch_tokens, so short comments are never padded
+        to the length of a long post. Outputs come back in input order.
+        """
+        outputs = [None] * len(texts)
+        if not texts:
+            return outputs
+
+        max_length = self.bucket_boundaries[-1]
+        encoded = self.classifier.tokenizer(texts, truncation=True, max_length=max_length)
+        lengths = [len(ids) for ids in encoded["input_ids"]]
+
+        buckets = {}
+        for idx, length in enumerate(lengths):
+            bound = next((b for b in self.bucket_boundaries if length <= b), max_length)
+            buckets.setdefault(bound, []).append(idx)
+
+        processed = 0
+        for bound in sorted(buckets):
+            # Sort inside the bucket so each batch pads to a near-identical length
+            indices = sorted(buckets[bound], key=lengths.__getitem__)
+            rows = max(1, self.max_batch_tokens // bound)
+
+            for start in range(0, len(indices), rows):
+                chunk = indices[start:start + rows]
+                try:
+                    results = self.classifier(
+                        [texts[i] for i in chunk], batch_size=len(chunk), truncation=True
+                    )
+                    for i, result in zip(chunk, results):
+                        outputs[i] = result
+                except Exception as e:
+                    print(f"  Batch error (bucket {bound}): {e}")
+
+                processed += len(chunk)
+                print(f"  Processed {processed}/{len(texts)} texts (bucket <= {bound} tokens)")
+
+        return outputs
+
+    def _analyze_indexed(self, texts, languages=None, batch_size=32, bucket_by_length=None):
+        """Analyze texts; returns (input index, result) pairs for texts that were scored"""
+        # Clean batch
+        clean_batch = []
+        original_texts = []
+        batch_indices = []
+        for i, t in enumerate(texts):
+            if t and len(t.strip()) > 3:
+                clean_batch.append(t[:self.max_chars])
+                original_texts.append(t)
+                batch_indices.append(i)
+
+        if not clean_batch:
+            return []
+
+        # Use pre-detected languages if available
+        if languages and len(languages) >= len(texts):
+            batch_languages = [languages[i] for i in batch_indices]
+        else:
+            batch_languages = self.translator.detect_languages(original_texts)
+
+        if self.translate_first:
+            foreign = [i for i, language in enumerate(batch_languages) if language != "en"]
+            translated = self.translator.translate_batch(
+                [clean_batch[i] for i in foreign], languages=[batch_languages[i] for i in foreign]
+            )
+            for i, text in zip(foreign, translated):
+                clean_batch[i] = text[:self.max_chars]
+
+        batch_scores = self.classify(clean_batch, batch_size, bucket_by_length)
+
+        results = []
+        for idx, (text, scores) in enumerate(zip(original_texts, batch_scores)):
+            if not scores:
+                continue
+
+            top = max(scores, key=scores.get)
+            results.append((batch_indices[idx], {
+                "text": text,
+                "sentiment": top,
+                "confidence": scores[top],
+                "scores": scores,
+                "language": batch_languages[idx]
+            }))
+
         return results
 
+    def analyze_batch(self, texts, batch_size=32, languages=None, bucket_by_length=None):
+        """Analyze sentiment of multiple texts efficiently"""
+        return [r for _, r in self._analyze_indexed(texts, languages, batch_size, bucket_by_length)]
+
+    def analyze_stream(self, texts, languages=None, chunk_size=None, prefetch=1):
+        """
+        Generator over any iterable of texts, yielding one list of results per
+        chunk. Each result carries "index", its position in the input stream.
+
+        The model runs on a background thread at most `prefetch` chunks ahead
+        of the consumer, so enrichment and database writes for one chunk
+        overlap with inference on the next while memory stays bounded.
+        """
+        chunk_size = chunk_size or SENTIMENT_STREAM_CHUNK
+        ready = queue.Queue(maxsize=max(1, prefetch))
+        stop = threading.Event()
+        done = object()
+
+        def _put(item):
+            while not stop.is_set():
+                try:
+                    ready.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _produce():
+            text_iter = iter(texts)
+            lang_iter = iter(languages) if languages is not None else None
+            offset = 0
+            try:
+                while not stop.is_set():
+                    chunk = list(islice(text_iter, chunk_size))
+                    if not chunk:
+                        break
+                    langs = list(islice(lang_iter, len(chunk))) if lang_iter is not None else None
+
+                    results = []
+                    for i, result in self._analyze_indexed(chunk, langs):
+                        result["index"] = offset + i
+                        results.append(result)
+                    offset += len(chunk)
+
+                    if not _put(results):
+                        return
+            except Exception as e:
+                _put(e)
+            _put(done)
+
+        producer = threading.Thread(target=_produce, name="sentiment-stream", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = ready.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join(timeout=1)
+
+    def _cascade_report(self):
+        if self.lexicon is None:
+            return None
+        routed = self.cascade_stats["lexicon"] + self.cascade_stats["escalated"]
+        audited = self.cascade_stats["audited"]
+        return {
+            **self.cascade_stats,
+            "margin": self.cascade_margin,
+            "lexicon_rate": round(self.cascade_stats["lexicon"] / routed, 4) if routed else 0.0,
+            "escalation_rate": round(self.cascade_stats["escalated"] / routed, 4) if routed else 0.0,
+            "agreement": round(self.cascade_stats["agreed"] / audited, 4) if audited else None,
+        }
+
+    def stats(self):
+        return {
+            "model": self.model_name,
+            "backend": self.backend,
+            "pool": self.pool.stats() if self.pool is not None else None,
+            "cascade": self._cascade_report(),
+            "cache": self.cache.stats() if self.cache is not None else None,
+        }
+
 
 # Quick test
 if __name__ == "__main__":
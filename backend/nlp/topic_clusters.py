@@ -0,0 +1,214 @@
+# backend/nlp/topic_clusters.py
+"""
+Online topic clustering for emerging-issue detection.
+Each new item's embedding joins the nearest cluster centroid when it is
+similar enough, or opens a new cluster. Centroids are updated per mini-batch
+as running means, so nothing is ever re-clustered from scratch. Clusters
+keep hourly item counts, which the emerging-topics endpoint turns into
+growth rates.
+"""
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from config import (
+    TOPIC_CLUSTER_THRESHOLD,
+    TOPIC_CLUSTER_MAX_WEIGHT,
+    TOPIC_CLUSTER_MAX_CLUSTERS,
+    TOPIC_CLUSTER_HISTORY_HOURS,
+)
+
+HOUR_FORMAT = "%Y-%m-%dT%H"
+
+
+class TopicClusterer:
+    def __init__(self, embeddings, threshold=None):
+        self.embeddings = embeddings
+        self.threshold = TOPIC_CLUSTER_THRESHOLD if threshold is None else threshold
+
+        self.ids = []
+        self.centroids = np.zeros((0, embeddings.dimension), dtype=np.float32)
+        self.clusters = {}  # id -> {"count", "topics": Counter, "hourly": {hour: n}, "sample", ...}
+        self._dirty = set()
+        self._evicted = []  # documents of changed clusters trimmed before they were saved
+        self._lock = threading.Lock()
+
+    def load(self, docs):
+        """Restore clusters from persisted documents (see Database.load_topic_clusters)"""
+        with self._lock:
+            vectors = []
+            for doc in docs:
+                vector = self.embeddings.from_bytes(doc["centroid"])
+                if len(vector) != self.centroids.shape[1]:
+                    continue  # stored with a different encoder
+                self.ids.append(doc["_id"])
+                vectors.append(vector)
+                self.clusters[doc["_id"]] = {
+                    "count": doc.get("count", 0),
+                    "topics": Counter(doc.get("topic_counts", {})),
+                    "hourly": dict(doc.get("hourly", {})),
+                    "sample": doc.get("sample", ""),
+                    "created_at": doc.get("created_at"),
+                }
+            if vectors:
+                self.centroids = np.vstack([self.centroids, np.asarray(vectors, dtype=np.float32)])
+        print(f"  Topic clusters loaded: {len(self.ids)}")
+
+    def _open(self, vector, text, now):
+        cluster_id = uuid.uuid4().hex[:12]
+        self.ids.append(cluster_id)
+        self.centroids = np.vstack([self.centroids, vector[None, :]])
+        self.clusters[cluster_id] = {
+            "count": 0,
+            "topics": Counter(),
+            "hourly": {},
+            "sample": text[:200],
+            "created_at": now,
+        }
+        return len(self.ids) - 1
+
+    def assign_batch(self, texts, topics=None, now=None):
+        """
+        Assign each text to a cluster and fold the batch into the centroids.
+        Returns one cluster id per text.
+        """
+        if not texts:
+            return []
+
+        now = now or datetime.utcnow()
+        hour = now.strftime(HOUR_FORMAT)
+        vectors = self.embeddings.encode(texts)
+
+        with self._lock:
+            # Existing clusters: one similarity matrix for the whole batch
+            assigned = np.full(len(texts), -1)
+            if len(self.ids):
+                similarities = vectors @ self.centroids.T
+                best = similarities.argmax(axis=1)
+                close = similarities[np.arange(len(texts)), best] >= self.threshold
+                assigned[close] = best[close]
+
+            # Leftovers may join clusters opened earlier in this batch
+            first_new = len(self.ids)
+            for i in np.nonzero(assigned < 0)[0]:
+                if len(self.ids) > first_new:
+                    similarities = self.centroids[first_new:] @ vectors[i]
+                    j = int(similarities.argmax())
+                    if similarities[j] >= self.threshold:
+                        assigned[i] = first_new + j
+                        continue
+                assigned[i] = self._open(vectors[i], texts[i], now)
+
+            # Mini-batch update: running mean per cluster, weight capped so old clusters can drift
+            for index in np.unique(assigned):
+                members = np.nonzero(assigned == index)[0]
+                cluster = self.clusters[self.ids[index]]
+                weight = min(cluster["count"], TOPIC_CLUSTER_MAX_WEIGHT)
+                centroid = weight * self.centroids[index] + vectors[members].sum(axis=0)
+                self.centroids[index] = centroid / max(np.linalg.norm(centroid), 1e-12)
+
+                cluster["count"] += len(members)
+                cluster["hourly"][hour] = cluster["hourly"].get(hour, 0) + len(members)
+                if topics:
+                    for i in members:
+                        cluster["topics"].update(topics[i])
+                self._dirty.add(self.ids[index])
+
+            # Resolve ids first: trimming reorders rows
+            cluster_ids = [self.ids[index] for index in assigned]
+            self._trim(now)
+            return cluster_ids
+
+    def _trim(self, now):
+        """Drop expired hourly counts; cap the number of clusters held in memory"""
+        oldest = (now - timedelta(hours=TOPIC_CLUSTER_HISTORY_HOURS)).strftime(HOUR_FORMAT)
+        for cluster_id in self._dirty:
+            hourly = self.clusters[cluster_id]["hourly"]
+            for key in [k for k in hourly if k < oldest]:
+                del hourly[key]
+
+        excess = len(self.ids) - TOPIC_CLUSTER_MAX_CLUSTERS
+        if excess > 0:
+            # Least recently active clusters leave memory; unsaved changes are kept for the next save
+            last_seen = [max(self.clusters[c]["hourly"], default="") for c in self.ids]
+            drop = set(np.argsort(last_seen, kind="stable")[:excess])
+            keep = [i for i in range(len(self.ids)) if i not in drop]
+            for i in drop:
+                if self.ids[i] in self._dirty:
+                    self._evicted.append(self._document(self.ids[i], i))
+                    self._dirty.discard(self.ids[i])
+                self.clusters.pop(self.ids[i], None)
+            self.ids = [self.ids[i] for i in keep]
+            self.centroids = self.centroids[keep]
+
+    def label(self, cluster_id):
+        cluster = self.clusters[cluster_id]
+        if cluster["topics"]:
+            return cluster["topics"].most_common(1)[0][0]
+        return cluster["sample"][:60]
+
+    def _document(self, cluster_id, index):
+        cluster = self.clusters[cluster_id]
+        return {
+            "_id": cluster_id,
+            "label": self.label(cluster_id),
+            "centroid": self.embeddings.to_bytes(self.centroids[index]),
+            "count": cluster["count"],
+            "topic_counts": dict(cluster["topics"].most_common(20)),
+            "hourly": cluster["hourly"],
+            "sample": cluster["sample"],
+            "created_at": cluster["created_at"],
+        }
+
+    def dirty_documents(self):
+        """Documents for clusters changed since the last call, ready to persist"""
+        with self._lock:
+            docs = self._evicted
+            docs.extend(self._document(c, self.ids.index(c)) for c in self._dirty)
+            self._evicted = []
+            self._dirty.clear()
+            return docs
+
+    def stats(self):
+        return {
+            "clusters": len(self.ids),
+            "threshold": self.threshold,
+            "pending_writes": len(self._dirty) + len(self._evicted),
+        }
+
+
+def growth_rates(docs, hours=6, min_count=3, now=None):
+    """
+    Rank clusters by growth: items in the last `hours` vs the `hours`
+    before that, smoothed so new clusters don't divide by zero
+    """
+    now = now or datetime.utcnow()
+    recent_start = (now - timedelta(hours=hours - 1)).strftime(HOUR_FORMAT)
+    previous_start = (now - timedelta(hours=2 * hours - 1)).strftime(HOUR_FORMAT)
+
+    ranked = []
+    for doc in docs:
+        recent = previous = 0
+        for hour, count in doc.get("hourly", {}).items():
+            if hour >= recent_start:
+                recent += count
+            elif hour >= previous_start:
+                previous += count
+        if recent < min_count:
+            continue
+        ranked.append({
+            "cluster_id": doc["_id"],
+            "label": doc.get("label"),
+            "top_topics": list(doc.get("topic_counts", {}))[:5],
+            "recent_count": recent,
+            "previous_count": previous,
+            "growth_rate": round((recent + 1) / (previous + 1), 2),
+            "total_count": doc.get("count", 0),
+            "sample": doc.get("sample", ""),
+        })
+
+    ranked.sort(key=lambda c: (c["growth_rate"], c["recent_count"]), reverse=True)
+    return ranked
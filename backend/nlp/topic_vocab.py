@@ -0,0 +1,170 @@
+# backend/nlp/topic_vocab.py
+"""
+Canonical political topic vocabulary and the multilingual data that maps
+onto it: per-language stopwords, aliases (Hindi, Hinglish, Tamil, Bengali)
+and a token pattern that keeps Indic vowel signs inside words.
+"""
+import json
+import re
+
+try:
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+except ImportError:
+    ENGLISH_STOP_WORDS = frozenset()
+
+# Canonical English topics; every multilingual topic is normalized onto these
+POLITICAL_TOPICS = [
+    "water", "water supply", "road", "roads", "electricity", "power",
+    "education", "school", "college", "healthcare", "hospital",
+    "employment", "jobs", "unemployment", "inflation", "price rise",
+    "corruption", "scam", "development", "infrastructure",
+    "farmer", "agriculture", "youth", "women", "safety",
+    "subsidy", "scheme", "tax", "gst", "economy", "gdp",
+    "security", "defence", "defense", "army", "military",
+    "pollution", "environment", "climate", "flood", "drought",
+    "housing", "transport", "metro", "railway", "highway",
+    "digital", "internet", "technology", "startup",
+    "poverty", "hunger", "ration", "gas", "petrol", "diesel",
+    "modi", "bjp", "congress", "aap", "opposition",
+    "election", "vote", "democracy", "parliament",
+    "caste", "reservation", "religion", "communal",
+    "media", "press", "freedom", "rights",
+]
+
+# Vowel signs and viramas are Unicode marks, which \w does not match
+TOKEN_PATTERN = r"(?u)[\w\u0600-\u06FF\u0900-\u0D7F]{2,}"
+_TOKEN = re.compile(TOKEN_PATTERN)
+
+ALIASES = {
+    # Hindi
+    "पानी": "water", "जल": "water", "पेयजल": "water supply", "सड़क": "road", "सड़कें": "roads",
+    "सड़कों": "roads", "बिजली": "electricity", "शिक्षा": "education", "स्कूल": "school",
+    "कॉलेज": "college", "स्वास्थ्य": "healthcare", "अस्पताल": "hospital", "रोजगार": "employment",
+    "रोज़गार": "employment", "नौकरी": "jobs", "नौकरियां": "jobs", "बेरोजगारी": "unemployment",
+    "बेरोज़गारी": "unemployment", "महंगाई": "inflation", "भ्रष्टाचार": "corruption",
+    "घोटाला": "scam", "विकास": "development", "किसान": "farmer", "किसानों": "farmer",
+    "खेती": "agriculture", "कृषि": "agriculture", "युवा": "youth", "युवाओं": "youth",
+    "महिला": "women", "महिलाओं": "women", "सुरक्षा": "security", "सब्सिडी": "subsidy",
+    "योजना": "scheme", "जीएसटी": "gst", "अर्थव्यवस्था": "economy", "सेना": "army",
+    "प्रदूषण": "pollution", "पर्यावरण": "environment", "बाढ़": "flood", "सूखा": "drought",
+    "आवास": "housing", "मकान": "housing", "परिवहन": "transport", "मेट्रो": "metro",
+    "रेलवे": "railway", "रेल": "railway", "इंटरनेट": "internet", "गरीबी": "poverty",
+    "भूख": "hunger", "राशन": "ration", "गैस": "gas", "पेट्रोल": "petrol", "डीजल": "diesel",
+    "मोदी": "modi", "भाजपा": "bjp", "कांग्रेस": "congress", "विपक्ष": "opposition",
+    "चुनाव": "election", "वोट": "vote", "मतदान": "vote", "लोकतंत्र": "democracy",
+    "संसद": "parliament", "जाति": "caste", "आरक्षण": "reservation", "धर्म": "religion",
+    "सांप्रदायिक": "communal", "मीडिया": "media", "आज़ादी": "freedom", "स्वतंत्रता": "freedom",
+    "अधिकार": "rights",
+    # Hinglish
+    "paani": "water", "pani": "water", "sadak": "road", "bijli": "electricity",
+    "shiksha": "education", "aspatal": "hospital", "naukri": "jobs", "rozgar": "employment",
+    "berozgari": "unemployment", "mehngai": "inflation", "mahangai": "inflation",
+    "bhrashtachar": "corruption", "ghotala": "scam", "vikas": "development", "kisan": "farmer",
+    "kheti": "agriculture", "yuva": "youth", "chunav": "election", "chunaav": "election",
+    "yojana": "scheme", "garibi": "poverty", "sena": "army",
+    # Tamil
+    "தண்ணீர்": "water", "குடிநீர்": "water supply", "சாலை": "road", "சாலைகள்": "roads",
+    "மின்சாரம்": "electricity", "மின்வெட்டு": "electricity", "கல்வி": "education",
+    "பள்ளி": "school", "மருத்துவமனை": "hospital", "வேலை": "jobs", "வேலையின்மை": "unemployment",
+    "விலைவாசி": "inflation", "ஊழல்": "corruption", "வளர்ச்சி": "development",
+    "விவசாயி": "farmer", "விவசாயிகள்": "farmer", "விவசாயம்": "agriculture", "மானியம்": "subsidy",
+    "திட்டம்": "scheme", "தேர்தல்": "election", "மெட்ரோ": "metro", "வரி": "tax",
+    # Bengali
+    "জল": "water", "পানি": "water", "রাস্তা": "road", "বিদ্যুৎ": "electricity",
+    "শিক্ষা": "education", "স্কুল": "school", "হাসপাতাল": "hospital", "চাকরি": "jobs",
+    "বেকারত্ব": "unemployment", "মূল্যবৃদ্ধি": "inflation", "দুর্নীতি": "corruption",
+    "উন্নয়ন": "development", "কৃষক": "farmer", "কৃষি": "agriculture", "নির্বাচন": "election",
+    "ভোট": "vote", "প্রকল্প": "scheme",
+}
+
+STOPWORDS = {
+    "hi": {
+        "का", "की", "के", "को", "में", "है", "हैं", "था", "थी", "थे", "और", "या", "से", "पर",
+        "भी", "तो", "ही", "यह", "ये", "वह", "वे", "इस", "उस", "इन", "उन", "एक", "कि", "जो",
+        "कर", "किया", "करते", "करने", "रहा", "रही", "रहे", "हो", "होगा", "गया", "गई", "लिए",
+        "नहीं", "ने", "तक", "अब", "जब", "तब", "सब", "कुछ", "कोई", "बहुत", "अपने", "हम", "आप",
+        "जी", "सिर्फ", "दोनों",
+    },
+    "hi-Latn": {
+        "hai", "hain", "tha", "thi", "the", "ka", "ki", "ke", "ko", "mai", "mein", "se", "pe",
+        "par", "aur", "ya", "bhi", "toh", "hi", "ye", "yeh", "wo", "woh", "is", "us", "ek",
+        "kya", "kaise", "kab", "kyun", "nahi", "nahin", "ho", "hoga", "raha", "rahi", "rahe",
+        "kar", "karna", "karke", "liye", "tak", "ab", "jab", "tab", "sab", "kuch", "koi",
+        "bahut", "bohot", "ji", "log", "wala", "wale", "wali",
+    },
+    "ta": {
+        "ஒரு", "இந்த", "அந்த", "மற்றும்", "என்று", "இது", "அது", "உள்ளது", "இல்லை", "மிகவும்",
+        "என", "ஆனால்", "அவர்", "அவர்கள்", "நாம்", "நான்", "எங்கள்", "இன்னும்", "செய்து",
+    },
+    "bn": {
+        "এবং", "ও", "এই", "সেই", "যে", "না", "করে", "হয়", "হবে", "ছিল", "আর", "কিন্তু",
+        "আমাদের", "আমি", "তার", "সব", "জন্য", "থেকে", "শুধু", "খুব", "একটি", "আরও",
+    },
+}
+
+_CANONICAL = set(POLITICAL_TOPICS)
+
+
+def load_vocabulary(path=None):
+    """
+    Canonical topics, optionally extended from a JSON file holding either a
+    list of topics or {"topics": [...], "aliases": {alias: topic}}. Extra
+    topics and aliases are registered for canonical_topic / match_aliases.
+    """
+    topics = list(POLITICAL_TOPICS)
+    if not path:
+        return topics
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"  Topic vocabulary file not loaded ({path}): {e}")
+        return topics
+
+    if isinstance(data, list):
+        data = {"topics": data}
+    for topic in data.get("topics", []):
+        topic = topic.lower().strip()
+        if topic and topic not in topics:
+            topics.append(topic)
+            _CANONICAL.add(topic)
+    for alias, topic in data.get("aliases", {}).items():
+        ALIASES[alias.lower().strip()] = topic.lower().strip()
+
+    print(f"  Topic vocabulary: {len(topics)} topics ({len(topics) - len(POLITICAL_TOPICS)} from {path})")
+    return topics
+
+
+def stopwords_for(language):
+    """English stopwords plus the list for the text's language"""
+    return sorted(ENGLISH_STOP_WORDS | STOPWORDS.get(language, set()))
+
+
+def canonical_topic(phrase):
+    """Canonical topic for a phrase via exact or alias match, else None"""
+    phrase = phrase.lower().strip()
+    if phrase in _CANONICAL:
+        return phrase
+    if phrase in ALIASES:
+        return ALIASES[phrase]
+
+    # Multi-word phrases: first token with a known mapping
+    for token in _TOKEN.findall(phrase):
+        if token in _CANONICAL:
+            return token
+        if token in ALIASES:
+            return ALIASES[token]
+    return None
+
+
+def match_aliases(text, top_n=5):
+    """Keyword fallback for any language: canonical topics named in the text, in order"""
+    found = []
+    for token in _TOKEN.findall(text.lower()):
+        topic = token if token in _CANONICAL else ALIASES.get(token)
+        if topic and topic not in found:
+            found.append(topic)
+            if len(found) >= top_n:
+                break
+    return found
@@ -1,40 +1,77 @@
 # backend/nlp/topics.py
+import hashlib
+import os
+import threading
+
+import numpy as np
+
+from compute import compute
+from config import (
+    MODEL_CACHE_DIR,
+    TOPIC_MODE,
+    TOPIC_MULTILINGUAL_MODEL,
+    TOPIC_NORMALIZE_THRESHOLD,
+    TOPIC_VOCAB_FILE,
+    TOPIC_GUIDED_THRESHOLD,
+    TOPIC_BATCH_SIZE,
+)
+from nlp.keyword_matcher import KeywordMatcher
+from nlp.topic_vocab import TOKEN_PATTERN, canonical_topic, load_vocabulary, match_aliases, stopwords_for
 
 
 class TopicExtractor:
-    def __init__(self, translator=None):
+    def __init__(self, translator=None, mode=None, embeddings=None):
         if translator is None:
             from nlp.translator import TranslatorService
             translator = TranslatorService()
         self.translator = translator
 
+        # "translate": English KeyBERT on translated text
+        # "multilingual": multilingual embeddings on the original text, no translation hop
+        # "guided": documents matched against the embedded vocabulary, no candidate n-grams
+        self.mode = mode or TOPIC_MODE
+
+        self.encoder_name = TOPIC_MULTILINGUAL_MODEL
+        self.embeddings = None
         try:
             from keybert import KeyBERT
-            self.model = KeyBERT()
+            if self.mode in ("multilingual", "guided") and embeddings is not None and embeddings.working:
+                # Shared EmbeddingService as KeyBERT's backend: documents are cached
+                # across features, candidate phrases in its smaller phrase cache
+                self.model = KeyBERT(model=embeddings.model)
+                self.model.model = embeddings
+                self.embeddings = embeddings
+                self.encoder_name = embeddings.model_name
+            elif self.mode in ("multilingual", "guided"):
+                self.model = KeyBERT(model=TOPIC_MULTILINGUAL_MODEL)
+            else:
+                self.model = KeyBERT()
             self.working = True
-            print("  Topic extractor initialized (KeyBERT)")
+            print(f"  Topic extractor initialized (KeyBERT, {self.mode} mode)")
         except Exception as e:
             print(f"  KeyBERT not available: {e}")
             self.working = False
 
+        # Unit-normalized embeddings of political_keywords, built on first use
+        self._vocab_embeddings = None
+        self._vocab_lock = threading.Lock()
+
         # Predefined political topics to look for
-        self.political_keywords = [
-            "water", "water supply", "road", "roads", "electricity", "power",
-            "education", "school", "college", "healthcare", "hospital",
-            "employment", "jobs", "unemployment", "inflation", "price rise",
-            "corruption", "scam", "development", "infrastructure",
-            "farmer", "agriculture", "youth", "women", "safety",
-            "subsidy", "scheme", "tax", "gst", "economy", "gdp",
-            "security", "defence", "defense", "army", "military",
-            "pollution", "environment", "climate", "flood", "drought",
-            "housing", "transport", "metro", "railway", "highway",
-            "digital", "internet", "technology", "startup",
-            "poverty", "hunger", "ration", "gas", "petrol", "diesel",
-            "modi", "bjp", "congress", "aap", "opposition",
-            "election", "vote", "democracy", "parliament",
-            "caste", "reservation", "religion", "communal",
-            "media", "press", "freedom", "rights",
-        ]
+        self.political_keywords = load_vocabulary(TOPIC_VOCAB_FILE)
+        self.keyword_matcher = KeywordMatcher(self.political_keywords)
+
+    def warmup(self):
+        """Run one KeyBERT extraction so the first real request doesn't pay for it"""
+        if self.working:
+            try:
+                self.model.extract_keywords(
+                    "Warm-up document about water supply and road infrastructure",
+                    keyphrase_ngram_range=(1, 2), stop_words="english", top_n=1
+                )
+                if self.mode in ("multilingual", "guided"):
+                    self._vocab_index()
+            except Exception as e:
+                print(f"  KeyBERT warm-up failed: {e}")
 
     def extract_topics(self, text, top_n=5, language=None):
         """Extract topics — translate non-English first"""
@@ -44,8 +81,13 @@ class TopicExtractor:
         # Detect language only if not provided
         if language is None:
             language = self.translator.detect_language(text)
-        analysis_text = text
 
+        if self.mode == "multilingual":
+            return self._extract_multilingual(text, language, top_n)
+        if self.mode == "guided":
+            return self._extract_guided_many([text], top_n)[0]
+
+        analysis_text = text
         if language != "en":
             try:
                 translated = self.translator.translate_to_english(text)
@@ -54,48 +96,245 @@ class TopicExtractor:
             except Exception:
                 pass
 
+        return self._extract(analysis_text, top_n)
+
+    def _keybert(self, docs, **kwargs):
+        """One KeyBERT call over a list of documents; returns one keyword list per document"""
+        if self.embeddings is not None:
+            # Documents into the shared document cache first; KeyBERT's own
+            # embed() call then hits it and only candidates reach the phrase cache
+            self.embeddings.encode(docs)
+        keywords = compute.run(self.model.extract_keywords, docs, use_mmr=True, diversity=0.5, **kwargs)
+        # KeyBERT unwraps the result for a single document
+        return [keywords] if len(docs) == 1 else keywords
+
+    def _extract(self, analysis_text, top_n=5):
+        return self._extract_many([analysis_text], top_n)[0]
+
+    def _extract_many(self, analysis_texts, top_n=5):
+        """
+        KeyBERT over the list, TOPIC_BATCH_SIZE documents per call, so document
+        and candidate embeddings are computed in large batches. Documents
+        without KeyBERT topics fall back to keyword matching.
+        """
+        results = [None] * len(analysis_texts)
+
         # Method 1: Try KeyBERT
+        if self.working:
+            for start in range(0, len(analysis_texts), TOPIC_BATCH_SIZE):
+                docs = analysis_texts[start:start + TOPIC_BATCH_SIZE]
+                try:
+                    keywords = self._keybert(
+                        docs, keyphrase_ngram_range=(1, 2), stop_words="english", top_n=top_n
+                    )
+                except Exception:
+                    continue
+                for offset, doc_keywords in enumerate(keywords):
+                    results[start + offset] = [kw[0].lower() for kw in doc_keywords if len(kw[0]) > 2]
+
+        # Method 2: Keyword matching fallback
+        return [
+            topics or self._keyword_match(text, top_n)
+            for topics, text in zip(results, analysis_texts)
+        ]
+
+    def _extract_multilingual(self, text, language, top_n=5):
+        return self._extract_multilingual_many([text], [language], top_n)[0]
+
+    def _extract_multilingual_many(self, texts, languages, top_n=5):
+        """KeyBERT on the original texts with each language's stopwords, normalized to canonical topics"""
+        phrase_lists = [[] for _ in texts]
+
         if self.working:
             try:
-                keywords = self.model.extract_keywords(
-                    analysis_text,
-                    keyphrase_ngram_range=(1, 2),
-                    stop_words="english",
-                    top_n=top_n,
-                    use_mmr=True,
-                    diversity=0.5
-                )
-                topics = [kw[0].lower() for kw in keywords if len(kw[0]) > 2]
-                if topics:
-                    return topics
+                from sklearn.feature_extraction.text import CountVectorizer
+
+                # Stopwords differ per language, so one KeyBERT call per language group
+                by_language = {}
+                for i, language in enumerate(languages):
+                    by_language.setdefault(language, []).append(i)
+
+                for language, indices in by_language.items():
+                    for start in range(0, len(indices), TOPIC_BATCH_SIZE):
+                        chunk = indices[start:start + TOPIC_BATCH_SIZE]
+                        vectorizer = CountVectorizer(
+                            ngram_range=(1, 2),
+                            stop_words=stopwords_for(language),
+                            token_pattern=TOKEN_PATTERN
+                        )
+                        try:
+                            keywords = self._keybert([texts[i] for i in chunk], vectorizer=vectorizer, top_n=top_n * 2)
+                        except Exception:
+                            continue
+                        for i, doc_keywords in zip(chunk, keywords):
+                            phrase_lists[i] = [kw[0] for kw in doc_keywords]
+
+                phrase_lists = self._normalize_many(phrase_lists)
             except Exception:
-                pass
+                phrase_lists = [[] for _ in texts]
 
-        # Method 2: Keyword matching fallback
-        return self._keyword_match(analysis_text, top_n)
+        # Fallback: canonical topics and their aliases named in the text
+        return [
+            topics[:top_n] or match_aliases(text, top_n)
+            for topics, text in zip(phrase_lists, texts)
+        ]
+
+    def _embed(self, texts):
+        """Unit-normalized sentence embeddings, one encoder pass for the list"""
+        vectors = np.asarray(compute.run(self.model.model.embed, texts), dtype=np.float32)
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+    def _embed_documents(self, texts):
+        """Like _embed, but kept in the shared document cache when there is one"""
+        if self.embeddings is None:
+            return self._embed(texts)
+        return self.embeddings.encode(texts)
+
+    def _vocab_index(self):
+        """
+        Embeddings of political_keywords, computed once and cached on disk
+        under a hash of the encoder and vocabulary
+        """
+        if self._vocab_embeddings is None:
+            with self._vocab_lock:
+                if self._vocab_embeddings is None:
+                    self._vocab_embeddings = self._load_vocab_index()
+        return self._vocab_embeddings
+
+    def _load_vocab_index(self):
+        digest = hashlib.sha1(
+            "\n".join([self.encoder_name] + self.political_keywords).encode("utf-8")
+        ).hexdigest()[:16]
+        path = os.path.join(MODEL_CACHE_DIR, "topic_vocab", f"{digest}.npy")
+
+        if os.path.exists(path):
+            try:
+                vectors = np.load(path)
+                if len(vectors) == len(self.political_keywords):
+                    return vectors
+            except Exception as e:
+                print(f"  Topic vocabulary cache unreadable, re-embedding: {e}")
+
+        vectors = self._embed(self.political_keywords)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            np.save(path + ".partial.npy", vectors)
+            os.replace(path + ".partial.npy", path)
+        except Exception as e:
+            print(f"  Topic vocabulary cache not written: {e}")
+        return vectors
+
+    def _extract_guided_many(self, texts, top_n=5):
+        """
+        Assign vocabulary topics by one similarity matrix: every document is
+        encoded once and compared with the whole vocabulary index
+        """
+        results = [[] for _ in texts]
+        if self.working:
+            try:
+                vocab = self._vocab_index()
+                for start in range(0, len(texts), TOPIC_BATCH_SIZE):
+                    vectors = self._embed_documents(texts[start:start + TOPIC_BATCH_SIZE])
+                    similarities = vectors @ vocab.T
+                    ranked = np.argsort(-similarities, axis=1)[:, :top_n]
+                    for row, indices in enumerate(ranked):
+                        results[start + row] = [
+                            self.political_keywords[j] for j in indices
+                            if similarities[row, j] >= TOPIC_GUIDED_THRESHOLD
+                        ]
+            except Exception as e:
+                print(f"  Guided topic assignment failed: {e}")
+
+        return [topics or match_aliases(text, top_n) for topics, text in zip(results, texts)]
+
+    def _nearest_topics(self, phrases):
+        """Nearest canonical topic per phrase by cosine similarity, None below the threshold"""
+        vocab = self._vocab_index()
+        vectors = self._embed(phrases)
+        similarities = vectors @ vocab.T
+        best = similarities.argmax(axis=1)
+        return [
+            self.political_keywords[j] if similarities[i, j] >= TOPIC_NORMALIZE_THRESHOLD else None
+            for i, j in enumerate(best)
+        ]
+
+    def _normalize(self, phrases):
+        return self._normalize_many([phrases])[0]
+
+    def _normalize_many(self, phrase_lists):
+        """
+        Map extracted phrases onto the canonical English vocabulary: exact and
+        alias matches first, then the nearest topic by embedding (one encoder
+        call for the whole batch). Unmatched English phrases are kept;
+        unmatched non-English phrases are dropped.
+        """
+        resolved = {}
+        for phrases in phrase_lists:
+            for phrase in phrases:
+                if phrase not in resolved:
+                    resolved[phrase] = canonical_topic(phrase)
+
+        unresolved = [p for p, topic in resolved.items() if topic is None]
+        if unresolved and self.working:
+            resolved.update(zip(unresolved, self._nearest_topics(unresolved)))
+
+        normalized = []
+        for phrases in phrase_lists:
+            topics = []
+            for phrase in phrases:
+                topic = resolved[phrase]
+                if topic is None and phrase.isascii() and len(phrase) > 2:
+                    topic = phrase.lower()
+                if topic and topic not in topics:
+                    topics.append(topic)
+            normalized.append(topics)
+        return normalized
 
     def _keyword_match(self, text, top_n=5):
-        """Fallback: match against predefined political keywords"""
-        text_lower = text.lower()
-        found = []
+        """Fallback: whole-word matches against predefined political keywords, in text order"""
+        return self.keyword_matcher.match(text, top_n)
+
+    def extract_topics_batch(self, texts, top_n=5, languages=None):
+        """
+        Same per-text topic lists as extract_topics, with one batched
+        translation call and batched KeyBERT extraction for the whole list
+        """
+        if languages is None:
+            languages = self.translator.detect_languages(texts)
 
-        for keyword in self.political_keywords:
-            if keyword in text_lower:
-                found.append(keyword)
+        all_topics = [[] for _ in texts]
+        valid = [i for i, text in enumerate(texts) if text and len(text.strip()) >= 10]
+        if not valid:
+            return all_topics
 
-        return found[:top_n] if found else []
+        if self.mode == "multilingual":
+            topics = self._extract_multilingual_many(
+                [texts[i] for i in valid], [languages[i] for i in valid], top_n
+            )
+        elif self.mode == "guided":
+            topics = self._extract_guided_many([texts[i] for i in valid], top_n)
+        else:
+            analysis_texts = [texts[i] for i in valid]
+            foreign = [k for k, i in enumerate(valid) if languages[i] != "en"]
+            try:
+                translated = self.translator.translate_batch(
+                    [analysis_texts[k] for k in foreign],
+                    languages=[languages[valid[k]] for k in foreign],
+                )
+                for k, text in zip(foreign, translated):
+                    if text and len(text) > 5:
+                        analysis_texts[k] = text
+            except Exception:
+                pass
+            topics = self._extract_many(analysis_texts, top_n)
 
-    def extract_topics_batch(self, texts, top_n=5):
-        all_topics = []
-        for text in texts:
-            topics = self.extract_topics(text, top_n)
-            all_topics.append(topics)
+        for i, doc_topics in zip(valid, topics):
+            all_topics[i] = doc_topics
         return all_topics
 
     def get_common_topics(self, texts, top_n=20):
         topic_counts = {}
-        for text in texts:
-            topics = self.extract_topics(text, top_n=3)
+        for topics in self.extract_topics_batch(texts, top_n=3):
             for topic in topics:
                 topic_lower = topic.lower()
                 topic_counts[topic_lower] = topic_counts.get(topic_lower, 0) + 1
@@ -0,0 +1,215 @@
+# backend/nlp/translation_client.py
+"""
+Guarded calls to the translation provider.
+Calls run on a small thread pool (bounded concurrency) with a deadline
+each, counted from when the call starts running rather than while it waits
+for a free worker. A circuit breaker stops calling the provider after repeated failures
+or timeouts, so callers fall back to the untranslated text immediately
+instead of waiting out every timeout during an outage.
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+
+from config import (
+    TRANSLATION_MAX_CONCURRENCY,
+    TRANSLATION_TIMEOUT,
+    TRANSLATION_BREAKER_FAILURES,
+    TRANSLATION_BREAKER_RESET,
+)
+
+
+class TranslationUnavailable(Exception):
+    """Raised when a call is short-circuited or misses its deadline"""
+
+
+class CircuitBreaker:
+    """
+    closed -> open after `failure_threshold` consecutive failures.
+    open -> half_open once `reset_timeout` seconds have passed; a single
+    probe call is let through and closes the circuit on success or reopens
+    it on failure.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                self._probing = False
+            if self.state == "half_open" and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def release_probe(self):
+        """The probe was cancelled before it ran; let the next call probe instead"""
+        with self._lock:
+            if self.state == "half_open":
+                self._probing = False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != "closed":
+                print("  Translation circuit closed")
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == "half_open" or (
+                self.state == "closed" and self.consecutive_failures >= self.failure_threshold
+            ):
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                self.times_opened += 1
+                self._probing = False
+                print(f"  Translation circuit open for {self.reset_timeout:.0f}s "
+                      f"after {self.consecutive_failures} failures")
+
+    def stats(self):
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+        }
+
+
+class TranslationClient:
+    def __init__(self, max_concurrency=None, timeout=None, failure_threshold=None, reset_timeout=None):
+        self.max_concurrency = max_concurrency or TRANSLATION_MAX_CONCURRENCY
+        self.timeout = timeout or TRANSLATION_TIMEOUT
+        self.breaker = CircuitBreaker(
+            failure_threshold or TRANSLATION_BREAKER_FAILURES,
+            reset_timeout or TRANSLATION_BREAKER_RESET,
+        )
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="translate")
+
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.short_circuited = 0
+        self._latencies = deque(maxlen=1000)
+        self._running = {}  # id(call) -> start time, for calls on a worker
+        self._running_lock = threading.Lock()
+
+    def _run(self, call, fn, args):
+        with self._running_lock:
+            call["started"] = time.perf_counter()
+            self._running[id(call)] = call["started"]
+        call["event"].set()
+        try:
+            return fn(*args)
+        finally:
+            with self._running_lock:
+                self._running.pop(id(call), None)
+
+    def _wedged(self):
+        """True when every worker is stuck on a call past its deadline"""
+        now = time.perf_counter()
+        with self._running_lock:
+            hung = sum(1 for started in self._running.values() if now - started > self.timeout)
+        return hung >= self.max_concurrency
+
+    def _submit(self, fn, args):
+        self.calls += 1
+        if not self.breaker.allow():
+            self.short_circuited += 1
+            return None
+        # Only the single half-open probe gets through while the circuit isn't closed
+        call = {"event": threading.Event(), "started": None, "probe": self.breaker.state == "half_open"}
+        return self.executor.submit(self._run, call, fn, args), call
+
+    def _cancelled(self, call):
+        """A call that never ran reports nothing to the breaker, so free its probe slot"""
+        if call["probe"]:
+            self.breaker.release_probe()
+
+    def _wait(self, submitted):
+        """Wait for one submitted call within its deadline; raises on any failure"""
+        if submitted is None:
+            raise TranslationUnavailable("Translation circuit open")
+
+        future, call = submitted
+        # Time spent queued behind other calls doesn't count against the deadline,
+        # unless the workers are all held by hung calls and nothing can start
+        while not call["event"].wait(0.05):
+            if future.cancelled():
+                self._cancelled(call)
+                raise TranslationUnavailable("Translation client shut down")
+            if self._wedged() and future.cancel():
+                self._cancelled(call)
+                self.short_circuited += 1
+                raise TranslationUnavailable("Translation workers busy with timed-out calls")
+
+        try:
+            remaining = call["started"] + self.timeout - time.perf_counter()
+            result = future.result(timeout=max(0.0, remaining))
+        except FuturesTimeout:
+            # The worker thread can't be interrupted; it finishes in the background
+            self.timeouts += 1
+            self.breaker.record_failure()
+            raise TranslationUnavailable(f"Translation timed out after {self.timeout}s")
+        except Exception:
+            self.failures += 1
+            self.breaker.record_failure()
+            raise
+
+        self.successes += 1
+        self._latencies.append(time.perf_counter() - call["started"])
+        self.breaker.record_success()
+        return result
+
+    def call(self, fn, *args):
+        """Run fn(*args) with the concurrency limit, deadline and breaker applied"""
+        return self._wait(self._submit(fn, args))
+
+    def map(self, fn, items):
+        """Run fn(item) for each item concurrently; None where a call failed"""
+        submitted = [self._submit(fn, (item,)) for item in items]
+        results = []
+        for entry in submitted:
+            try:
+                results.append(self._wait(entry))
+            except Exception:
+                results.append(None)
+        return results
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        latencies = sorted(self._latencies)
+
+        def _pct(p):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000, 1)
+
+        return {
+            "circuit": self.breaker.stats(),
+            "max_concurrency": self.max_concurrency,
+            "timeout_seconds": self.timeout,
+            "calls": self.calls,
+            "successes": self.successes,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "short_circuited": self.short_circuited,
+            "latency_p50_ms": _pct(50),
+            "latency_p95_ms": _pct(95),
+        }
@@ -1,12 +1,60 @@
 # backend/nlp/translator.py
 from deep_translator import GoogleTranslator
+import hashlib
 import re
+import unicodedata
+
+from cache import PersistentCache
+from nlp.translation_client import TranslationClient
+from config import (
+    CACHE_DB_PATH,
+    TRANSLATION_CACHE,
+    TRANSLATION_CACHE_SIZE,
+    TRANSLATION_CACHE_TTL_DAYS,
+    TRANSLATION_CACHE_MAX_ROWS,
+)
+
+# GoogleTranslator rejects longer inputs
+MAX_TRANSLATE_CHARS = 4500
+
+# Unicode block (code point >> 7) -> language, for the scripts we detect
+_SCRIPT_BLOCKS = {
+    0x0900 >> 7: "hi",  # Devanagari (Hindi/Marathi)
+    0x0980 >> 7: "bn",  # Bengali
+    0x0A00 >> 7: "pa",  # Punjabi
+    0x0A80 >> 7: "gu",  # Gujarati
+    0x0B80 >> 7: "ta",  # Tamil
+    0x0C00 >> 7: "te",  # Telugu
+    0x0C80 >> 7: "kn",  # Kannada
+    0x0D00 >> 7: "ml",  # Malayalam
+    0x0600 >> 7: "ur",  # Urdu (Arabic block spans two 128-point blocks)
+    0x0680 >> 7: "ur",
+}
+# First character from any of the blocks above
+_SCRIPT_CHAR = re.compile("[\u0600-\u06FF\u0900-\u0AFF\u0B80-\u0D7F]")
+_LATIN_WORD = re.compile(r"[a-zA-Z]+")
+# detect_languages labels the provider has no source code for
+_PROVIDER_SOURCE = {"hi-Latn": "auto", "unknown": "auto"}
 
 
 class TranslatorService:
-    def __init__(self):
+    def __init__(self, use_cache=None):
         self.translator = GoogleTranslator(source="auto", target="en")
-        self._translators = {"en": self.translator}
+        self._translators = {("auto", "en"): self.translator}
+
+        use_cache = TRANSLATION_CACHE if use_cache is None else use_cache
+        self.cache = (
+            PersistentCache(
+                "translations", CACHE_DB_PATH,
+                memory_size=TRANSLATION_CACHE_SIZE,
+                ttl=TRANSLATION_CACHE_TTL_DAYS * 86400 if TRANSLATION_CACHE_TTL_DAYS else None,
+                max_rows=TRANSLATION_CACHE_MAX_ROWS or None,
+            )
+            if use_cache else None
+        )
+        # Concurrency limit, per-call deadline and circuit breaker for the provider
+        self.client = TranslationClient()
+        self.requests = 0
 
         # Common Hinglish words to detect Roman Hindi
         self.hinglish_words = {
@@ -37,68 +85,198 @@ class TranslatorService:
 
         print("  Translator initialized (deep-translator + Hinglish detection)")
 
-    def translate_to_english(self, text):
+    def translate_to_english(self, text, source="auto"):
+        return self.translate(text, target="en", source=source)
+
+    def _cache_key(self, text, source, target):
+        normalized = unicodedata.normalize("NFC", text).strip()
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+        return f"{digest}:{source}:{target}"
+
+    def _get_translator(self, source, target):
+        if (source, target) not in self._translators:
+            self._translators[(source, target)] = GoogleTranslator(source=source, target=target)
+        return self._translators[(source, target)]
+
+    def translate(self, text, target="en", source="auto"):
         if not text or len(text.strip()) < 2:
             return text
+
+        self.requests += 1
+        chunk = text[:MAX_TRANSLATE_CHARS]
+        key = self._cache_key(chunk, source, target)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
         try:
-            text = text[:4500]
-            translated = self.translator.translate(text)
-            return translated if translated else text
+            translated = self.client.call(self._get_translator(source, target).translate, chunk)
         except Exception:
+            # Failures are not cached so the next run retries
             return text
 
-    def translate(self, text, target="en"):
-        if not text or len(text.strip()) < 2:
-            return text
-        try:
-            if target not in self._translators:
-                self._translators[target] = GoogleTranslator(source="auto", target=target)
-            translated = self._translators[target].translate(text[:4500])
-            return translated if translated else text
-        except Exception:
+        if not translated:
             return text
+        if self.cache is not None:
+            self.cache.set(key, translated)
+        return translated
+
+    def _pack(self, texts):
+        """Greedily group texts into newline-joined requests under the provider limit"""
+        packs = []
+        current, size = [], 0
+        for text in texts:
+            if current and size + 1 + len(text) > MAX_TRANSLATE_CHARS:
+                packs.append(current)
+                current, size = [], 0
+            current.append(text)
+            size += len(text) + (1 if size else 0)
+        if current:
+            packs.append(current)
+        return packs
+
+    def translate_batch(self, texts, target="en", source="auto", languages=None):
+        """
+        Translate many texts with as few round trips as possible. Cached
+        texts are served locally; the rest are grouped by language and
+        packed one per line into requests under the 4500-char limit, then
+        split back by line. A pack whose line count doesn't come back
+        intact is retried per item.
+
+        With source="auto" each pack carries one language as its source,
+        from `languages` (labels as from detect_languages) or detected
+        here: the provider picks a single source language per request, so
+        a mixed pack garbles its minority lines.
+
+        Returns one string per input, the original text where translation
+        was skipped or failed.
+        """
+        results = list(texts)
+
+        # chunk -> input indices, for texts worth translating
+        pending = {}
+        for i, text in enumerate(texts):
+            if text and len(text.strip()) >= 2:
+                pending.setdefault(text[:MAX_TRANSLATE_CHARS], []).append(i)
+        if not pending:
+            return results
+
+        self.requests += sum(len(indices) for indices in pending.values())
+        keys = {chunk: self._cache_key(chunk, source, target) for chunk in pending}
+        translated = {}
+        if self.cache is not None:
+            cached = self.cache.get_many(list(keys.values()))
+            for chunk, key in keys.items():
+                if key in cached:
+                    translated[chunk] = cached[key]
+
+        # Newlines are the pack separator, so flatten them inside each text
+        misses = [chunk for chunk in pending if chunk not in translated]
+        flat = {chunk: " ".join(chunk.split()) for chunk in misses}
+        by_flat = {}
+        for chunk in misses:
+            by_flat.setdefault(flat[chunk], []).append(chunk)
+
+        # Provider source language -> flattened texts
+        groups = {}
+        if source == "auto" and by_flat:
+            if languages is None:
+                detected = self.detect_languages(list(by_flat))
+            else:
+                detected = [languages[pending[chunks[0]][0]] for chunks in by_flat.values()]
+            for text, language in zip(by_flat, detected):
+                text_source = _PROVIDER_SOURCE.get(language, language)
+                # Texts already in the target language are returned as they are
+                if text_source != target:
+                    groups.setdefault(text_source, []).append(text)
+        elif by_flat:
+            groups[source] = list(by_flat)
+
+        # Packs go out concurrently, within the client's concurrency limit
+        translators = {lang: self._get_translator(lang, target).translate for lang in groups}
+        packs = [(lang, pack) for lang, group in groups.items() for pack in self._pack(group)]
+        responses = self.client.map(
+            lambda request: translators[request[0]](request[1]),
+            [(lang, "\n".join(pack)) for lang, pack in packs],
+        )
+
+        fresh = {}
+        retry = []
+        for (lang, pack), response in zip(packs, responses):
+            lines = [line.strip() for line in response.split("\n")] if response else []
+            if len(lines) != len(pack) or not all(lines):
+                # Failed, or the provider merged / dropped lines: retry per text
+                retry.extend((lang, text) for text in pack)
+                continue
+            for text, line in zip(pack, lines):
+                for chunk in by_flat[text]:
+                    fresh[chunk] = line
+
+        if retry:
+            lines = self.client.map(lambda request: translators[request[0]](request[1]), retry)
+            for (_, text), line in zip(retry, lines):
+                if line:
+                    for chunk in by_flat[text]:
+                        fresh[chunk] = line
+
+        if self.cache is not None and fresh:
+            self.cache.set_many({keys[chunk]: value for chunk, value in fresh.items()})
+        translated.update(fresh)
+
+        for chunk, indices in pending.items():
+            if chunk in translated:
+                for i in indices:
+                    results[i] = translated[chunk]
+        return results
 
     def detect_language(self, text):
         """Improved language detection with Hinglish support"""
-        if not text:
-            return "unknown"
-
-        # Check for Indian scripts first
-        for char in text:
-            if "\u0900" <= char <= "\u097F":
-                return "hi"  # Devanagari (Hindi/Marathi)
-            if "\u0B80" <= char <= "\u0BFF":
-                return "ta"  # Tamil
-            if "\u0C00" <= char <= "\u0C7F":
-                return "te"  # Telugu
-            if "\u0980" <= char <= "\u09FF":
-                return "bn"  # Bengali
-            if "\u0A80" <= char <= "\u0AFF":
-                return "gu"  # Gujarati
-            if "\u0C80" <= char <= "\u0CFF":
-                return "kn"  # Kannada
-            if "\u0D00" <= char <= "\u0D7F":
-                return "ml"  # Malayalam
-            if "\u0A00" <= char <= "\u0A7F":
-                return "pa"  # Punjabi
-            if "\u0600" <= char <= "\u06FF":
-                return "ur"  # Urdu
-
-        # Check for Hinglish (Hindi written in Roman script)
-        words = set(re.findall(r'[a-zA-Z]+', text.lower()))
-        if words:
-            hinglish_count = len(words.intersection(self.hinglish_words))
-            hinglish_ratio = hinglish_count / len(words)
-
-            if hinglish_ratio > 0.2 and hinglish_count >= 2:
-                return "hi-Latn"  # Hinglish (Romanized Hindi)
-
-        # Default to English
-        ascii_count = sum(1 for c in text if c.isascii())
-        if ascii_count / max(len(text), 1) > 0.8:
-            return "en"
-
-        return "unknown"
+        return self.detect_languages([text])[0]
+
+    def detect_languages(self, texts):
+        """
+        Language label per text: Indian script first, then Hinglish
+        (Hindi written in Roman script), then English by ASCII share.
+        One regex search finds the first script character; its Unicode
+        block gives the language.
+        """
+        hinglish_words = self.hinglish_words
+        search_script = _SCRIPT_CHAR.search
+        find_words = _LATIN_WORD.findall
+
+        labels = []
+        for text in texts:
+            if not text:
+                labels.append("unknown")
+                continue
+
+            # Check for Indian scripts first
+            match = search_script(text)
+            if match:
+                labels.append(_SCRIPT_BLOCKS[ord(match.group()) >> 7])
+                continue
+
+            # Check for Hinglish (Hindi written in Roman script)
+            words = set(find_words(text.lower()))
+            if words:
+                hinglish_count = len(hinglish_words.intersection(words))
+                if hinglish_count >= 2 and hinglish_count / len(words) > 0.2:
+                    labels.append("hi-Latn")  # Hinglish (Romanized Hindi)
+                    continue
+
+            # Default to English
+            ascii_count = len(text.encode("ascii", "ignore"))
+            labels.append("en" if ascii_count / len(text) > 0.8 else "unknown")
+
+        return labels
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "client": self.client.stats(),
+            "cache": self.cache.stats() if self.cache is not None else None,
+        }
 
     def detect_and_translate(self, text):
         language = self.detect_language(text)
@@ -2,6 +2,7 @@
 """
 Orchestrates all scrapers — runs them in parallel and combines results.
 """
+import threading
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -13,14 +14,24 @@ class ScraperManager:
         from scrapers.youtube_scraper import YouTubeScraper
         from scrapers.reddit_scraper import RedditScraper
         from scrapers.news_scraper import NewsScraper
-        from scrapers.twitter_scraper import TwitterScraper
 
         self.youtube = YouTubeScraper()
         self.reddit = RedditScraper()
         self.news = NewsScraper()
-        self.twitter = TwitterScraper()
-
-        print("  All scrapers ready!\n")
+        self._twitter = None
+        self._twitter_lock = threading.Lock()
+
+        print("  All scrapers ready! (Twitter loads on first use)\n")
+
+    @property
+    def twitter(self):
+        """snscrape is slow to import and rarely returns data, so build it on first use"""
+        if self._twitter is None:
+            with self._twitter_lock:
+                if self._twitter is None:
+                    from scrapers.twitter_scraper import TwitterScraper
+                    self._twitter = TwitterScraper()
+        return self._twitter
 
     def scrape_all(self, keywords=None):
         """Run all scrapers in parallel and combine results"""
@@ -44,6 +44,10 @@ class TwitterScraper:
                     "source": "twitter",
                     "url": tweet.url if hasattr(tweet, "url") else "",
                     "location": tweet.user.location if tweet.user and tweet.user.location else "",
+                    "coordinates": (
+                        [tweet.coordinates.latitude, tweet.coordinates.longitude]
+                        if getattr(tweet, "coordinates", None) else None
+                    ),
                     "language": tweet.lang if hasattr(tweet, "lang") else "unknown",
                     "metadata": {
                         "likes": tweet.likeCount if hasattr(tweet, "likeCount") else 0,
@@ -2,49 +2,237 @@
 """
 Shared singleton service registry — initialized once at startup.
 All heavy NLP models and services are loaded here and shared across all requests.
+
+Independent services load concurrently; initialize() returns as soon as the
+sentiment path is ready and the rest keep loading in the background.
+Rarely used services are built on first access.
 """
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _load_summarizer():
+    from nlp.summarizer import Summarizer
+    return Summarizer()
+
+
+def _load_entity_extractor():
+    from nlp.entities import EntityExtractor
+    return EntityExtractor()
+
+
+def _load_embeddings():
+    from nlp.embeddings import EmbeddingService
+    return EmbeddingService()
+
+
+def _load_topic_clusters():
+    from nlp.topic_clusters import TopicClusterer
+    from database.mongo_client import db
+
+    clusterer = TopicClusterer(Services.embeddings)
+    if db._initialized:
+        clusterer.load(db.load_topic_clusters())
+    return clusterer
+
+
+class _LazyService:
+    """Class attribute that builds its service on first access"""
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner):
+        return owner._get_lazy(self.name, self.loader)
 
 
 class Services:
     analyzer = None
+    batcher = None
+    inference_pool = None
     topic_extractor = None
     translator = None
     mapper = None
     booth_mapper = None
-    summarizer = None
     scraper_manager = None
 
+    # Loaded on first use
+    summarizer = _LazyService(_load_summarizer)
+    entity_extractor = _LazyService(_load_entity_extractor)
+    embeddings = _LazyService(_load_embeddings)
+    topic_clusters = _LazyService(_load_topic_clusters)
+
+    # name -> {"state": lazy|loading|ready|failed, "load_seconds": float}
+    status = {}
+    _lazy_instances = {}
+    _lazy_locks = {}
+    _lazy_lock = threading.Lock()
+    _futures = {}
+    _executor = None
+
     @classmethod
-    def initialize(cls):
-        from nlp.translator import TranslatorService
+    def _load(cls, name, loader):
+        """Run a loader, record state and load time, and publish the result"""
+        cls.status[name] = {"state": "loading", "load_seconds": None}
+        start = time.perf_counter()
+        try:
+            instance = loader()
+        except Exception as e:
+            cls.status[name] = {
+                "state": "failed",
+                "load_seconds": round(time.perf_counter() - start, 2),
+                "error": str(e),
+            }
+            print(f"  {name} failed to load: {e}")
+            raise
+
+        cls.status[name] = {"state": "ready", "load_seconds": round(time.perf_counter() - start, 2)}
+        print(f"  + {name} ready ({cls.status[name]['load_seconds']}s)")
+        return instance
+
+    @classmethod
+    def _get_lazy(cls, name, loader):
+        instance = cls._lazy_instances.get(name)
+        if instance is not None:
+            return instance
+
+        # One lock per service, so a loader can use other lazy services
+        # (topic_clusters needs embeddings) and slow loads don't block the rest
+        with cls._lazy_lock:
+            lock = cls._lazy_locks.setdefault(name, threading.Lock())
+        with lock:
+            if name not in cls._lazy_instances:
+                cls._lazy_instances[name] = cls._load(name, loader)
+            return cls._lazy_instances[name]
+
+    @classmethod
+    def _load_sentiment(cls):
         from nlp.sentiment import SentimentAnalyzer
+        from nlp.micro_batcher import MicroBatcher
+        from config import MICROBATCH_ENABLED, INFERENCE_POOL_SIZE
+
+        analyzer = SentimentAnalyzer(translator=cls.translator)
+        analyzer.warmup()
+
+        if INFERENCE_POOL_SIZE > 1:
+            from nlp.inference_pool import InferencePool
+            cls.inference_pool = InferencePool(INFERENCE_POOL_SIZE, backend=analyzer.backend)
+            cls.inference_pool.start()
+            analyzer.pool = cls.inference_pool
+        if MICROBATCH_ENABLED:
+            cls.batcher = MicroBatcher(analyzer)
+            cls.batcher.start()
+
+        cls.analyzer = analyzer
+        return analyzer
+
+    @classmethod
+    def _load_topic_extractor(cls):
         from nlp.topics import TopicExtractor
+        from config import TOPIC_MODE
+
+        # Embedding-based modes share the encoder with the rest of the app
+        embeddings = cls.embeddings if TOPIC_MODE in ("multilingual", "guided") else None
+        extractor = TopicExtractor(translator=cls.translator, embeddings=embeddings)
+        extractor.warmup()
+        cls.topic_extractor = extractor
+        return extractor
+
+    @classmethod
+    def _load_mapper(cls):
         from geo.constituency_mapper import ConstituencyMapper
+        cls.mapper = ConstituencyMapper()
+        return cls.mapper
+
+    @classmethod
+    def _load_booth_mapper(cls):
         from geo.booth_mapper import BoothMapper
-        from nlp.summarizer import Summarizer
+        cls.booth_mapper = BoothMapper()
+        return cls.booth_mapper
+
+    @classmethod
+    def _load_scraper_manager(cls):
         from scrapers.scraper_manager import ScraperManager
+        cls.scraper_manager = ScraperManager()
+        return cls.scraper_manager
 
-        print("  [1/7] Translator...")
-        cls.translator = TranslatorService()
+    @classmethod
+    def initialize(cls):
+        from nlp.translator import TranslatorService
 
-        print("  [2/7] Sentiment model...")
-        cls.analyzer = SentimentAnalyzer(translator=cls.translator)
+        # Import model modules up front so worker threads don't race on imports
+        import nlp.sentiment  # noqa: F401
+        import nlp.topics  # noqa: F401
 
-        print("  [3/7] Topic extractor...")
-        cls.topic_extractor = TopicExtractor(translator=cls.translator)
+        for name in ("summarizer", "entity_extractor", "embeddings", "topic_clusters"):
+            cls.status.setdefault(name, {"state": "lazy", "load_seconds": None})
 
-        print("  [4/7] Constituency mapper...")
-        cls.mapper = ConstituencyMapper()
+        # Everything else depends on the translator, and it is cheap
+        cls.translator = cls._load("translator", TranslatorService)
 
-        print("  [5/7] Booth mapper...")
-        cls.booth_mapper = BoothMapper()
+        loaders = {
+            "analyzer": cls._load_sentiment,
+            "topic_extractor": cls._load_topic_extractor,
+            "mapper": cls._load_mapper,
+            "booth_mapper": cls._load_booth_mapper,
+            "scraper_manager": cls._load_scraper_manager,
+        }
+        for name in loaders:
+            cls.status[name] = {"state": "pending", "load_seconds": None}
 
-        print("  [6/7] Summarizer...")
-        cls.summarizer = Summarizer()
+        cls._executor = ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix="service-init")
+        for name, loader in loaders.items():
+            cls._futures[name] = cls._executor.submit(cls._load, name, loader)
 
-        print("  [7/7] Scraper manager...")
-        cls.scraper_manager = ScraperManager()
+        # Accept traffic once the sentiment path is up
+        cls.wait_for("analyzer")
+        cls._executor.shutdown(wait=False)
+
+    @classmethod
+    def wait_for(cls, *names, timeout=None):
+        """Block until the named background services have loaded"""
+        for name in names:
+            future = cls._futures.get(name)
+            if future is not None:
+                future.result(timeout=timeout)
+
+    @classmethod
+    def shutdown(cls):
+        if cls.batcher is not None:
+            cls.batcher.stop()
+        if cls.inference_pool is not None:
+            cls.inference_pool.shutdown()
+        if cls.translator is not None:
+            cls.translator.client.shutdown()
 
     @classmethod
     def is_ready(cls):
         return cls.analyzer is not None
+
+    @classmethod
+    def readiness(cls):
+        return {
+            "ready": cls.is_ready(),
+            "services": dict(cls.status),
+        }
+
+    @classmethod
+    def metrics(cls):
+        from compute import compute
+        return {
+            "compute": compute.stats(),
+            "sentiment": cls.analyzer.stats() if cls.analyzer else None,
+            "microbatch": cls.batcher.stats() if cls.batcher else None,
+            "translation": cls.translator.stats() if cls.translator else None,
+            "embeddings": (
+                cls._lazy_instances["embeddings"].stats() if "embeddings" in cls._lazy_instances else None
+            ),
+            "topic_clusters": (
+                cls._lazy_instances["topic_clusters"].stats() if "topic_clusters" in cls._lazy_instances else None
+            ),
+        }
@@ -0,0 +1,2 @@
+# backend/tests/__init__.py
+# Empty file — makes tests a Python package
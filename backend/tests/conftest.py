@@ -0,0 +1,13 @@
+# backend/tests/conftest.py
+"""
+Shared test setup. Backend modules import each other as top-level modules
+("from config import ..."), so tests run with backend/ on sys.path, the same
+as the app under uvicorn.
+
+Run from backend/:
+    python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,106 @@
+# backend/tests/test_booth_store.py
+import sys
+
+import pytest
+
+from geo.booth_store import BoothStore
+
+BOOTHS = {
+    "Varanasi": [
+        {"id": "VNS-001", "name": "Dashashwamedh Ward", "area": "Ghats", "lat": 25.30, "lng": 83.01},
+        {"id": "VNS-002", "name": "Assi Ward", "area": "Ghats", "lat": 25.28, "lng": 83.00},
+        {"id": "VNS-003", "name": "सिगरा वार्ड", "area": "Sigra", "lat": 25.32, "lng": 82.98},
+    ],
+    "Lucknow": [
+        {"id": "LKO-001", "name": "Hazratganj", "area": "Central"},
+        {"id": "LKO-002", "name": "Aminabad", "area": "Central"},
+    ],
+}
+
+
+@pytest.fixture
+def store():
+    return BoothStore.from_records(BOOTHS)
+
+
+def test_columns_are_compact_arrays(store):
+    assert len(store) == 5
+    assert store.ids.dtype.kind == "S" and store.names.dtype.kind == "S"
+    assert store.area_names == ["Central", "Ghats", "Sigra"]
+    assert store.constituency_names == ["Lucknow", "Varanasi"]
+
+
+def test_get_by_id(store):
+    assert store.get("VNS-003") == {
+        "id": "VNS-003", "name": "सिगरा वार्ड", "area": "Sigra", "constituency": "Varanasi",
+        "lat": 25.32, "lng": 82.98,
+    }
+    assert store.get("LKO-001") == {"id": "LKO-001", "name": "Hazratganj", "area": "Central", "constituency": "Lucknow"}
+    assert store.get("VNS-0031") is None
+    assert store.get("VNS-00") is None
+    assert store.get("") is None
+
+
+def test_id_index_finds_every_row_and_first_duplicate_wins():
+    ids = [f"B-{i}" for i in range(2000)] + ["B-7"]
+    store = BoothStore(ids, ["Patna"] * len(ids), [str(i) for i in range(len(ids))], [""] * len(ids))
+    assert (store.id_table >= 0).sum() == 2001 and len(store.id_table) >= 2 * 2001
+    assert all(store.row_of(f"B-{i}") == i for i in range(2000))
+    assert store.get("B-7")["name"] == "7"
+    assert store.row_of("B-2000") is None
+
+
+def test_get_returns_new_dicts(store):
+    store.get("VNS-001")["name"] = "changed"
+    assert store.get("VNS-001")["name"] == "Dashashwamedh Ward"
+
+
+def test_booths_and_count_per_constituency(store):
+    assert [b["id"] for b in store.booths("Varanasi")] == ["VNS-001", "VNS-002", "VNS-003"]
+    assert store.count("Lucknow") == 2
+    assert store.booths("Patna Sahib") == [] and store.count("Patna Sahib") == 0
+
+
+def test_assign_is_deterministic_and_stays_in_constituency(store):
+    texts = [f"post number {i}" for i in range(50)]
+    first = [store.assign("Varanasi", text) for text in texts]
+    assert first == [store.assign("Varanasi", text) for text in texts]
+    assert set(first) == {"VNS-001", "VNS-002", "VNS-003"}
+
+    rebuilt = BoothStore.from_records(BOOTHS)
+    assert first == [rebuilt.assign("Varanasi", text) for text in texts]
+
+
+def test_assign_nearest_booth_for_coordinates(store):
+    assert store.assign("Varanasi", "anything", coordinates=(25.281, 83.001)) == "VNS-002"
+    assert store.assign("Varanasi", "anything", coordinates=(25.321, 82.979)) == "VNS-003"
+    # No booth locations: falls back to the text hash
+    assert store.assign("Lucknow", "post", coordinates=(26.85, 80.95)) == store.assign("Lucknow", "post")
+
+
+def test_assign_unknown_constituency(store):
+    assert store.assign("Nowhere", "post") is None
+
+
+def test_from_csv(tmp_path):
+    path = tmp_path / "booths.csv"
+    path.write_text(
+        "id,constituency,name,area,lat,lng\n"
+        "B-2,Patna Sahib,Gandhi Maidan,,25.61,85.14\n"
+        "B-1,Patna Sahib,Kankarbagh,South,,\n",
+        encoding="utf-8",
+    )
+    store = BoothStore.from_csv(str(path))
+    assert store.get("B-2") == {
+        "id": "B-2", "name": "Gandhi Maidan", "area": "", "constituency": "Patna Sahib", "lat": 25.61, "lng": 85.14,
+    }
+    assert "lat" not in store.get("B-1")
+    assert store.assign("Patna Sahib", "x", coordinates=(25.6, 85.1)) == "B-2"
+
+
+def test_from_csv_without_pandas(tmp_path, monkeypatch):
+    path = tmp_path / "booths.csv"
+    path.write_text("id,constituency,name,area\nB-1,Lucknow,Hazratganj,Central\n", encoding="utf-8")
+    monkeypatch.setitem(sys.modules, "pandas", None)
+    store = BoothStore.from_csv(str(path))
+    assert store.get("B-1") == {"id": "B-1", "name": "Hazratganj", "area": "Central", "constituency": "Lucknow"}
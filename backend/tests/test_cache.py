@@ -0,0 +1,93 @@
+# backend/tests/test_cache.py
+import time
+
+import pytest
+
+from cache import LRUCache, PersistentCache, TTLCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    lru = LRUCache(max_size=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1    # "b" is now the oldest
+    lru.set("c", 3)
+    assert lru.get("b") is None
+    assert lru.get("a") == 1 and lru.get("c") == 3
+    assert len(lru) == 2
+
+
+def test_ttl_cache_expiry_and_invalidate():
+    ttl = TTLCache()
+    ttl.set("dashboard:stats", 1, ttl=60)
+    ttl.set("dashboard:trend", 2, ttl=-1)
+    assert ttl.get("dashboard:stats") == 1
+    assert ttl.get("dashboard:trend") is None
+
+    ttl.invalidate("stats")
+    assert ttl.get("dashboard:stats") is None
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "cache.db")
+
+
+def test_persistent_cache_survives_restart(db_path):
+    PersistentCache("results", db_path).set_many({"a": {"label": "positive"}, "b": [1, 2]})
+
+    reopened = PersistentCache("results", db_path)
+    assert reopened.get_many(["a", "b", "c"]) == {"a": {"label": "positive"}, "b": [1, 2]}
+    stats = reopened.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (0, 2, 1)
+
+    # Disk hits are promoted to memory
+    assert reopened.get("a") == {"label": "positive"}
+    assert reopened.stats()["memory_hits"] == 1
+
+
+def test_get_many_counts_repeated_keys_once(db_path):
+    PersistentCache("results", db_path).set("disk", 1)
+    cache = PersistentCache("results", db_path)
+    cache.set("memory", 2)
+
+    found = cache.get_many(["memory", "memory", "disk", "disk", "disk", "none", "none"])
+    assert found == {"memory": 2, "disk": 1}
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_rate"] == round(2 / 3, 4)
+
+
+def test_ttl_expires_entries_in_both_tiers(db_path):
+    cache = PersistentCache("results", db_path, ttl=0.05)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert PersistentCache("results", db_path, ttl=0.05).get("a") is None
+
+
+def test_max_rows_prunes_oldest_rows(db_path):
+    cache = PersistentCache("results", db_path, memory_size=10, max_rows=50)
+    for i in range(150):
+        cache.set(f"k{i}", i)
+        time.sleep(0.0005)
+    cache._prune()
+
+    rows = cache._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    assert rows == 50
+    assert cache.evicted == 100
+
+    reopened = PersistentCache("results", db_path)
+    assert reopened.get("k0") is None
+    assert reopened.get("k149") == 149
+
+
+def test_memory_only_when_store_unavailable(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = PersistentCache("results", str(blocker / "cache.db"))
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.stats()["persistent"] is False
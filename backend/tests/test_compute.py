@@ -0,0 +1,41 @@
+# backend/tests/test_compute.py
+import threading
+
+import pytest
+
+from compute import ComputeBudget, InferenceBusy
+
+
+@pytest.fixture
+def budget():
+    budget = ComputeBudget()
+    yield budget
+    budget.executor.shutdown(wait=False)
+
+
+def test_run_uses_inference_threads_and_nests_inline(budget):
+    def inner():
+        return threading.current_thread().name
+
+    def outer():
+        # A nested run must not wait on the executor it is already running on
+        return threading.current_thread().name, budget.run(inner)
+
+    outer_thread, inner_thread = budget.run(outer)
+    assert outer_thread.startswith("inference") and inner_thread == outer_thread
+    assert budget.stats()["model_calls"] == 1
+
+
+def test_admission_rejects_past_the_limit(budget):
+    budget.max_pending = 1
+    budget._admission = threading.BoundedSemaphore(1)
+
+    with budget.admit():
+        with pytest.raises(InferenceBusy):
+            with budget.admit():
+                pass
+        assert budget.in_flight == 1
+
+    with budget.admit():
+        pass
+    assert (budget.admitted, budget.rejected, budget.in_flight) == (2, 1, 0)
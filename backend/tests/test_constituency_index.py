@@ -0,0 +1,80 @@
+# backend/tests/test_constituency_index.py
+import json
+import random
+
+import pytest
+
+from geo.constituency_index import ConstituencyIndex
+
+
+@pytest.fixture(scope="module")
+def index():
+    return ConstituencyIndex()
+
+
+def write_dataset(tmp_path, constituencies, version="test"):
+    path = tmp_path / "constituencies.json"
+    path.write_text(json.dumps({"version": version, "constituencies": constituencies}), encoding="utf-8")
+    return str(path)
+
+
+def test_loads_bundled_dataset(index):
+    assert len(index) == 10
+    assert index.version != "sample"
+
+
+def test_get_by_name_id_and_alias(index):
+    assert index.get("Varanasi")["id"] == "varanasi"
+    assert index.get("  BANARAS ")["name"] == "Varanasi"
+    assert index.get("patna-sahib")["state"] == "Bihar"
+    assert index.get("लखनऊ")["name"] == "Lucknow"
+    assert index.get("Atlantis") is None and index.get(None) is None
+
+
+def test_nearest(index):
+    (record, km), = index.nearest(25.32, 83.01)
+    assert record["name"] == "Varanasi" and km < 10
+    names = [r["name"] for r, _ in index.nearest(28.5, 77.3, k=3)]
+    assert names[0] == "New Delhi" and len(names) == 3
+
+
+def test_nearest_matches_brute_force_on_a_large_grid(tmp_path):
+    rng = random.Random(7)
+    records = [
+        {"name": f"C{i}", "lat": rng.uniform(8, 35), "lng": rng.uniform(68, 97)}
+        for i in range(3000)
+    ]
+    index = ConstituencyIndex(write_dataset(tmp_path, records), grid_degrees=0.5)
+    for _ in range(200):
+        lat, lng = rng.uniform(5, 38), rng.uniform(65, 100)
+        every = index._distances_km(lat, lng, list(range(len(index))))
+        expected = sorted(range(len(index)), key=lambda row: every[row])[:3]
+        assert [r["id"] for r, _ in index.nearest(lat, lng, k=3)] == [index.ids[row] for row in expected]
+
+
+def test_locate_prefers_the_containing_polygon(tmp_path):
+    square = [[80.0, 25.0], [81.0, 25.0], [81.0, 26.0], [80.0, 26.0]]
+    path = write_dataset(tmp_path, [
+        {"id": "big", "name": "Big", "lat": 25.9, "lng": 80.9, "polygon": square},
+        {"id": "near", "name": "Near", "lat": 25.1, "lng": 80.05},
+    ])
+    index = ConstituencyIndex(path)
+    # Closer to Near's centroid, but inside Big's polygon
+    assert index.locate(25.12, 80.06)["id"] == "big"
+    assert index.locate(24.5, 80.0)["id"] == "near"
+    assert index.locate(10.0, 70.0, max_km=50) is None
+
+
+def test_falls_back_to_sample_constituencies(tmp_path):
+    index = ConstituencyIndex(str(tmp_path / "missing.json"))
+    assert index.version == "sample"
+    assert index.get("Varanasi")["id"] == "varanasi"
+
+
+def test_skips_incomplete_entries_and_slugs_ids(tmp_path):
+    index = ConstituencyIndex(write_dataset(tmp_path, [
+        {"name": "Mumbai South", "lat": 18.93, "lng": 72.83},
+        {"name": "No Centroid"},
+    ]))
+    assert len(index) == 1
+    assert index.get("mumbai-south")["name"] == "Mumbai South"
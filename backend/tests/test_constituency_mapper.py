@@ -0,0 +1,57 @@
+# backend/tests/test_constituency_mapper.py
+import pytest
+
+from geo.constituency_mapper import ConstituencyMapper
+
+
+@pytest.fixture(scope="module")
+def mapper():
+    return ConstituencyMapper()
+
+
+def test_keywords_match_whole_words_only(mapper):
+    assert mapper.map_text_to_constituency("Water supply is terrible in Varanasi") == "Varanasi"
+    assert mapper.map_text_to_constituency("Bengaluru traffic is awful") == "Bangalore South"
+    assert mapper.map_text_to_constituency("Random comment about nothing specific") == "unknown"
+
+
+def test_specific_place_beats_state_and_national(mapper):
+    assert mapper.map_text_to_constituency("Modi should visit Patna") == "Patna Sahib"
+    assert mapper.map_text_to_constituency("Bihar floods, Modi silent") == "Patna Sahib"
+    assert mapper.map_text_to_constituency("The government failed again") == "New Delhi"
+
+
+def test_user_location_breaks_ties(mapper):
+    assert mapper.map_text_to_constituency("Bihar vs Gujarat growth", location="Ahmedabad") == "Gandhinagar"
+    assert mapper.map_text_to_constituency("Bihar vs Gujarat growth") == "Patna Sahib"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("UP elections: big rally today", "Lucknow"),
+    ("Fed up with the water supply", "unknown"),
+    ("We set up camp in Bihar. UP next", "Patna Sahib"),
+    ("They set up a stall in Bihar, then up and left; UP", "Patna Sahib"),
+])
+def test_up_only_counts_where_written_in_capitals(mapper, text, expected):
+    assert mapper.map_text_to_constituency(text) == expected
+    hits = mapper.find_hits(text)
+    assert all(text[h["start"]:h["end"]] == "UP" for h in hits if h["keyword"] == "up")
+
+
+def test_find_hits_reports_offsets_and_tiers(mapper):
+    text = "Modi in Varanasi"
+    hits = mapper.find_hits(text, location="Lucknow")
+    assert [(h["keyword"], h["source"], text[h["start"]:h["end"]] if h["source"] == "text" else None)
+            for h in hits] == [("modi", "text", "Modi"), ("varanasi", "text", "Varanasi"), ("lucknow", "location", None)]
+    assert hits[1]["tier"] > hits[0]["tier"]
+
+
+def test_map_texts_prefers_geotags(mapper):
+    texts = ["Mumbai floods", "Mumbai floods", "nothing here"]
+    coordinates = [None, None, (25.32, 83.01)]
+    assert mapper.map_texts(texts, coordinates=coordinates) == ["Mumbai North", "Mumbai North", "Varanasi"]
+
+
+def test_map_batch_sets_constituency(mapper):
+    items = [{"text": "Chennai rains", "location": ""}, {"text": "", "location": "Kolkata"}]
+    assert [item["constituency"] for item in mapper.map_batch(items)] == ["Chennai South", "Kolkata North"]
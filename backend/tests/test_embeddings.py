@@ -0,0 +1,55 @@
+# backend/tests/test_embeddings.py
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from nlp.embeddings import EmbeddingService
+
+
+class CountingEncoder:
+    """Stands in for SentenceTransformer: a hashed one-hot vector per text"""
+
+    def __init__(self, name):
+        self.encoded = []
+
+    def get_sentence_embedding_dimension(self):
+        return 16
+
+    def encode(self, texts, **kwargs):
+        self.encoded.extend(texts)
+        vectors = np.zeros((len(texts), 16), dtype=np.float32)
+        for row, text in enumerate(texts):
+            vectors[row, sum(map(ord, text)) % 16] = 1.0
+        return vectors
+
+
+@pytest.fixture
+def service(monkeypatch):
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = CountingEncoder
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    return EmbeddingService("fake", cache_size=4, phrase_cache_size=2)
+
+
+def test_encode_caches_and_dedupes(service):
+    vectors = service.encode(["one", "two", "one"])
+    assert vectors.shape == (3, 16)
+    assert service.encode(["two"]).tolist() == [vectors[1].tolist()]
+    assert service.model.encoded == ["one", "two"]
+
+
+def test_keybert_candidates_do_not_evict_documents(service):
+    docs = ["first document", "second document"]
+    service.encode(docs)
+
+    # KeyBERT embeds its documents, then every candidate phrase
+    assert service.embed(docs).shape == (2, 16)
+    service.embed([f"phrase {i}" for i in range(20)])
+
+    assert len(service.cache) == 2 and len(service.phrase_cache) == 2
+    service.model.encoded.clear()
+    service.encode(docs)
+    assert service.model.encoded == []
+    assert service.stats()["phrase_cache_entries"] == 2
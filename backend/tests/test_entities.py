@@ -0,0 +1,14 @@
+# backend/tests/test_entities.py
+from nlp.entities import EntityExtractor
+
+
+def test_gazetteer_mode_without_ner():
+    extractor = EntityExtractor(mode="gazetteer")
+    texts = ["Rahul Gandhi slammed the BJP", "ok", "Rahul Gandhi slammed the BJP"]
+    first, short, repeat = extractor.extract_entities_batch(texts)
+
+    assert [e["id"] for e in first] == ["person:rahul-gandhi", "party:bjp"]
+    assert short == []
+    assert repeat == first and repeat is not first
+    assert extractor.nlp is None   # spaCy is never loaded without use_ner
+    assert len(extractor.cache) == 1
@@ -0,0 +1,52 @@
+# backend/tests/test_gazetteer.py
+import json
+
+import pytest
+
+from nlp.gazetteer import Gazetteer
+
+
+@pytest.fixture(scope="module")
+def gazetteer():
+    return Gazetteer()
+
+
+def ids(gazetteer, text):
+    return [e["id"] for e in gazetteer.extract(text)]
+
+
+def test_bundled_gazetteer_loads(gazetteer):
+    assert gazetteer.version
+    assert len(gazetteer) > 50
+
+
+def test_roman_and_devanagari_aliases_share_an_id(gazetteer):
+    assert ids(gazetteer, "PM Modi spoke") == ids(gazetteer, "मोदी जी ने कहा") == ["person:narendra-modi"]
+
+
+def test_longest_alias_wins(gazetteer):
+    entities = gazetteer.extract("Rahul Gandhi and Sonia Gandhi")
+    assert [e["id"] for e in entities] == ["person:rahul-gandhi", "person:sonia-gandhi"]
+    assert [e["text"] for e in entities] == ["Rahul Gandhi", "Sonia Gandhi"]
+
+
+def test_case_sensitive_acronyms(gazetteer):
+    assert "party:aap" in ids(gazetteer, "AAP vs BJP in Delhi")
+    assert "party:aap" not in ids(gazetteer, "aap kaise ho?")
+
+
+def test_entities_are_unique_in_text_order(gazetteer):
+    found = gazetteer.extract("BJP rally. The BJP and Congress")
+    assert [e["id"] for e in found] == ["party:bjp", "party:inc"]
+    assert found[0]["name"] == "Bharatiya Janata Party" and found[0]["type"] == "ORG"
+
+
+def test_custom_file_and_duplicate_aliases(tmp_path):
+    path = tmp_path / "gazetteer.json"
+    path.write_text(json.dumps({"version": "t", "entities": [
+        {"id": "a", "name": "Alpha", "aliases": ["shared"], "type": "ORG"},
+        {"id": "b", "name": "Beta", "aliases": ["shared"], "case_sensitive": ["BT"]},
+    ]}), encoding="utf-8")
+    gazetteer = Gazetteer(str(path))
+    assert gazetteer.find("shared beta BT bt") == [(0, 6, "a"), (7, 11, "b"), (12, 14, "b")]
+    assert gazetteer.entities["b"]["type"] == "MISC"
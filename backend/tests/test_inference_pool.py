@@ -0,0 +1,63 @@
+# backend/tests/test_inference_pool.py
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nlp import inference_pool
+from nlp.inference_pool import InferencePool
+
+
+class ShardRecorder:
+    """Stands in for a worker's analyzer: tags outputs and records each shard"""
+
+    def __init__(self):
+        self.shards = []
+
+    def _run_model(self, texts, batch_size, bucket_by_length):
+        self.shards.append(list(texts))
+        return [f"scored:{text}" for text in texts]
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    recorder = ShardRecorder()
+    monkeypatch.setattr(inference_pool, "_worker_analyzer", recorder)
+    pool = InferencePool(3, min_batch=1)
+    # Threads instead of spawned processes; the shard/merge logic is the same
+    pool.executor = ThreadPoolExecutor(max_workers=3)
+    yield pool, recorder
+    pool.shutdown()
+
+
+def test_shards_cover_every_index_once_and_balance_length():
+    pool = InferencePool(3)
+    texts = ["x" * n for n in (90, 10, 40, 50, 30, 60, 20, 80, 70)]
+    shards = pool._shards(texts)
+
+    assert len(shards) == 3
+    assert sorted(i for shard in shards for i in shard) == list(range(len(texts)))
+    assert all(shard == sorted(shard) for shard in shards)
+    loads = [sum(len(texts[i]) for i in shard) for shard in shards]
+    # Longest-first greedy placement: shards differ by at most one text
+    assert max(loads) - min(loads) <= max(len(text) for text in texts)
+    assert sum(loads) == sum(len(text) for text in texts)
+
+
+def test_fewer_texts_than_workers():
+    assert InferencePool(4)._shards(["a", "bb"]) == [[1], [0]]
+    assert InferencePool(4)._shards([]) == []
+
+
+def test_run_merges_shards_back_in_input_order(pool):
+    pool, recorder = pool
+    texts = [f"text {i} " + "x" * (i * 7 % 11) for i in range(20)]
+
+    assert pool.run(texts, batch_size=8) == [f"scored:{text}" for text in texts]
+    assert len(recorder.shards) == 3
+    assert sorted(text for shard in recorder.shards for text in shard) == sorted(texts)
+    assert pool.stats()["texts"] == 20
+
+
+def test_run_requires_start():
+    with pytest.raises(RuntimeError):
+        InferencePool(2).run(["a"])
@@ -0,0 +1,63 @@
+# backend/tests/test_keyword_matcher.py
+import pytest
+
+from nlp.keyword_matcher import KeywordMatcher
+
+
+@pytest.fixture
+def matcher():
+    return KeywordMatcher(["gas", "water", "water supply", "power", "war", "विकास", "price rise", "supply"])
+
+
+def test_matches_whole_words_only(matcher):
+    assert matcher.match("Las Vegas trip while the water supply failed") == ["water", "water supply", "supply"]
+    assert matcher.match("No warfare here, just a war of words") == ["war"]
+    assert matcher.match("Gasoline and gas prices") == ["gas"]
+
+
+def test_case_insensitive_and_hyphens(matcher):
+    assert matcher.match("POWER cuts and the price-rise hurt everyone") == ["power", "price rise"]
+
+
+def test_punctuation_breaks_multi_word_keywords(matcher):
+    assert matcher.match("price, rise") == []
+    assert matcher.match("water. supply") == ["water", "supply"]
+
+
+def test_devanagari_words(matcher):
+    assert matcher.match("विकास नहीं विकासशील") == ["विकास"]
+    assert matcher.match("विकासशील देश") == []
+
+
+def test_find_all_offsets(matcher):
+    text = "Water supply, gas"
+    hits = matcher.find_all(text)
+    assert sorted((text[s:e], k) for s, e, k in hits) == [
+        ("Water", "water"), ("Water supply", "water supply"), ("gas", "gas"), ("supply", "supply"),
+    ]
+
+
+def test_find_tokens_and_longest(matcher):
+    hits = matcher.find_tokens("the water supply and gas")
+    assert KeywordMatcher.longest(hits) == [(1, 3, "water supply"), (4, 5, "gas")]
+    assert KeywordMatcher.longest(matcher.find_all("water supply")) == [(0, 12, "water supply")]
+
+
+def test_written_tokens_align_with_find_tokens(matcher):
+    text = "Fed up; UP water"
+    written = KeywordMatcher.written_tokens(text)
+    (start, end, _), = matcher.find_tokens(text)
+    assert written[start:end] == ["water"]
+    assert written[:4] == ["Fed", "up", "", "UP"]
+
+
+def test_overlapping_keywords_via_failure_links():
+    matcher = KeywordMatcher(["a b c", "b c d", "c"])
+    assert sorted(k for _, _, k in matcher.find_all("a b c d")) == ["a b c", "b c d", "c"]
+
+
+def test_top_n_empty_and_batch(matcher):
+    assert matcher.match("gas water power", top_n=2) == ["gas", "water"]
+    assert matcher.match("") == [] and matcher.find_all("") == [] and matcher.find_tokens("") == []
+    assert matcher.match_batch(["gas", "nothing"]) == [["gas"], []]
+    assert len(KeywordMatcher(["Gas", "gas ", "", "  "])) == 1
@@ -0,0 +1,43 @@
+# backend/tests/test_lexicon.py
+import pytest
+
+from nlp.lexicon import LexiconScorer
+
+
+@pytest.fixture
+def scorer():
+    return LexiconScorer()
+
+
+def test_one_sided_text_gets_a_wide_margin(scorer):
+    scores, margin = scorer.score("Great work, excellent and amazing progress")
+    assert margin == pytest.approx(4 / 5)
+    assert max(scores, key=scores.get) == "positive"
+    assert sum(scores.values()) == pytest.approx(1.0, abs=1e-3)
+
+    scores, margin = scorer.score("सरकार भ्रष्ट है, बकवास काम, सब बर्बाद")
+    assert margin == pytest.approx(3 / 4)
+    assert max(scores, key=scores.get) == "negative"
+
+
+def test_mixed_polarity_has_a_narrow_margin(scorer):
+    _, mixed = scorer.score("good roads but corrupt and useless officials")
+    _, single = scorer.score("good")
+    assert mixed == pytest.approx(1 / 4)
+    assert single == pytest.approx(1 / 2)
+
+
+@pytest.mark.parametrize("text", [
+    "not good at all",
+    "acha nahi hai",
+    "यह अच्छा नहीं है",
+    "never seen such a great scheme",
+])
+def test_negation_is_left_to_the_model(scorer, text):
+    assert scorer.score(text) == (None, 0.0)
+
+
+def test_no_polar_words_or_too_long(scorer):
+    assert scorer.score("the rally starts at noon") == (None, 0.0)
+    assert scorer.score("") == (None, 0.0)
+    assert LexiconScorer(max_tokens=3).score("good good good good") == (None, 0.0)
@@ -0,0 +1,97 @@
+# backend/tests/test_micro_batcher.py
+import threading
+
+import pytest
+
+from nlp.micro_batcher import MicroBatcher
+
+
+class CountingAnalyzer:
+    """Just the parts of SentimentAnalyzer the batcher calls"""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.calls = []
+        self.fail = fail
+
+    def classify(self, texts, batch_size=None, bucket_by_length=None):
+        self.batches.append(list(texts))
+        self.calls.append({"batch_size": batch_size, "bucket_by_length": bucket_by_length})
+        if self.fail:
+            raise RuntimeError("model failed")
+        return [{"positive": float(len(text))} for text in texts]
+
+
+@pytest.fixture
+def make_batcher():
+    batchers = []
+
+    def make(analyzer, **kwargs):
+        batcher = MicroBatcher(analyzer, **kwargs)
+        batcher.start()
+        batchers.append(batcher)
+        return batcher
+
+    yield make
+    for batcher in batchers:
+        batcher.stop()
+
+
+def test_concurrent_requests_share_a_batch(make_batcher):
+    analyzer = CountingAnalyzer()
+    batcher = make_batcher(analyzer, window_ms=200, max_batch_size=8)
+    start = threading.Barrier(8)
+    results = [None] * 8
+
+    def worker(i):
+        start.wait()
+        results[i] = batcher.submit("x" * (i + 1)).result(timeout=5)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Each caller gets its own text's result
+    assert results == [{"positive": float(i + 1)} for i in range(8)]
+    assert len(analyzer.batches) < 8
+    assert batcher.stats()["requests"] == 8
+
+
+def test_coalesced_batch_is_one_unbucketed_classifier_call():
+    analyzer = CountingAnalyzer()
+    batcher = MicroBatcher(analyzer, window_ms=200, max_batch_size=4)
+    # Queued before the worker starts, so the first batch takes all four
+    futures = [batcher.submit("x" * n) for n in (1, 40, 3, 400)]
+    batcher.start()
+    try:
+        assert [f.result(timeout=5)["positive"] for f in futures] == [1.0, 40.0, 3.0, 400.0]
+    finally:
+        batcher.stop()
+    assert analyzer.batches == [["x", "x" * 40, "xxx", "x" * 400]]
+    assert analyzer.calls == [{"batch_size": 4, "bucket_by_length": False}]
+
+
+def test_batch_size_is_capped(make_batcher):
+    analyzer = CountingAnalyzer()
+    batcher = make_batcher(analyzer, window_ms=200, max_batch_size=3)
+    futures = [batcher.submit(f"text {i}") for i in range(7)]
+    assert [f.result(timeout=5)["positive"] for f in futures] == [6.0] * 7
+    assert max(len(batch) for batch in analyzer.batches) <= 3
+
+
+def test_model_errors_reach_every_caller(make_batcher):
+    batcher = make_batcher(CountingAnalyzer(fail=True), window_ms=50)
+    futures = [batcher.submit("a"), batcher.submit("b")]
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(timeout=5)
+
+
+def test_stop_fails_queued_requests():
+    batcher = MicroBatcher(CountingAnalyzer(), window_ms=10)
+    future = batcher.submit("never started")
+    batcher.stop()
+    with pytest.raises(RuntimeError):
+        future.result(timeout=1)
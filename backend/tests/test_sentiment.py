@@ -0,0 +1,127 @@
+# backend/tests/test_sentiment.py
+import pytest
+
+from nlp.sentiment import SentimentAnalyzer
+
+
+class WordCountTokenizer:
+    def __call__(self, texts, truncation=True, max_length=512):
+        return {"input_ids": [[0] * min(len(text.split()), max_length) for text in texts]}
+
+
+class ScoringClassifier:
+    """Stands in for the HF pipeline: the positive score encodes which text it saw"""
+
+    tokenizer = WordCountTokenizer()
+
+    def __init__(self):
+        self.calls = []
+
+    def _output(self, text):
+        return [{"label": "LABEL_2", "score": len(text) / 1000}, {"label": "LABEL_0", "score": 0.0}]
+
+    def __call__(self, texts, batch_size=1, truncation=True):
+        if isinstance(texts, str):
+            self.calls.append([texts])
+            return self._output(texts)
+        self.calls.append(list(texts))
+        return [self._output(text) for text in texts]
+
+
+@pytest.fixture
+def make_analyzer(monkeypatch):
+    def make(**kwargs):
+        classifier = ScoringClassifier()
+        monkeypatch.setattr(SentimentAnalyzer, "_build_classifier", lambda self: classifier)
+        kwargs.setdefault("use_cache", False)
+        kwargs.setdefault("cascade", False)
+        return SentimentAnalyzer(**kwargs)
+
+    return make
+
+
+def test_bucketed_classification_keeps_input_order(make_analyzer):
+    analyzer = make_analyzer(bucket_by_length=True)
+    analyzer.bucket_boundaries = [2, 4, 8]
+    analyzer.max_batch_tokens = 8
+    texts = [" ".join(["word"] * n) + f" #{i}" for i, n in enumerate([7, 1, 3, 6, 1, 2, 7, 3, 1])]
+
+    scores = analyzer.classify(texts, batch_size=32)
+
+    assert [s["positive"] for s in scores] == [round(len(t) / 1000, 4) for t in texts]
+    # Split into several length-grouped passes, not one padded batch
+    assert len(analyzer.classifier.calls) > 1
+    for call in analyzer.classifier.calls:
+        lengths = [len(text.split()) for text in call]
+        assert max(lengths) <= 2 * min(lengths)
+    assert analyzer.classify(texts, bucket_by_length=False) == scores
+
+
+def test_analyze_stream_chunks_and_indexes(make_analyzer):
+    analyzer = make_analyzer()
+    texts = [f"comment number {i}" if i % 4 else "ok" for i in range(10)]
+
+    chunks = list(analyzer.analyze_stream(
+        (text for text in texts), languages=iter(["en"] * len(texts)), chunk_size=3
+    ))
+
+    # One list per input chunk; too-short texts are skipped but keep their slot
+    assert [[r["index"] for r in chunk] for chunk in chunks] == [[1, 2], [3, 5], [6, 7], [9]]
+    for result in (r for chunk in chunks for r in chunk):
+        assert result["text"] == texts[result["index"]]
+        assert result["language"] == "en"
+
+
+def test_analyze_stream_raises_model_errors(make_analyzer):
+    analyzer = make_analyzer()
+
+    def failing(*args, **kwargs):
+        raise RuntimeError("model failed")
+
+    analyzer._analyze_indexed = failing
+    with pytest.raises(RuntimeError):
+        list(analyzer.analyze_stream(["some text"], languages=["en"]))
+
+
+def test_analyze_stream_stops_when_the_consumer_does(make_analyzer):
+    analyzer = make_analyzer()
+    texts = (f"comment number {i}" for i in range(10000))
+
+    stream = analyzer.analyze_stream(texts, languages=(["en"] * 10000), chunk_size=10, prefetch=1)
+    first = next(stream)
+    stream.close()
+
+    assert [r["index"] for r in first] == list(range(10))
+    # The producer ran at most a couple of chunks ahead, not through the whole input
+    assert sum(len(call) for call in analyzer.classifier.calls) <= 40
+
+
+def test_cascade_sends_only_low_margin_texts_to_the_model(make_analyzer):
+    analyzer = make_analyzer(cascade=True)
+    analyzer.cascade_margin = 0.6
+    analyzer.cascade_audit_rate = 0.0
+    texts = [
+        "great work, excellent and amazing progress",  # margin 0.8: lexicon
+        "good",                                        # margin 0.5: model
+        "not good at all",                             # negated: model
+        "the rally starts at noon",                    # nothing polar: model
+    ]
+
+    scores = analyzer.classify(texts)
+
+    assert analyzer.classifier.calls == [texts[1:]]
+    assert max(scores[0], key=scores[0].get) == "positive" and scores[0]["positive"] == 0.9
+    assert [s["positive"] for s in scores[1:]] == [round(len(t) / 1000, 4) for t in texts[1:]]
+    assert analyzer.cascade_stats == {"lexicon": 1, "escalated": 3, "audited": 0, "agreed": 0}
+
+
+def test_cascade_audit_runs_the_model_on_lexicon_texts(make_analyzer):
+    analyzer = make_analyzer(cascade=True)
+    analyzer.cascade_audit_rate = 1.0
+    text = "great work, excellent and amazing progress"
+
+    scores = analyzer.classify([text])
+
+    assert analyzer.classifier.calls == [[text]]
+    assert scores[0]["positive"] == round(len(text) / 1000, 4)
+    assert analyzer.cascade_stats["audited"] == 1
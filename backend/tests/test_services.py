@@ -0,0 +1,66 @@
+# backend/tests/test_services.py
+import threading
+
+from services import Services, _LazyService
+
+
+def _run_with_timeout(fn, seconds=5):
+    result = {}
+    thread = threading.Thread(target=lambda: result.setdefault("value", fn()), daemon=True)
+    thread.start()
+    thread.join(seconds)
+    assert not thread.is_alive(), "lazy service load deadlocked"
+    return result["value"]
+
+
+class _Registry(Services):
+    status = {}
+    _lazy_instances = {}
+    _lazy_locks = {}
+    _lazy_lock = threading.Lock()
+
+    base = _LazyService(lambda: "base")
+    # Like topic_clusters, which builds on embeddings
+    derived = _LazyService(lambda: f"derived from {_Registry.base}")
+
+
+def test_lazy_service_can_load_another_lazy_service():
+    assert _run_with_timeout(lambda: _Registry.derived) == "derived from base"
+    assert _Registry.status["base"]["state"] == "ready"
+    assert _Registry.status["derived"]["state"] == "ready"
+
+
+def test_lazy_service_loads_once():
+    calls = []
+
+    class Registry(Services):
+        status = {}
+        _lazy_instances = {}
+        _lazy_locks = {}
+        _lazy_lock = threading.Lock()
+        service = _LazyService(lambda: calls.append(1) or object())
+
+    threads = [threading.Thread(target=lambda: Registry.service) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert len(calls) == 1
+
+
+def test_slow_lazy_load_does_not_block_other_services():
+    release = threading.Event()
+
+    class Registry(Services):
+        status = {}
+        _lazy_instances = {}
+        _lazy_locks = {}
+        _lazy_lock = threading.Lock()
+        slow = _LazyService(lambda: release.wait(5) and "slow")
+        fast = _LazyService(lambda: "fast")
+
+    threading.Thread(target=lambda: Registry.slow, daemon=True).start()
+    try:
+        assert _run_with_timeout(lambda: Registry.fast, seconds=2) == "fast"
+    finally:
+        release.set()
@@ -0,0 +1,113 @@
+# backend/tests/test_topic_clusters.py
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from nlp import topic_clusters
+from nlp.topic_clusters import TopicClusterer, growth_rates
+
+
+class KeyedEmbeddings:
+    """Texts like "a:1" embed onto axis "a"; the suffix keeps texts distinct"""
+
+    dimension = 8
+
+    def encode(self, texts):
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            vectors[row, ord(text[0]) % self.dimension] = 1.0
+        return vectors
+
+    @staticmethod
+    def to_bytes(vector):
+        return np.asarray(vector, dtype=np.float16).tobytes()
+
+    @staticmethod
+    def from_bytes(data):
+        return np.frombuffer(data, dtype=np.float16).astype(np.float32)
+
+
+NOW = datetime(2026, 10, 1, 12)
+
+
+@pytest.fixture
+def clusterer():
+    return TopicClusterer(KeyedEmbeddings(), threshold=0.9)
+
+
+def test_similar_texts_share_a_cluster(clusterer):
+    ids = clusterer.assign_batch(["a:1", "b:1", "a:2"], now=NOW)
+    assert ids[0] == ids[2] != ids[1]
+
+    later = clusterer.assign_batch(["b:2", "c:1"], now=NOW)
+    assert later[0] == ids[1]
+    assert later[1] not in ids
+    assert clusterer.clusters[ids[0]]["count"] == 2
+
+
+def test_topics_and_hourly_counts(clusterer):
+    ids = clusterer.assign_batch(["a:1", "a:2"], topics=[["jobs"], ["jobs", "fuel"]], now=NOW)
+    cluster = clusterer.clusters[ids[0]]
+    assert cluster["hourly"] == {"2026-10-01T12": 2}
+    assert clusterer.label(ids[0]) == "jobs"
+
+
+def test_ids_stay_valid_when_clusters_are_trimmed(clusterer, monkeypatch):
+    monkeypatch.setattr(topic_clusters, "TOPIC_CLUSTER_MAX_CLUSTERS", 3)
+    old = clusterer.assign_batch(["a:1", "b:1", "c:1"], now=NOW - timedelta(hours=2))
+
+    ids = clusterer.assign_batch(["d:1", "a:2", "e:1", "d:2"], now=NOW)
+
+    assert len(clusterer.ids) == 3
+    assert ids[0] == ids[3]
+    assert ids[1] == old[0]
+    # Every returned id is a cluster the text was really assigned to
+    for text, cluster_id in zip(["d:1", "a:2", "e:1", "d:2"], ids):
+        if cluster_id in clusterer.clusters:
+            row = clusterer.ids.index(cluster_id)
+            assert clusterer.centroids[row] @ KeyedEmbeddings().encode([text])[0] > 0.9
+    # The least recently active clusters were dropped
+    assert old[1] not in clusterer.clusters and old[2] not in clusterer.clusters
+
+
+def test_dirty_documents_round_trip(clusterer):
+    ids = clusterer.assign_batch(["a:1", "b:1"], now=NOW)
+    docs = clusterer.dirty_documents()
+    assert {d["_id"] for d in docs} == set(ids)
+    assert clusterer.dirty_documents() == []
+
+    restored = TopicClusterer(KeyedEmbeddings(), threshold=0.9)
+    restored.load(docs)
+    assert restored.assign_batch(["a:3"], now=NOW) == [ids[0]]
+
+
+def test_trimmed_clusters_are_still_saved(clusterer, monkeypatch):
+    monkeypatch.setattr(topic_clusters, "TOPIC_CLUSTER_MAX_CLUSTERS", 2)
+    old = clusterer.assign_batch(["a:1", "b:1"], topics=[["jobs"], []], now=NOW - timedelta(hours=2))
+    new = clusterer.assign_batch(["c:1", "d:1"], now=NOW)
+
+    assert set(clusterer.ids) == set(new)
+    assert clusterer.stats()["pending_writes"] == 4
+    docs = {d["_id"]: d for d in clusterer.dirty_documents()}
+    assert set(docs) == set(old) | set(new)
+    assert docs[old[0]]["topic_counts"] == {"jobs": 1}
+    assert clusterer.dirty_documents() == []
+
+
+def test_zero_threshold_is_kept():
+    clusterer = TopicClusterer(KeyedEmbeddings(), threshold=0.0)
+    assert clusterer.threshold == 0.0
+    ids = clusterer.assign_batch(["a:1", "b:1"], now=NOW)
+    assert ids[0] == ids[1]
+
+
+def test_growth_rates_rank_rising_clusters():
+    docs = [
+        {"_id": "steady", "hourly": {"2026-10-01T02": 10, "2026-10-01T10": 10}},
+        {"_id": "rising", "hourly": {"2026-10-01T11": 12}},
+        {"_id": "quiet", "hourly": {"2026-10-01T12": 1}},
+    ]
+    ranked = growth_rates(docs, hours=6, min_count=3, now=NOW)
+    assert [c["cluster_id"] for c in ranked] == ["rising", "steady"]
+    assert ranked[0]["growth_rate"] == 13.0
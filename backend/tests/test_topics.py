@@ -0,0 +1,151 @@
+# backend/tests/test_topics.py
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from nlp import topics as topics_module
+from nlp.topics import TopicExtractor
+
+
+class HashtagKeyBERT:
+    """Stands in for KeyBERT: a document's keywords are its #hashtags"""
+
+    def __init__(self, model=None):
+        self.model = model
+        self.calls = []
+
+    def extract_keywords(self, docs, top_n=5, **kwargs):
+        single = isinstance(docs, str)
+        docs = [docs] if single else list(docs)
+        self.calls.append(docs)
+        keywords = [
+            [(word.lstrip("#"), 0.5) for word in doc.split() if word.startswith("#")][:top_n]
+            for doc in docs
+        ]
+        # Like KeyBERT, a single document's keywords come back unwrapped
+        return keywords[0] if single or len(docs) == 1 else keywords
+
+
+class EnglishOnlyTranslator:
+    def detect_language(self, text):
+        return "en"
+
+    def detect_languages(self, texts):
+        return ["en"] * len(texts)
+
+
+@pytest.fixture
+def keybert(monkeypatch):
+    module = types.ModuleType("keybert")
+    module.KeyBERT = HashtagKeyBERT
+    monkeypatch.setitem(sys.modules, "keybert", module)
+
+
+@pytest.fixture
+def extractor(keybert):
+    return TopicExtractor(translator=EnglishOnlyTranslator(), mode="translate")
+
+
+DOCS = [
+    "Long queues at the #ration #shop again this week",
+    "Nothing tagged here, but the water supply is broken",
+    "Proud of the new #metro line and the #highway",
+]
+
+
+def test_batch_matches_per_document_extraction(extractor):
+    batch = extractor.extract_topics_batch(DOCS, top_n=3, languages=["en"] * 3)
+    assert batch == [extractor.extract_topics(doc, top_n=3) for doc in DOCS]
+    assert batch[0] == ["ration", "shop"]
+    assert batch[2] == ["metro", "highway"]
+    # No KeyBERT keywords: keyword matching fills in
+    assert "water" in batch[1]
+
+
+def test_single_document_batch_keeps_the_list_shape(extractor):
+    assert extractor.extract_topics_batch(DOCS[:1], languages=["en"]) == [["ration", "shop"]]
+
+
+def test_keybert_runs_once_per_topic_batch(extractor, monkeypatch):
+    monkeypatch.setattr(topics_module, "TOPIC_BATCH_SIZE", 2)
+    docs = DOCS + ["Another #protest at the #collectorate today", "Too short", "#fuel prices up once more"]
+
+    topics = extractor.extract_topics_batch(docs, languages=["en"] * len(docs))
+
+    # Too-short texts are skipped before KeyBERT and get no topics
+    assert [len(call) for call in extractor.model.calls] == [2, 2, 1]
+    assert topics[3] == ["protest", "collectorate"] and topics[4] == [] and topics[5] == ["fuel"]
+
+
+class VocabularyEncoder:
+    """
+    Stands in for the shared EmbeddingService: one axis per vocabulary term
+    the text contains, plus a constant axis so no vector is zero
+    """
+
+    working = True
+    model = None
+
+    def __init__(self, vocabulary, model_name="fake-encoder"):
+        self.vocabulary = vocabulary
+        self.model_name = model_name
+        self.encoded = []
+        self.embedded = []
+
+    def _vectors(self, texts):
+        vectors = np.zeros((len(texts), len(self.vocabulary) + 1), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for col, term in enumerate(self.vocabulary):
+                vectors[row, col] = float(term in text.lower())
+            vectors[row, -1] = 0.1
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def encode(self, texts):
+        self.encoded.append(list(texts))
+        return self._vectors(texts)
+
+    def embed(self, texts, verbose=False):
+        self.embedded.append(list(texts))
+        return self._vectors(texts)
+
+
+@pytest.fixture
+def guided(keybert, tmp_path, monkeypatch):
+    monkeypatch.setattr(topics_module, "MODEL_CACHE_DIR", str(tmp_path))
+
+    def make(model_name="fake-encoder"):
+        vocabulary = topics_module.load_vocabulary(topics_module.TOPIC_VOCAB_FILE)
+        encoder = VocabularyEncoder(vocabulary, model_name)
+        return TopicExtractor(translator=EnglishOnlyTranslator(), mode="guided", embeddings=encoder), encoder
+
+    return make
+
+
+def test_guided_mode_embeds_the_vocabulary_once(guided):
+    extractor, encoder = guided()
+    docs = ["Hospital beds are full again", "No electricity in the village for days"]
+
+    first = extractor.extract_topics_batch(docs, languages=["en"] * 2)
+    second = extractor.extract_topics_batch(docs[::-1], languages=["en"] * 2)
+
+    assert "hospital" in first[0] and "electricity" in first[1]
+    assert second == first[::-1]
+    # The vocabulary is embedded once; documents go through the document cache
+    assert encoder.embedded == [extractor.political_keywords]
+    assert encoder.encoded == [docs, docs[::-1]]
+
+
+def test_guided_vocabulary_matrix_is_reused_from_disk(guided):
+    extractor, _ = guided()
+    vectors = extractor._vocab_index()
+
+    reloaded, encoder = guided()
+    assert np.array_equal(reloaded._vocab_index(), vectors)
+    assert encoder.embedded == []
+
+    # A different encoder gets its own matrix
+    other, other_encoder = guided(model_name="other-encoder")
+    other._vocab_index()
+    assert other_encoder.embedded == [other.political_keywords]
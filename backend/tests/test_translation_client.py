@@ -0,0 +1,126 @@
+# backend/tests/test_translation_client.py
+import threading
+import time
+
+import pytest
+
+from nlp.translation_client import CircuitBreaker, TranslationClient, TranslationUnavailable
+
+
+@pytest.fixture
+def make_client():
+    clients = []
+
+    def make(**kwargs):
+        client = TranslationClient(**kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.shutdown()
+
+
+def test_slow_healthy_provider_does_not_time_out_queued_calls(make_client):
+    client = make_client(max_concurrency=2, timeout=0.2, failure_threshold=3, reset_timeout=60)
+
+    def slow_upper(text):
+        time.sleep(0.05)
+        return text.upper()
+
+    items = [f"text {i}" for i in range(20)]
+    assert client.map(slow_upper, items) == [item.upper() for item in items]
+    assert client.timeouts == 0
+    assert client.breaker.state == "closed"
+
+
+def test_call_times_out_and_counts_a_failure(make_client):
+    client = make_client(max_concurrency=1, timeout=0.05, failure_threshold=5, reset_timeout=60)
+    release = threading.Event()
+    try:
+        with pytest.raises(TranslationUnavailable):
+            client.call(lambda text: release.wait(2), "slow")
+        assert client.timeouts == 1
+        assert client.breaker.consecutive_failures == 1
+    finally:
+        release.set()
+
+
+def test_hung_workers_fail_queued_calls_instead_of_blocking(make_client):
+    client = make_client(max_concurrency=1, timeout=0.05, failure_threshold=5, reset_timeout=60)
+    release = threading.Event()
+    try:
+        start = time.perf_counter()
+        assert client.map(lambda text: release.wait(5), ["a", "b", "c"]) == [None, None, None]
+        assert time.perf_counter() - start < 1
+        # Only the call that actually ran counts against the provider
+        assert client.timeouts == 1
+    finally:
+        release.set()
+
+
+def test_errors_open_the_circuit_and_short_circuit_later_calls(make_client):
+    client = make_client(max_concurrency=2, timeout=1, failure_threshold=2, reset_timeout=60)
+
+    def broken(text):
+        raise ConnectionError("provider down")
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            client.call(broken, "x")
+    assert client.breaker.state == "open"
+
+    with pytest.raises(TranslationUnavailable):
+        client.call(str.upper, "x")
+    assert client.short_circuited == 1
+
+
+def test_breaker_half_open_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()          # the probe
+    assert not breaker.allow()      # only one at a time
+    breaker.record_failure()
+    assert breaker.state == "open" and breaker.times_opened == 2
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_cancelled_half_open_probe_lets_the_breaker_recover(make_client):
+    client = make_client(max_concurrency=1, timeout=0.05, failure_threshold=1, reset_timeout=0.1)
+    release = threading.Event()
+    try:
+        # The only worker hangs past its deadline and opens the circuit
+        with pytest.raises(TranslationUnavailable):
+            client.call(lambda text: release.wait(5), "hung")
+        assert client.breaker.state == "open"
+
+        # The half-open probe queues behind the hung call and is cancelled unrun
+        time.sleep(0.12)
+        with pytest.raises(TranslationUnavailable, match="busy"):
+            client.call(str.upper, "probe")
+        assert client.breaker.state == "half_open"
+    finally:
+        release.set()
+
+    time.sleep(0.05)
+    assert client.call(str.upper, "next probe") == "NEXT PROBE"
+    assert client.breaker.state == "closed"
+
+
+def test_release_probe_only_affects_half_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    breaker.release_probe()
+    assert breaker.state == "closed" and breaker.allow()
+
+    breaker.record_failure()
+    time.sleep(0.02)
+    assert breaker.allow() and not breaker.allow()
+    breaker.release_probe()
+    assert breaker.allow()
@@ -0,0 +1,82 @@
+# backend/tests/test_translator.py
+import pytest
+
+from nlp import translator as translator_module
+from nlp.translator import TranslatorService
+
+HINDI = "मोदी जी ने बहुत अच्छा काम किया"
+TAMIL = "நல்ல வேலை செய்கிறார்கள்"
+HINGLISH = "Sarkar bahut buri hai desh ka kuch nahi ho raha"
+ENGLISH = "Government is corrupt and useless"
+
+
+class RecordingTranslator:
+    """Stands in for GoogleTranslator: tags each line with the source it was sent as"""
+
+    requests = []
+
+    def __init__(self, source="auto", target="en"):
+        self.source = source
+
+    def translate(self, text):
+        RecordingTranslator.requests.append((self.source, text))
+        return "\n".join(f"[{self.source}] {line}" for line in text.split("\n"))
+
+
+@pytest.fixture
+def translator(monkeypatch):
+    RecordingTranslator.requests = []
+    monkeypatch.setattr(translator_module, "GoogleTranslator", RecordingTranslator)
+    service = TranslatorService(use_cache=False)
+    yield service
+    service.client.shutdown()
+
+
+def test_detect_languages(translator):
+    assert translator.detect_languages([HINDI, TAMIL, HINGLISH, ENGLISH, ""]) == [
+        "hi", "ta", "hi-Latn", "en", "unknown",
+    ]
+
+
+def test_mixed_batch_packs_each_language_separately(translator):
+    texts = [HINDI, TAMIL, HINGLISH, HINDI + " 2", TAMIL + " 2"]
+    results = translator.translate_batch(texts)
+
+    assert results == [
+        f"[hi] {HINDI}", f"[ta] {TAMIL}", f"[auto] {HINGLISH}", f"[hi] {HINDI} 2", f"[ta] {TAMIL} 2",
+    ]
+    # One request per language, each carrying only its own lines
+    assert sorted(source for source, _ in RecordingTranslator.requests) == ["auto", "hi", "ta"]
+    for source, request in RecordingTranslator.requests:
+        assert all(line.startswith({"hi": "मोदी", "ta": "நல்ல", "auto": "Sarkar"}[source])
+                   for line in request.split("\n"))
+
+
+def test_english_is_not_sent_for_english_target(translator):
+    assert translator.translate_batch([ENGLISH, HINDI]) == [ENGLISH, f"[hi] {HINDI}"]
+    assert [source for source, _ in RecordingTranslator.requests] == ["hi"]
+
+
+def test_caller_languages_are_used_as_sources(translator):
+    results = translator.translate_batch([HINGLISH, "bonjour"], languages=["hi-Latn", "fr"])
+    assert results == [f"[auto] {HINGLISH}", "[fr] bonjour"]
+
+
+def test_explicit_source_packs_everything_together(translator):
+    translator.translate_batch([HINDI, TAMIL], source="hi")
+    assert RecordingTranslator.requests == [("hi", f"{HINDI}\n{TAMIL}")]
+
+
+def test_pack_whose_lines_come_back_merged_is_retried_per_text(translator, monkeypatch):
+    def merging(self, text):
+        RecordingTranslator.requests.append((self.source, text))
+        return " ".join(text.split("\n")).upper()
+
+    monkeypatch.setattr(RecordingTranslator, "translate", merging)
+    assert translator.translate_batch(["ek do", "teen char"], languages=["hi", "hi"]) == ["EK DO", "TEEN CHAR"]
+    assert len(RecordingTranslator.requests) == 3
+
+
+def test_duplicates_and_short_texts(translator):
+    assert translator.translate_batch([HINDI, "", "a", HINDI]) == [f"[hi] {HINDI}", "", "a", f"[hi] {HINDI}"]
+    assert len(RecordingTranslator.requests) == 1
@@ -0,0 +1,104 @@
+"""
+Reproducible synthetic multilingual corpus for benchmarks.
+Languages and labels match TranslatorService.detect_language:
+en, hi (Devanagari), hi-Latn (Hinglish), ta, bn.
+"""
+import random
+
+SENTENCES = {
+    "en": [
+        "The government has done great work on roads this year",
+        "Water supply in our area has been terrible for months",
+        "Inflation is rising and nobody in parliament seems to care",
+        "The new metro line will help thousands of daily commuters",
+        "Corruption in the local office is completely out of control",
+        "Farmers are still waiting for the promised subsidy payments",
+        "Electricity cuts are getting worse every single summer",
+        "Good to see the hospital finally open after so many delays",
+        "Unemployment among young graduates is the biggest issue right now",
+        "The election rally drew a huge crowd in the city today",
+        "Petrol prices went up again and transport costs followed",
+        "Schools in the village still have no proper toilets",
+    ],
+    "hi": [
+        "सरकार ने सड़कों पर बहुत अच्छा काम किया है",
+        "हमारे इलाके में पानी की समस्या बहुत बड़ी है",
+        "महंगाई बढ़ रही है और कोई ध्यान नहीं दे रहा",
+        "नई योजना से किसानों को फायदा होगा",
+        "भ्रष्टाचार हर दफ्तर में फैला हुआ है",
+        "बिजली कटौती से लोग परेशान हैं",
+        "युवाओं के लिए रोजगार सबसे बड़ा मुद्दा है",
+        "चुनाव से पहले नेता सिर्फ वादे करते हैं",
+        "अस्पताल में डॉक्टर और दवाइयाँ दोनों नहीं हैं",
+        "मोदी जी ने देश के लिए अच्छा काम किया",
+    ],
+    "hi-Latn": [
+        "Sarkar bahut buri hai desh ka kuch nahi ho raha",
+        "Ye har rajya mai chunaav jitna chahte hai",
+        "Paani ki samasya bahut badi hai gaon mein",
+        "Modi ji ne accha kaam kiya hai desh ke liye",
+        "Bijli nahi aati aur bill phir bhi zyada aata hai",
+        "Neta log sirf chunav ke time pe aate hai",
+        "Sadak ka kaam kab khatam hoga koi nahi batata",
+        "Janta ko kuch nahi milega is sarkaar se",
+        "Naukri ke liye yuva log bahut pareshan hai",
+        "Ab toh petrol ka daam bhi bahut zyada ho gaya",
+    ],
+    "ta": [
+        "அரசு சாலைகளில் நல்ல வேலை செய்துள்ளது",
+        "எங்கள் பகுதியில் குடிநீர் பிரச்சனை மிகவும் மோசமாக உள்ளது",
+        "விலைவாசி உயர்வு மக்களை பாதிக்கிறது",
+        "புதிய மெட்ரோ ரயில் திட்டம் பயனுள்ளதாக இருக்கும்",
+        "ஊழல் அனைத்து அலுவலகங்களிலும் பரவியுள்ளது",
+        "நல்ல வேலை செய்கிறார்கள்",
+        "விவசாயிகளுக்கு மானியம் இன்னும் வரவில்லை",
+        "மின்வெட்டு மக்களை மிகவும் கஷ்டப்படுத்துகிறது",
+    ],
+    "bn": [
+        "সরকার ভালো কাজ করছে না",
+        "আমাদের এলাকায় জলের সমস্যা খুব বড়",
+        "জিনিসপত্রের দাম প্রতিদিন বাড়ছে",
+        "নতুন রাস্তা তৈরি হওয়ায় সবাই খুশি",
+        "দুর্নীতি সব জায়গায় ছড়িয়ে পড়েছে",
+        "যুবকদের জন্য চাকরি সবচেয়ে বড় সমস্যা",
+        "বিদ্যুৎ বিভ্রাট গ্রীষ্মে আরও খারাপ হয়",
+        "নির্বাচনের আগে নেতারা শুধু প্রতিশ্রুতি দেন",
+    ],
+}
+
+# Roughly the mix we see in scrapes: English-heavy, then Hindi / Hinglish
+DEFAULT_MIX = {"en": 0.45, "hi": 0.2, "hi-Latn": 0.2, "ta": 0.08, "bn": 0.07}
+
+# (share, min sentences, max sentences): short comments, medium posts, long selftexts
+LENGTH_PROFILE = [(0.55, 1, 1), (0.3, 2, 4), (0.15, 6, 12)]
+
+
+def _sentence_count(rng):
+    roll = rng.random()
+    for share, low, high in LENGTH_PROFILE:
+        if roll < share:
+            return rng.randint(low, high)
+        roll -= share
+    return 1
+
+
+def generate_corpus(n, seed=42, mix=None):
+    """Returns n dicts: {"text": str, "language": expected detect_language label}"""
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    languages = list(mix)
+    weights = [mix[lang] for lang in languages]
+
+    corpus = []
+    for _ in range(n):
+        language = rng.choices(languages, weights)[0]
+        pool = SENTENCES[language]
+        text = ". ".join(rng.choice(pool) for _ in range(_sentence_count(rng)))
+        corpus.append({"text": text, "language": language})
+    return corpus
+
+
+if __name__ == "__main__":
+    sample = generate_corpus(10)
+    for item in sample:
+        print(f"  [{item['language']:>7}] {item['text'][:70]}")
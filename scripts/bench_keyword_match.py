@@ -0,0 +1,100 @@
+# scripts/bench_keyword_match.py
+"""
+Micro-benchmark: KeywordMatcher vs the previous substring loop in
+TopicExtractor._keyword_match. Also counts texts where the two disagree;
+those are substring hits inside other words ("gas" in "Vegas") that the
+word-boundary matcher drops.
+
+The matcher is a correctness change. At the 73-topic vocabulary it runs at
+0.9-1.2x the substring loop across runs, and about a quarter of the corpus
+changes its matches (loop-only hits such as "employment" in "Unemployment").
+It is ~5x faster at 500 keywords and ~9x at 2000.
+
+Run from project root:
+    python scripts/bench_keyword_match.py
+    python scripts/bench_keyword_match.py --n 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_corpus import generate_corpus
+from nlp.keyword_matcher import KeywordMatcher
+from nlp.topic_vocab import POLITICAL_TOPICS
+
+
+def legacy_keyword_match(text, keywords, top_n=5):
+    """The substring loop KeywordMatcher replaced"""
+    text_lower = text.lower()
+    found = []
+
+    for keyword in keywords:
+        if keyword in text_lower:
+            found.append(keyword)
+
+    return found[:top_n] if found else []
+
+
+def _time(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark keyword matching")
+    parser.add_argument("--n", type=int, default=100000, help="Corpus size")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs; the best is reported")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    keywords = list(POLITICAL_TOPICS)
+    texts = [item["text"] for item in generate_corpus(args.n, seed=args.seed)]
+
+    build_start = time.perf_counter()
+    matcher = KeywordMatcher(keywords)
+    build_seconds = time.perf_counter() - build_start
+
+    legacy_seconds, legacy = _time(lambda: [legacy_keyword_match(t, keywords) for t in texts], args.repeat)
+    matcher_seconds, _ = _time(lambda: matcher.match_batch(texts, top_n=5), args.repeat)
+
+    # Compare complete match sets: the loop truncates in vocabulary order, the matcher in text order
+    legacy = [legacy_keyword_match(t, keywords, top_n=len(keywords)) for t in texts]
+    matched = matcher.match_batch(texts)
+
+    differing = [(t, a, b) for t, a, b in zip(texts, legacy, matched) if set(a) != set(b)]
+
+    print("=" * 55)
+    print("  KEYWORD MATCH BENCHMARK")
+    print("=" * 55)
+    print(f"  Texts:             {len(texts)}  Keywords: {len(keywords)}")
+    print(f"  Automaton build:   {build_seconds * 1000:.2f}ms")
+    print(f"  Substring loop:    {legacy_seconds:.3f}s ({len(texts) / legacy_seconds:,.0f} texts/s)")
+    print(f"  KeywordMatcher:    {matcher_seconds:.3f}s ({len(texts) / matcher_seconds:,.0f} texts/s)")
+    print(f"  Speedup:           {legacy_seconds / matcher_seconds:.2f}x")
+    print(f"  Texts differing:   {len(differing)} (substring-only hits dropped)")
+    for text, old, new in differing[:5]:
+        print(f"    {sorted(set(old) - set(new))} only in loop: {text[:60]!r}")
+
+    # The loop is O(keywords x length); the automaton is O(length)
+    sample = texts[:10000]
+    print(f"\n  Scaling with vocabulary size ({len(sample)} texts):")
+    print(f"  {'keywords':>9}{'loop s':>10}{'matcher s':>11}{'speedup':>9}")
+    for size in (len(keywords), 500, 2000):
+        vocab = keywords + [f"{w}{i}" for i in range(size) for w in ("issue", "scheme")][:size - len(keywords)]
+        vocab_matcher = KeywordMatcher(vocab)
+        loop_s, _ = _time(lambda: [legacy_keyword_match(t, vocab) for t in sample], 1)
+        match_s, _ = _time(lambda: vocab_matcher.match_batch(sample, top_n=5), 1)
+        print(f"  {len(vocab):>9}{loop_s:>10.3f}{match_s:>11.3f}{loop_s / match_s:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# scripts/bench_language_detection.py
+"""
+Micro-benchmark: TranslatorService.detect_languages vs the previous
+per-character detect_language loop. Checks both give identical labels.
+
+Run from project root:
+    python scripts/bench_language_detection.py
+    python scripts/bench_language_detection.py --n 100000 --repeat 3
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_corpus import generate_corpus
+
+
+def legacy_detect_language(text, hinglish_words):
+    """The per-character implementation detect_languages replaced"""
+    if not text:
+        return "unknown"
+
+    for char in text:
+        if "\u0900" <= char <= "\u097F":
+            return "hi"
+        if "\u0B80" <= char <= "\u0BFF":
+            return "ta"
+        if "\u0C00" <= char <= "\u0C7F":
+            return "te"
+        if "\u0980" <= char <= "\u09FF":
+            return "bn"
+        if "\u0A80" <= char <= "\u0AFF":
+            return "gu"
+        if "\u0C80" <= char <= "\u0CFF":
+            return "kn"
+        if "\u0D00" <= char <= "\u0D7F":
+            return "ml"
+        if "\u0A00" <= char <= "\u0A7F":
+            return "pa"
+        if "\u0600" <= char <= "\u06FF":
+            return "ur"
+
+    words = set(re.findall(r'[a-zA-Z]+', text.lower()))
+    if words:
+        hinglish_count = len(words.intersection(hinglish_words))
+        hinglish_ratio = hinglish_count / len(words)
+
+        if hinglish_ratio > 0.2 and hinglish_count >= 2:
+            return "hi-Latn"
+
+    ascii_count = sum(1 for c in text if c.isascii())
+    if ascii_count / max(len(text), 1) > 0.8:
+        return "en"
+
+    return "unknown"
+
+
+# Texts that exercise the other scripts and edge cases
+EXTRA = [
+    "", " ", "123 456", "ਪੰਜਾਬ ਸਰਕਾਰ", "ગુજરાત સરકાર", "ಕರ್ನಾಟಕ ಸರ್ಕಾರ", "കേരള സർക്കാർ",
+    "తెలంగాణ ప్రభుత్వం", "حکومت پاکستان", "Café ñandú résumé", "BJP ka vote 2024 mein",
+    "Good work 👍🔥🔥🔥🔥", "नमस्ते Modi ji", "ok",
+]
+
+
+def _time(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark language detection")
+    parser.add_argument("--n", type=int, default=100000, help="Corpus size")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs; the best is reported")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    from nlp.translator import TranslatorService
+    translator = TranslatorService(use_cache=False)
+
+    texts = [item["text"] for item in generate_corpus(args.n, seed=args.seed)] + EXTRA
+    words = translator.hinglish_words
+
+    legacy_seconds, legacy = _time(lambda: [legacy_detect_language(t, words) for t in texts], args.repeat)
+    batch_seconds, batch = _time(lambda: translator.detect_languages(texts), args.repeat)
+
+    mismatches = [(t, a, b) for t, a, b in zip(texts, legacy, batch) if a != b]
+
+    print("=" * 55)
+    print("  LANGUAGE DETECTION BENCHMARK")
+    print("=" * 55)
+    print(f"  Texts:             {len(texts)}")
+    print(f"  Legacy loop:       {legacy_seconds:.3f}s ({len(texts) / legacy_seconds:,.0f} texts/s)")
+    print(f"  detect_languages:  {batch_seconds:.3f}s ({len(texts) / batch_seconds:,.0f} texts/s)")
+    print(f"  Speedup:           {legacy_seconds / batch_seconds:.1f}x")
+    print(f"  Label mismatches:  {len(mismatches)}")
+    for text, old, new in mismatches[:10]:
+        print(f"    {old!r} -> {new!r}: {text[:60]!r}")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+# scripts/bench_sentiment.py
+"""
+Sentiment inference benchmark on a synthetic multilingual corpus.
+Measures texts/sec, p50/p95 latency and peak RSS for analyze() vs
+analyze_batch() across batch sizes and backends (torch, onnx, onnx-int8).
+
+Each backend runs in its own process so peak RSS is not shared between
+runs. Models must already be downloaded; the Hub is not contacted unless
+--online is given. The result cache and cascade are disabled so every
+text hits the model.
+
+Run from project root:
+    python scripts/bench_sentiment.py
+    python scripts/bench_sentiment.py --backends torch,onnx-int8 --batch-sizes 8,32 --n 1000
+    python scripts/bench_sentiment.py --output bench.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_corpus import generate_corpus
+
+# backend name -> config overrides, applied before config.py is imported
+BACKENDS = {
+    "torch": {"SENTIMENT_BACKEND": "torch"},
+    "onnx": {"SENTIMENT_BACKEND": "onnx", "SENTIMENT_ONNX_QUANTIZE": "false"},
+    "onnx-int8": {"SENTIMENT_BACKEND": "onnx", "SENTIMENT_ONNX_QUANTIZE": "true"},
+}
+
+
+def _percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KiB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _summarize(mode, batch_size, n_texts, latencies, elapsed):
+    return {
+        "mode": mode,
+        "batch_size": batch_size,
+        "texts": n_texts,
+        "seconds": round(elapsed, 3),
+        "texts_per_sec": round(n_texts / elapsed, 1) if elapsed else None,
+        "latency_p50_ms": round(_percentile(latencies, 50) * 1000, 2),
+        "latency_p95_ms": round(_percentile(latencies, 95) * 1000, 2),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _bench_backend(name, corpus, batch_sizes, single_n, num_threads, bucketing):
+    """Runs in a fresh process: load one backend and time it"""
+    os.environ.update(BACKENDS[name])
+    os.environ["SENTIMENT_CACHE"] = "false"
+    os.environ["SENTIMENT_CASCADE"] = "false"
+    if num_threads:
+        for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+            os.environ[var] = str(num_threads)
+        try:
+            import torch
+            torch.set_num_threads(num_threads)
+        except Exception:
+            pass
+
+    from nlp.sentiment import SentimentAnalyzer
+
+    load_start = time.perf_counter()
+    analyzer = SentimentAnalyzer(use_cache=False, cascade=False, num_threads=num_threads or None)
+    load_seconds = time.perf_counter() - load_start
+    analyzer.warmup()
+
+    texts = [item["text"] for item in corpus]
+    languages = [item["language"] for item in corpus]
+    runs = []
+
+    # analyze(): one request per text
+    latencies = []
+    start = time.perf_counter()
+    for text, language in zip(texts[:single_n], languages[:single_n]):
+        t0 = time.perf_counter()
+        analyzer.analyze(text, language=language)
+        latencies.append(time.perf_counter() - t0)
+    runs.append(_summarize("analyze", 1, len(latencies), latencies, time.perf_counter() - start))
+
+    # analyze_batch(): latency is per batch call
+    for batch_size in batch_sizes:
+        latencies = []
+        start = time.perf_counter()
+        for i in range(0, len(texts), batch_size):
+            t0 = time.perf_counter()
+            analyzer.analyze_batch(
+                texts[i:i + batch_size], batch_size=batch_size,
+                languages=languages[i:i + batch_size], bucket_by_length=bucketing
+            )
+            latencies.append(time.perf_counter() - t0)
+        runs.append(_summarize("analyze_batch", batch_size, len(texts), latencies,
+                               time.perf_counter() - start))
+
+    return {
+        "backend": name,
+        "effective_backend": analyzer.backend,
+        "model_id": analyzer.model_id,
+        "load_seconds": round(load_seconds, 2),
+        "runs": runs,
+    }
+
+
+def _environment():
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+    for module in ("torch", "transformers", "onnxruntime"):
+        try:
+            info[module] = __import__(module).__version__
+        except Exception:
+            info[module] = None
+    return info
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sentiment inference")
+    parser.add_argument("--backends", default="torch,onnx,onnx-int8",
+                        help=f"Comma-separated, from: {', '.join(BACKENDS)}")
+    parser.add_argument("--batch-sizes", default="1,8,32,64", help="Comma-separated analyze_batch sizes")
+    parser.add_argument("--n", type=int, default=512, help="Corpus size")
+    parser.add_argument("--single-n", type=int, default=100, help="Texts timed through analyze()")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--threads", type=int, default=0, help="Pin torch / OpenMP threads (0 = library default)")
+    parser.add_argument("--no-bucketing", action="store_true", help="Fixed-size batches instead of length buckets")
+    parser.add_argument("--online", action="store_true", help="Allow downloading models from the Hub")
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    unknown = [b for b in backends if b not in BACKENDS]
+    if unknown:
+        parser.error(f"Unknown backend(s): {', '.join(unknown)}")
+    batch_sizes = [int(b) for b in args.batch_sizes.split(",") if b.strip()]
+
+    if not args.online:
+        os.environ["HF_HUB_OFFLINE"] = "1"
+        os.environ["TRANSFORMERS_OFFLINE"] = "1"
+
+    corpus = generate_corpus(args.n, seed=args.seed)
+    mix = {}
+    for item in corpus:
+        mix[item["language"]] = mix.get(item["language"], 0) + 1
+
+    print("=" * 55)
+    print("  SENTIMENT INFERENCE BENCHMARK")
+    print("=" * 55)
+    print(f"  Corpus: {len(corpus)} texts (seed {args.seed}) {mix}")
+    print(f"  Avg length: {statistics.mean(len(item['text']) for item in corpus):.0f} chars")
+
+    report = {
+        "environment": _environment(),
+        "corpus": {"n": len(corpus), "seed": args.seed, "languages": mix},
+        "settings": {
+            "batch_sizes": batch_sizes,
+            "single_n": args.single_n,
+            "threads": args.threads or None,
+            "bucketing": not args.no_bucketing,
+        },
+        "results": [],
+    }
+
+    context = multiprocessing.get_context("spawn")
+    for name in backends:
+        print(f"\n  --- {name} ---")
+        try:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(
+                    _bench_backend, name, corpus, batch_sizes, args.single_n,
+                    args.threads, not args.no_bucketing
+                ).result()
+        except Exception as e:
+            print(f"  {name} failed: {e}")
+            report["results"].append({"backend": name, "error": str(e)})
+            continue
+
+        report["results"].append(result)
+        if result["effective_backend"] != BACKENDS[name]["SENTIMENT_BACKEND"]:
+            print(f"  Note: {name} fell back to {result['effective_backend']}")
+        print(f"  {'mode':<14}{'batch':>6}{'texts/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'RSS MB':>9}")
+        for run in result["runs"]:
+            print(f"  {run['mode']:<14}{run['batch_size']:>6}{run['texts_per_sec']:>10}"
+                  f"{run['latency_p50_ms']:>10}{run['latency_p95_ms']:>10}{run['peak_rss_mb']:>9}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n  Results written to {args.output}")
+    else:
+        print()
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()